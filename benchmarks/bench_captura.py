@@ -0,0 +1,72 @@
+# benchmarks/bench_captura.py
+# Captura de quadros (`src/app/captura.py`): tempo do loop por quadro gravando
+# a cena em PNG e em vídeo .y4m, comparando a gravação síncrona (glReadPixels
+# direto + codificação na thread principal, como era o `salvar` do headless)
+# com a leitura por PBOs e a codificação no pool de threads.
+#
+# Uso (software renderer do Mesa, sem janela):
+#   PYOPENGL_PLATFORM=egl EGL_PLATFORM=surfaceless SDL_VIDEODRIVER=dummy \
+#       python benchmarks/bench_captura.py
+
+import os
+import tempfile
+import time
+
+from contexto import criar_contexto  # noqa: F401 (ajusta o sys.path)
+
+from src.app.headless import RenderizadorHeadless
+from src.app.captura import CapturaQuadros, codificar_png, rgb_para_yuv444
+
+LARGURA, ALTURA = 1280, 720
+QUADROS = 60
+
+def sincrono(renderizador, destino):
+    """Lê o FBO e codifica cada quadro antes de desenhar o próximo."""
+    video = open(destino, 'wb') if destino.endswith('.y4m') else None
+    if video:
+        video.write(f"YUV4MPEG2 W{LARGURA} H{ALTURA} F60:1 Ip A1:1 C444\n".encode())
+    else:
+        os.makedirs(destino, exist_ok=True)
+    for n, imagem in enumerate(renderizador.quadros(QUADROS, inicio=0, fim=60)):
+        if video:
+            video.write(b'FRAME\n' + rgb_para_yuv444(imagem).tobytes())
+        else:
+            with open(os.path.join(destino, f"quadro_{n:05d}.png"), 'wb') as arquivo:
+                arquivo.write(codificar_png(imagem))
+    if video:
+        video.close()
+
+def assincrono(renderizador, destino):
+    renderizador.salvar(destino, QUADROS, inicio=0, fim=60)
+
+def apenas_renderizar(renderizador):
+    for _ in renderizador._passos(QUADROS, inicio=0, fim=60):
+        renderizador._desenhar()
+
+if __name__ == "__main__":
+    renderizador = RenderizadorHeadless(LARGURA, ALTURA)
+    with tempfile.TemporaryDirectory() as pasta:
+        inicio = time.perf_counter()
+        apenas_renderizar(renderizador)
+        base = (time.perf_counter() - inicio) / QUADROS * 1000.0
+        print(f"{LARGURA}x{ALTURA}, {QUADROS} quadros   só renderizar: {base:7.1f} ms/quadro")
+
+        for nome, arquivo in (("PNG", "png"), ("y4m", "voo.y4m")):
+            for modo, funcao in (("síncrono", sincrono), ("PBO + threads", assincrono)):
+                destino = os.path.join(pasta, f"{modo}_{arquivo}".replace(' ', ''))
+                inicio = time.perf_counter()
+                funcao(renderizador, destino)
+                ms = (time.perf_counter() - inicio) / QUADROS * 1000.0
+                print(f"  {nome:<4} {modo:<14} {ms:7.1f} ms/quadro   (+{ms - base:.1f} ms da captura)")
+
+        # Janela: com a fila cheia o quadro é descartado em vez de esperar
+        captura = CapturaQuadros(os.path.join(pasta, "janela"), descartar=True)
+        inicio = time.perf_counter()
+        for _ in renderizador._passos(QUADROS, inicio=0, fim=60):
+            renderizador._desenhar()
+            captura.capturar(LARGURA, ALTURA, renderizador.alvo.fbo)
+        ms = (time.perf_counter() - inicio) / QUADROS * 1000.0
+        captura.encerrar()
+        print(f"  PNG  com descarte    {ms:7.1f} ms/quadro   {captura.capturados} gravados,"
+              f" {captura.descartados} descartados")
+    renderizador.encerrar()
@@ -0,0 +1,220 @@
+# benchmarks/bench_cenarios.py
+# Cenários roteirizados do Planetário completo, sem teclado: a câmera segue um
+# caminho fixo e o relógio avança exatamente um passo por quadro, então duas
+# execuções desenham a mesma sequência de quadros.
+#
+# Para cada cenário: tempo de quadro (média/mediana/p99), tempo de CPU do
+# processo por quadro e tempo de cada fase. Os resultados podem ser gravados
+# como referência (baseline) e comparados depois; regressões encerram com código 1.
+#
+# Uso:
+#   python benchmarks/bench_cenarios.py                              # só mede
+#   python benchmarks/bench_cenarios.py --salvar benchmarks/baseline.json
+#   python benchmarks/bench_cenarios.py --baseline benchmarks/baseline.json
+#   (sem display: PYOPENGL_PLATFORM=egl EGL_PLATFORM=surfaceless)
+
+import argparse
+import json
+import math
+import sys
+import time
+
+from contexto import criar_contexto
+
+import numpy as np
+from OpenGL.GL import *
+
+from src.config import PASSO_SIMULACAO, WARP_MAX
+from src.app.offscreen import AlvoOffscreen
+from src.app.perfil import Perfilador
+from src.formas.estatisticas import estatisticas
+
+LARGURA, ALTURA = 960, 540
+QUADROS = 240
+AQUECIMENTO = 20
+
+# Variação relativa tolerada antes de acusar regressão (média e p99 do quadro)
+TOLERANCIA = 0.15
+
+FASES = ('atualizar', 'camera', 'renderizar', 'finalizar')
+
+# --- Caminhos de câmera: recebem o Planetário e o progresso s em [0, 1) ---
+
+def visao_geral(p, s):
+    """Sistema inteiro de longe, girando devagar."""
+    cam = p.camera
+    cam.dist = 150.0
+    cam.theta = 1.57 + s * math.pi * 0.5
+    cam.phi = 0.9
+    cam.definir_alvo(0.0, 0.0, 0.0)
+
+def terra_lua(p, s):
+    """Close-up do par Terra-Lua, câmera acompanhando a Terra."""
+    p.corpos.atualizar(p.angle)   # posição da Terra no tempo deste quadro
+    terra = p.corpos.posicoes()[p.corpos.indice('earth')]
+    cam = p.camera
+    cam.dist = 6.0
+    cam.theta = s * 2.0 * math.pi
+    cam.phi = 1.2
+    cam.definir_alvo(*terra)
+
+def varredura_orbitas(p, s):
+    """Volta completa e rápida ao redor do sistema, com as linhas de órbita ligadas."""
+    p.mostrar_orbitas = True
+    cam = p.camera
+    cam.dist = 45.0 + 25.0 * math.sin(s * 2.0 * math.pi)
+    cam.theta = s * 4.0 * math.pi
+    cam.phi = 0.6 + 0.8 * s
+    cam.definir_alvo(0.0, 0.0, 0.0)
+
+def warp_maximo(p, s):
+    """Visão de abertura com o tempo na aceleração máxima."""
+    p.relogio.definir_warp(WARP_MAX)
+    cam = p.camera
+    cam.dist = 60.0
+    cam.theta = 1.57
+    cam.phi = 1.0
+    cam.definir_alvo(0.0, 0.0, 0.0)
+
+CENARIOS = {
+    'visao_geral': visao_geral,
+    'terra_lua': terra_lua,
+    'varredura_orbitas': varredura_orbitas,
+    'warp_maximo': warp_maximo,
+}
+
+def _estatisticas(valores_ms):
+    return {
+        'media': float(np.mean(valores_ms)),
+        'mediana': float(np.median(valores_ms)),
+        'p99': float(np.percentile(valores_ms, 99)),
+    }
+
+def executar_cenario(planetario, caminho, quadros, aquecimento):
+    """Roda o cenário a partir do tempo 0 e devolve o resumo em ms."""
+    planetario.relogio.definir_warp(1.0)
+    planetario.definir_tempo(0.0)
+    planetario.mostrar_orbitas = True
+    planetario.mostrar_cinturao = True
+
+    perfil = Perfilador(fases=FASES, capacidade=quadros)
+    cpu_ns = np.zeros(quadros, dtype=np.int64)
+    largura, altura = planetario.camera.viewport
+
+    for n in range(aquecimento + quadros):
+        medir = n >= aquecimento
+        perfil.ativo = medir
+        cpu_inicio = time.process_time_ns()
+        perfil.iniciar_quadro()
+
+        # Relógio fixo: exatamente um passo de simulação por quadro
+        planetario.atualizar(PASSO_SIMULACAO)
+        # O cinturão só calcula as posições quando lidas; lê aqui para o custo contar
+        # em 'atualizar' (e não em 'renderizar'), como nas referências gravadas
+        planetario.cinturao.posicoes
+        perfil.marcar('atualizar')
+
+        caminho(planetario, (n - aquecimento) / quadros if medir else 0.0)
+        planetario.config_camera_projecao(largura, altura)
+        perfil.marcar('camera')
+
+        planetario.renderizar()
+        perfil.marcar('renderizar')
+
+        # Espera a GPU terminar: o quadro só conta quando está pronto
+        glFinish()
+        perfil.marcar('finalizar')
+        perfil.fechar_quadro(estatisticas)
+
+        if medir:
+            cpu_ns[n - aquecimento] = time.process_time_ns() - cpu_inicio
+
+    tempos, contagens = perfil.registrados()
+    ms = tempos / 1e6
+    return {
+        'quadro_ms': _estatisticas(ms.sum(axis=1)),
+        'cpu_ms': _estatisticas(cpu_ns / 1e6),
+        'fases_ms': {fase: _estatisticas(ms[:, i]) for i, fase in enumerate(FASES)},
+        'chamadas_desenho': float(contagens[:, 0].mean()),
+        'triangulos': float(contagens[:, 2].mean()),
+    }
+
+def comparar(resultados, baseline, tolerancia):
+    """Lista de regressões (texto) em relação à referência."""
+    regressoes = []
+    for nome, atual in resultados['cenarios'].items():
+        referencia = baseline.get('cenarios', {}).get(nome)
+        if referencia is None:
+            continue
+        for metrica in ('media', 'p99'):
+            antes = referencia['quadro_ms'][metrica]
+            depois = atual['quadro_ms'][metrica]
+            if antes > 0 and depois > antes * (1.0 + tolerancia):
+                regressoes.append(f"{nome}: quadro {metrica} {antes:.2f} -> {depois:.2f} ms "
+                                  f"({(depois / antes - 1.0) * 100:+.0f}%)")
+    return regressoes
+
+def _argumentos():
+    parser = argparse.ArgumentParser(description="Cenários roteirizados do Planetário")
+    parser.add_argument("--largura", type=int, default=LARGURA)
+    parser.add_argument("--altura", type=int, default=ALTURA)
+    parser.add_argument("--quadros", type=int, default=QUADROS, help="quadros medidos por cenário")
+    parser.add_argument("--aquecimento", type=int, default=AQUECIMENTO, help="quadros descartados no início")
+    parser.add_argument("--cenarios", nargs="+", choices=list(CENARIOS), default=list(CENARIOS))
+    parser.add_argument("--baseline", help="JSON de referência para comparar")
+    parser.add_argument("--tolerancia", type=float, default=TOLERANCIA,
+                        help="piora relativa aceita na média e no p99 do quadro")
+    parser.add_argument("--salvar", help="grava os resultados neste JSON (para usar como referência)")
+    return parser.parse_args()
+
+if __name__ == "__main__":
+    args = _argumentos()
+
+    criar_contexto(args.largura, args.altura)
+    from src.app.planetario import Planetario
+
+    alvo = AlvoOffscreen(args.largura, args.altura)
+    alvo.ativar()
+    planetario = Planetario()
+    planetario.texturas.concluir()
+    planetario.config_camera_projecao(args.largura, args.altura)
+
+    renderer = glGetString(GL_RENDERER).decode()
+    print("Renderer:", renderer)
+    resultados = {
+        'renderer': renderer,
+        'resolucao': [args.largura, args.altura],
+        'quadros': args.quadros,
+        'cenarios': {},
+    }
+
+    print(f"{'cenário':<18} {'média':>7} {'mediana':>8} {'p99':>7} {'CPU':>7}   "
+          + " ".join(f"{f:>10}" for f in FASES) + "   (ms)")
+    for nome in args.cenarios:
+        r = executar_cenario(planetario, CENARIOS[nome], args.quadros, args.aquecimento)
+        resultados['cenarios'][nome] = r
+        q = r['quadro_ms']
+        print(f"{nome:<18} {q['media']:>7.2f} {q['mediana']:>8.2f} {q['p99']:>7.2f} "
+              f"{r['cpu_ms']['media']:>7.2f}   "
+              + " ".join(f"{r['fases_ms'][f]['media']:>10.2f}" for f in FASES))
+
+    planetario.texturas.encerrar()
+    alvo.liberar()
+
+    if args.salvar:
+        with open(args.salvar, "w") as arquivo:
+            json.dump(resultados, arquivo, indent=2)
+        print(f"Resultados gravados em {args.salvar}")
+
+    if args.baseline:
+        with open(args.baseline) as arquivo:
+            baseline = json.load(arquivo)
+        if baseline.get('resolucao') != resultados['resolucao']:
+            print(f"Aviso: referência medida em {baseline.get('resolucao')}, atual em {resultados['resolucao']}")
+        regressoes = comparar(resultados, baseline, args.tolerancia)
+        if regressoes:
+            print(f"REGRESSÕES (tolerância {args.tolerancia:.0%}):")
+            for linha in regressoes:
+                print("  " + linha)
+            sys.exit(1)
+        print(f"Sem regressões em relação a {args.baseline} (tolerância {args.tolerancia:.0%})")
@@ -0,0 +1,68 @@
+# benchmarks/bench_cinturao.py
+# Tempo de quadro do cinturão de asteroides em função da quantidade de partículas:
+# atualização vetorizada (Kepler), envio ao VBO (orphaning) e desenho.
+#
+# Uso:
+#   python benchmarks/bench_cinturao.py
+#   (sem display: PYOPENGL_PLATFORM=egl EGL_PLATFORM=surfaceless)
+
+import time
+
+from contexto import criar_contexto
+
+import numpy as np
+from OpenGL.GL import *
+
+from src.app.cinturao import CinturaoAsteroides
+from src.formas.estado_gl import estado_gl
+
+QUANTIDADES = [50_000, 100_000, 200_000, 500_000]
+QUADROS = 30
+LARGURA, ALTURA = 800, 600
+
+def configurar_camera():
+    """Visão de cima do cinturão, como na abertura do Planetário."""
+    from OpenGL.GLU import gluPerspective, gluLookAt
+    glViewport(0, 0, LARGURA, ALTURA)
+    glMatrixMode(GL_PROJECTION)
+    glLoadIdentity()
+    gluPerspective(45.0, LARGURA / ALTURA, 1.0, 1000.0)
+    glMatrixMode(GL_MODELVIEW)
+    glLoadIdentity()
+    gluLookAt(0.0, 32.0, 50.0, 0.0, 0.0, 0.0, 0.0, 1.0, 0.0)
+    estado_gl.habilitar(GL_DEPTH_TEST)
+
+if __name__ == "__main__":
+    criar_contexto(LARGURA, ALTURA)
+    configurar_camera()
+    print("Renderer:", glGetString(GL_RENDERER).decode())
+    print(f"{'partículas':>10s} {'atualizar':>10s} {'enviar':>8s} {'desenhar':>9s} {'quadro':>8s}  (ms, mediana)")
+
+    for n in QUANTIDADES:
+        cinturao = CinturaoAsteroides(n)
+        cinturao.desenhar()
+        glFinish()
+
+        t_atualizar, t_enviar, t_desenhar, t_quadro = [], [], [], []
+        for quadro in range(QUADROS):
+            inicio = time.perf_counter()
+            cinturao.atualizar(quadro * 0.5)
+            # As posições são calculadas na leitura: o Kepler conta na atualização, não no envio
+            cinturao.posicoes
+            t1 = time.perf_counter()
+            cinturao.enviar()
+            t2 = time.perf_counter()
+            glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+            cinturao.desenhar()
+            glFinish()
+            t3 = time.perf_counter()
+
+            t_atualizar.append(t1 - inicio)
+            t_enviar.append(t2 - t1)
+            t_desenhar.append(t3 - t2)
+            t_quadro.append(t3 - inicio)
+
+        cinturao.liberar()
+        mediana = lambda v: np.median(v) * 1000.0
+        print(f"{n:>10d} {mediana(t_atualizar):>10.2f} {mediana(t_enviar):>8.2f} "
+              f"{mediana(t_desenhar):>9.2f} {mediana(t_quadro):>8.2f}")
@@ -0,0 +1,88 @@
+# benchmarks/bench_gravidade.py
+# Física de N corpos (`src/app/gravidade.py`). Não precisa de contexto OpenGL.
+#   1. Tempo de uma avaliação de forças: soma direta x octree de Barnes-Hut,
+#      com o erro da octree em relação à soma exata, com e sem suavização
+#      (escolha de LIMITE_BARNES_HUT e THETA).
+#   2. Sistema Solar com partículas de teste: custo por passo conforme o número de partículas.
+#   3. Deriva de energia do Sistema Solar em um ano para diferentes passos (escolha de PASSO_FISICA_DIAS).
+#
+# Uso: python benchmarks/bench_gravidade.py
+
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+import numpy as np
+
+from src.app.efemerides import Efemerides, JD_J2000
+from src.app.gravidade import (ArvoreOctal, SistemaGravitacional, GM_SOL, campo_direto,
+                               estado_efemerides, estado_kepleriano)
+
+FONTES = [1_000, 4_000, 16_000]
+THETAS = [0.3, 0.5, 0.8]
+PARTICULAS = [0, 1_000, 10_000, 50_000]
+PASSOS_DIAS = [0.4, 0.2, 0.1, 0.05]
+REPETICOES = 20
+
+def aglomerado(n, semente=42):
+    """Fontes de massa igual com densidade concentrada no centro."""
+    rng = np.random.default_rng(semente)
+    posicoes = rng.normal(size=(n, 3)) * rng.uniform(0.2, 1.0, (n, 1))
+    return posicoes, np.full(n, 1.0 / n)
+
+def sistema_solar(particulas, semente=42):
+    """Sol, planetas e Lua em J2000 mais `particulas` partículas de teste no cinturão."""
+    efemerides = Efemerides()
+    posicoes, velocidades, mu = estado_efemerides(efemerides, JD_J2000, efemerides.nomes)
+    if particulas:
+        rng = np.random.default_rng(semente)
+        p, v = estado_kepleriano(rng.uniform(2.1, 3.3, particulas), rng.uniform(0.0, 0.08, particulas),
+                                 np.abs(rng.normal(0.0, 0.04, particulas)),
+                                 rng.uniform(0.0, 2 * np.pi, particulas), rng.uniform(0.0, 2 * np.pi, particulas),
+                                 rng.uniform(0.0, 2 * np.pi, particulas), GM_SOL)
+        posicoes = np.concatenate([posicoes, p + posicoes[0]])
+        velocidades = np.concatenate([velocidades, v + velocidades[0]])
+        mu = np.concatenate([mu, np.zeros(particulas)])
+    return SistemaGravitacional(posicoes, velocidades, mu)
+
+def medir(funcao, repeticoes):
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000.0
+
+if __name__ == "__main__":
+    print("Forças entre N fontes (alvos = fontes), suavização 0.01 e sem suavização")
+    for n in FONTES:
+        posicoes, mu = aglomerado(n)
+        repeticoes = max(1, REPETICOES * 1_000 // n)
+        direta_ms = medir(lambda: campo_direto(posicoes, posicoes, mu, 1e-4), repeticoes)
+        print(f"{n:>8d} fontes  direta {direta_ms:9.1f} ms")
+        for theta in THETAS:
+            arvore_ms = medir(lambda: ArvoreOctal(posicoes, mu).campo(posicoes, theta, 1e-4), repeticoes)
+            erros = []
+            # Sem suavização, a própria fonte precisa ficar de fora (distância exatamente zero)
+            for suavizacao2 in (1e-4, 0.0):
+                exata = campo_direto(posicoes, posicoes, mu, suavizacao2)[0]
+                aproximada = ArvoreOctal(posicoes, mu).campo(posicoes, theta, suavizacao2)[0]
+                erro = np.linalg.norm(aproximada - exata, axis=1) / np.linalg.norm(exata, axis=1)
+                erros.append(f"mediana {np.median(erro):.1e} p99 {np.percentile(erro, 99):.1e} máx {erro.max():.1e}")
+            print(f"{'':>16}  octree θ={theta:.1f} {arvore_ms:8.1f} ms   erro {erros[0]}   (sem suavização: {erros[1]})")
+
+    print("\nSistema Solar + partículas de teste (um passo de leapfrog)")
+    for k in PARTICULAS:
+        sistema = sistema_solar(k)
+        sistema.passo(0.1)   # aquecimento (primeira aceleração)
+        print(f"{k:>8d} partículas  {medir(lambda: sistema.passo(0.1), REPETICOES):7.2f} ms/passo"
+              f"   ({sistema.metodo})")
+
+    print("\nDeriva de energia do Sistema Solar em 1 ano")
+    for dt in PASSOS_DIAS:
+        sistema = sistema_solar(0)
+        passos = int(round(365.25 / dt))
+        inicio = time.perf_counter()
+        sistema.avancar(dt, passos)
+        total = time.perf_counter() - inicio
+        print(f"  passo {dt:5.2f} dias  {passos:>6d} passos  {total:6.2f} s   |ΔE/E| {sistema.deriva_energia():.1e}")
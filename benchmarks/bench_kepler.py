@@ -0,0 +1,48 @@
+# benchmarks/bench_kepler.py
+# Mede o tempo de `MotorOrbital.posicoes` (Equação de Kepler vetorizada)
+# para diferentes quantidades de corpos. Não precisa de contexto OpenGL.
+#
+# Uso: python benchmarks/bench_kepler.py
+
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+import numpy as np
+
+from src.app.kepler import MotorOrbital
+
+QUANTIDADES = [1_000, 10_000, 50_000, 100_000]
+REPETICOES = 200
+
+def criar_motor(n, semente=42):
+    """Órbitas aleatórias no estilo de um cinturão de asteroides."""
+    rng = np.random.default_rng(semente)
+    motor = MotorOrbital()
+    motor.adicionar(
+        a=rng.uniform(13.5, 16.5, n),
+        e=rng.uniform(0.0, 0.3, n),
+        i=rng.uniform(0.0, 0.3, n),
+        raan=rng.uniform(0.0, 2 * np.pi, n),
+        argp=rng.uniform(0.0, 2 * np.pi, n),
+        m0=rng.uniform(0.0, 2 * np.pi, n),
+        periodo=rng.uniform(500.0, 900.0, n),
+    )
+    return motor
+
+if __name__ == "__main__":
+    for n in QUANTIDADES:
+        motor = criar_motor(n)
+        motor.posicoes(0.0)   # aquecimento
+
+        tempos = []
+        for quadro in range(REPETICOES):
+            inicio = time.perf_counter()
+            motor.posicoes(quadro * 1.7)
+            tempos.append(time.perf_counter() - inicio)
+
+        tempos = np.array(tempos) * 1000.0
+        print(f"{n:>8d} corpos  mediana {np.median(tempos):7.3f} ms   p99 {np.percentile(tempos, 99):7.3f} ms"
+              f"   iterações {motor.iteracoes_usadas}")
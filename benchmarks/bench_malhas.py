@@ -0,0 +1,79 @@
+# benchmarks/bench_malhas.py
+# Micro-benchmark: custo de CPU por quadro das primitivas do Planetário,
+# comparando quádricas GLU recriadas a cada chamada (antes) com o cache
+# de display lists de `src/formas/malhas.py` (depois).
+#
+# Uso (software renderer do Mesa, sem janela):
+#   LIBGL_ALWAYS_SOFTWARE=1 PYOPENGL_PLATFORM=egl EGL_PLATFORM=surfaceless \
+#       python benchmarks/bench_malhas.py
+
+import time
+
+from contexto import criar_contexto
+
+from OpenGL.GL import *
+from OpenGL.GLU import *
+
+# Raios usados por um quadro da cena (Sol, 8 planetas e Lua)
+RAIOS_ESFERAS = [5.0, 0.38, 0.85, 1.0, 0.3, 0.53, 1.85, 1.55, 1.2, 1.38]
+# Órbitas (r, r + largura) + anel de Saturno
+ANEIS = [(6.0, 6.08), (8.0, 8.08), (1.5, 1.55), (10.0, 10.08), (13.0, 13.08),
+         (17.0, 17.08), (23.0, 23.08), (2.0, 2.5), (27.0, 27.08), (33.0, 33.08)]
+
+QUADROS = 100
+
+def quadro_glu_direto():
+    """Reproduz o caminho antigo: nova quádrica e nova tesselação por chamada."""
+    quad = gluNewQuadric()
+    gluQuadricOrientation(quad, GLU_INSIDE)
+    gluSphere(quad, 350.0, 50, 50)
+    gluDeleteQuadric(quad)
+
+    for raio in RAIOS_ESFERAS:
+        quad = gluNewQuadric()
+        gluQuadricTexture(quad, GL_TRUE)
+        gluSphere(quad, raio, 50, 50)
+        gluDeleteQuadric(quad)
+
+    for interno, externo in ANEIS:
+        quad = gluNewQuadric()
+        glPushMatrix()
+        glRotatef(90.0, 1.0, 0.0, 0.0)
+        gluDisk(quad, interno, externo, 50, 1)
+        glPopMatrix()
+        gluDeleteQuadric(quad)
+
+def quadro_cache():
+    """Caminho novo: funções de `primitivas.py` servidas pelo cache de malhas."""
+    from src.formas.primitivas import desenhar_esfera, desenhar_anel, desenhar_esfera_interna
+
+    desenhar_esfera_interna(350.0, None)
+    for raio in RAIOS_ESFERAS:
+        desenhar_esfera(raio, None)
+    for interno, externo in ANEIS:
+        desenhar_anel(interno, externo, None)
+
+def medir(funcao):
+    """Retorna (ms de CPU por quadro, ms de parede por quadro)."""
+    funcao()   # aquecimento (no cache, constrói as listas)
+    glFinish()
+
+    cpu0, parede0 = time.process_time(), time.perf_counter()
+    for _ in range(QUADROS):
+        funcao()
+    glFinish()
+    cpu = (time.process_time() - cpu0) / QUADROS * 1000.0
+    parede = (time.perf_counter() - parede0) / QUADROS * 1000.0
+    return cpu, parede
+
+if __name__ == "__main__":
+    # Superfície minúscula: isola o custo de CPU de tesselação/envio de
+    # vértices do custo de preenchimento (rasterização) do llvmpipe.
+    criar_contexto(8, 8)
+    from src.formas.estado_gl import estado_gl
+    estado_gl.habilitar(GL_RESCALE_NORMAL)
+    print("Renderer:", glGetString(GL_RENDERER).decode())
+
+    for nome, funcao in (("GLU direto", quadro_glu_direto), ("Cache de malhas", quadro_cache)):
+        cpu, parede = medir(funcao)
+        print(f"{nome:16s}  CPU {cpu:7.3f} ms/quadro   parede {parede:7.3f} ms/quadro")
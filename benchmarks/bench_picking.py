@@ -0,0 +1,104 @@
+# benchmarks/bench_picking.py
+# Mede o picking por raio: teste vetorizado contra N esferas e, para
+# cinturões, construção e consulta da grade espacial comparadas com o teste
+# de todas as partículas, e se a grade do cinturão acompanha o movimento
+# das partículas. Não precisa de contexto OpenGL.
+#
+# Uso: python benchmarks/bench_picking.py
+
+import os
+import sys
+import time
+
+sys.path.append(os.getcwd())
+
+import numpy as np
+
+from src.app.camera import Camera
+from src.app.cinturao import CinturaoAsteroides
+from src.app.picking import (raio_do_pixel, tangente_pixels, esfera_atingida,
+                             ponto_atingido, GradeEspacial)
+from bench_kepler import criar_motor
+
+ESFERAS = [100, 1_000, 10_000, 100_000]
+PARTICULAS = [50_000, 200_000, 500_000]
+REPETICOES = 200
+LARGURA, ALTURA = 1280, 720
+
+def medir(funcao, repeticoes=REPETICOES):
+    """Mediana e p99 (ms) de `funcao()`."""
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    tempos = np.array(tempos) * 1000.0
+    return np.median(tempos), np.percentile(tempos, 99)
+
+def cliques(camera, n, semente=3):
+    """Raios por pixels aleatórios da tela."""
+    rng = np.random.default_rng(semente)
+    return [raio_do_pixel(camera, x, y) for x, y in
+            zip(rng.uniform(0, LARGURA, n), rng.uniform(0, ALTURA, n))]
+
+if __name__ == "__main__":
+    camera = Camera(dist=60.0, theta=1.57, phi=1.0)
+    camera.definir_viewport(LARGURA, ALTURA)
+    tangente = tangente_pixels(camera)
+    raios = cliques(camera, REPETICOES)
+
+    print("Esferas (corpos):")
+    rng = np.random.default_rng(11)
+    for n in ESFERAS:
+        centros = rng.uniform(-40.0, 40.0, (n, 3))
+        raios_esferas = rng.uniform(0.05, 1.0, n)
+        k = iter(raios * 2)
+        mediana, p99 = medir(lambda: esfera_atingida(*next(k), centros, raios_esferas, tangente))
+        print(f"{n:>8d} esferas   mediana {mediana:7.3f} ms   p99 {p99:7.3f} ms")
+
+    print("Cinturão (partículas):")
+    grade = GradeEspacial()
+    for n in PARTICULAS:
+        pontos = criar_motor(n).posicoes(0.0)
+
+        construir_mediana, _ = medir(lambda: grade.construir(pontos), repeticoes=20)
+        k = iter(raios * 2)
+        grade_mediana, grade_p99 = medir(lambda: ponto_atingido(
+            *(r := next(k)), pontos, tangente, grade.candidatos(*r, tangente)))
+        k = iter(raios * 2)
+        todos_mediana, todos_p99 = medir(lambda: ponto_atingido(*next(k), pontos, tangente), repeticoes=50)
+
+        # Os dois caminhos precisam concordar
+        for origem, direcao in raios[:50]:
+            assert (ponto_atingido(origem, direcao, pontos, tangente, grade.candidatos(origem, direcao, tangente))
+                    == ponto_atingido(origem, direcao, pontos, tangente))
+
+        print(f"{n:>8d} partículas   construir {construir_mediana:7.3f} ms   "
+              f"grade {grade_mediana:7.3f} ms (p99 {grade_p99:6.3f})   "
+              f"todas {todos_mediana:7.3f} ms (p99 {todos_p99:6.3f})")
+
+    # Cliques com o cinturão parado e andando (o tempo avança entre os cliques)
+    print("Cinturão (CinturaoAsteroides.selecionar, grade x todas as partículas):")
+    for n in PARTICULAS:
+        cinturao = CinturaoAsteroides(n)
+        for nome, passo in (("parado", 0.0), ("andando", 0.5)):
+            cinturao.atualizar(0.0)
+            cinturao.posicoes
+            k = iter(raios * 2)
+            tempo = [0.0]
+
+            def clique():
+                tempo[0] += passo
+                cinturao.atualizar(tempo[0])
+                posicoes = cinturao.posicoes   # (o Kepler não entra na medição do clique)
+                origem, direcao = next(k)
+                inicio = time.perf_counter()
+                escolhido = cinturao.selecionar(origem, direcao, tangente)
+                duracao = time.perf_counter() - inicio
+                # A escolha precisa ser a mesma do teste de todas as partículas
+                assert escolhido == ponto_atingido(origem, direcao, posicoes, tangente), (nome, tempo[0])
+                return duracao
+
+            tempos = np.array([clique() for _ in range(50)]) * 1000.0
+            print(f"{n:>8d} partículas   {nome:<8} mediana {np.median(tempos):7.3f} ms   "
+                  f"p99 {np.percentile(tempos, 99):7.3f} ms   (grade versão {cinturao.indice.versao})")
@@ -0,0 +1,11 @@
+# benchmarks/contexto.py
+# Cria um contexto OpenGL sem janela visível para os benchmarks.
+# A implementação fica em `src/app/offscreen.py` (também usada por `main.py --headless`).
+
+import os
+import sys
+
+# Permite rodar `python benchmarks/xxx.py` a partir da raiz do projeto
+sys.path.append(os.getcwd())
+
+from src.app.offscreen import criar_contexto
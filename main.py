@@ -1,17 +1,126 @@
 # main.py
 # Ponto de entrada da aplicação.
+#
+#   python main.py                      -> janela interativa
+#   python main.py --headless [opções]  -> renderiza quadros fora da tela (sem janela)
+#   python main.py --gravar sessao.grav -> janela interativa, gravando a entrada
+#   python main.py --reproduzir sessao.grav [--rapido] -> repete a sessão gravada
+#   python main.py --saida voo.y4m      -> grava os quadros da janela (ou do headless) em vídeo/PNG
 
 import sys
 import os
+import argparse
+import time
 
 # Garante que imports funcionem
 sys.path.append(os.getcwd())
 
-from src.app.game import Jogo
+def _data(texto):
+    """Converte AAAA-MM-DD[THH:MM[:SS]] (UTC) para `datetime`."""
+    from datetime import datetime
+    try:
+        return datetime.fromisoformat(texto)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"data inválida: {texto!r} (use AAAA-MM-DD ou AAAA-MM-DDTHH:MM)")
+
+def _argumentos():
+    parser = argparse.ArgumentParser(description="Simulador do Sistema Solar")
+    parser.add_argument("--headless", action="store_true",
+                        help="renderiza sem janela (EGL ou janela oculta + FBO), sem limite de FPS")
+    parser.add_argument("--largura", type=int, default=1280, help="largura dos quadros (headless)")
+    parser.add_argument("--altura", type=int, default=720, help="altura dos quadros (headless)")
+    parser.add_argument("--quadros", type=int, default=60, help="quantidade de quadros (headless)")
+    parser.add_argument("--inicio", type=float, default=None,
+                        help="tempo de simulação do primeiro quadro (com --fim: intervalo)")
+    parser.add_argument("--fim", type=float, default=None, help="tempo de simulação do último quadro")
+    parser.add_argument("--warp", type=float, default=1.0, help="aceleração do tempo (headless)")
+    parser.add_argument("--saida", default=None,
+                        help="grava os quadros: pasta (sequência PNG) ou arquivo .y4m (vídeo); janela ou headless")
+    parser.add_argument("--data", type=_data, default=None,
+                        help="mostra as posições reais na data AAAA-MM-DD[THH:MM] (UTC), a partir das efemérides")
+    parser.add_argument("--tempo-real", action="store_true",
+                        help="posições reais de agora, avançando em tempo real (janela)")
+    parser.add_argument("--processo", action="store_true",
+                        help="roda a lógica da simulação em um processo separado (janela)")
+    parser.add_argument("--gravar", metavar="ARQUIVO", default=None,
+                        help="grava a entrada da sessão (teclas, cliques, tempo de cada quadro) em ARQUIVO")
+    parser.add_argument("--reproduzir", metavar="ARQUIVO", default=None,
+                        help="reproduz uma sessão gravada com --gravar, no ritmo original (janela)")
+    parser.add_argument("--rapido", action="store_true",
+                        help="com --reproduzir: sem janela e sem desenhar, o mais rápido possível")
+    parser.add_argument("--perfil", action="store_true",
+                        help="mede o tempo de cada fase do quadro desde o início (CSV gravado ao sair)")
+    parser.add_argument("--plataforma", choices=["egl", "janela"], default=None,
+                        help="contexto offscreen (padrão: egl sem servidor gráfico, senão janela oculta)")
+    return parser.parse_args()
+
+def _plataforma_padrao():
+    """'egl' quando não há servidor gráfico disponível; 'janela' caso contrário."""
+    if os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY") or os.name == "nt":
+        return "janela"
+    return "egl"
+
+def _executar_headless(args):
+    # A plataforma do PyOpenGL precisa ser definida antes do primeiro import do OpenGL
+    plataforma = args.plataforma or _plataforma_padrao()
+    if plataforma == "egl":
+        os.environ.setdefault("PYOPENGL_PLATFORM", "egl")
+        os.environ.setdefault("EGL_PLATFORM", "surfaceless")
+        os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    from src.app.headless import RenderizadorHeadless
+
+    renderizador = RenderizadorHeadless(args.largura, args.altura)
+    renderizador.planetario.relogio.definir_warp(args.warp)
+    if args.data:
+        renderizador.planetario.definir_data(args.data)
+
+    inicio = time.perf_counter()
+    if args.saida:
+        renderizador.salvar(args.saida, args.quadros, inicio=args.inicio, fim=args.fim)
+        print(f"Quadros gravados em {args.saida}")
+    else:
+        for _ in renderizador.quadros(args.quadros, inicio=args.inicio, fim=args.fim):
+            pass
+    duracao = time.perf_counter() - inicio
+    renderizador.encerrar()
+
+    print(f"{args.quadros} quadros {args.largura}x{args.altura} em {duracao:.2f} s "
+          f"({args.quadros / duracao:.1f} quadros/s)")
+
+def _reproduzir_rapido(args):
+    from src.app.gravacao import reproduzir_rapido
+
+    inicio = time.perf_counter()
+    planetario, reproducao = reproduzir_rapido(args.reproduzir)
+    duracao = time.perf_counter() - inicio
+
+    print(f"{reproducao.quadros} quadros ({reproducao.duracao:.1f} s gravados) reproduzidos em {duracao:.2f} s "
+          f"({reproducao.duracao / max(duracao, 1e-9):.0f}x)")
+    confere = reproducao.confere(planetario)
+    if confere is not None:
+        print("Estado final " + ("confere com a gravação" if confere else "difere da gravação"))
 
 if __name__ == "__main__":
-    # Cria uma instância do jogo
-    app = Jogo()
-    
-    # Inicia o loop principal
-    app.executar()
+    args = _argumentos()
+
+    if args.headless:
+        _executar_headless(args)
+    elif args.reproduzir and args.rapido:
+        _reproduzir_rapido(args)
+    else:
+        from src.app.game import Jogo
+        from src.config import SIMULACAO_EM_PROCESSO
+
+        # Cria uma instância do jogo
+        app = Jogo(perfil=args.perfil, processo=args.processo or SIMULACAO_EM_PROCESSO,
+                   gravar=args.gravar, reproduzir=args.reproduzir, saida=args.saida)
+        # (com --reproduzir, o estado inicial vem da gravação)
+        if args.reproduzir is None:
+            if args.tempo_real:
+                app.planetario.alternar_tempo_real()
+            elif args.data:
+                app.planetario.definir_data(args.data)
+
+        # Inicia o loop principal
+        app.executar()
@@ -0,0 +1,221 @@
+# src/app/camera.py
+# Câmera orbital (distância + ângulos em torno de um ponto focal).
+# As matrizes de visão e projeção são calculadas em NumPy e só são
+# recalculadas/enviadas ao OpenGL quando algum parâmetro muda; culling, LOD
+# e picking leem as mesmas matrizes daqui, sem consultar o OpenGL.
+# A câmera também pode seguir um objeto em movimento (ver `focar`/`seguir`).
+
+import math
+import numpy as np
+from OpenGL.GL import *
+
+from src.app.frustum import matriz_perspectiva, matriz_look_at, planos_frustum
+
+# Constante de tempo (s) da transição ao focar um objeto
+SUAVIZACAO_FOCO = 0.35
+
+class Camera:
+    """
+    Parâmetros (atributos simples, podem ser alterados diretamente):
+      - dist, theta, phi: coordenadas esféricas do olho em relação ao alvo
+      - alvo_x, alvo_y, alvo_z: ponto focal
+      - fovy (graus), near, far: lente
+      - viewport: (largura, altura) em pixels, via `definir_viewport`
+
+    A cada leitura as matrizes são conferidas contra os parâmetros usados no
+    último cálculo; `aplicar()` envia ao OpenGL apenas o que mudou desde o
+    último envio.
+    """
+    def __init__(self, dist=60.0, theta=1.57, phi=1.0, alvo=(0.0, 0.0, 0.0),
+                 fovy=45.0, near=1.0, far=1000.0):
+        # Órbita (theta: 90 graus; phi: elevação)
+        self.dist = dist
+        self.theta = theta
+        self.phi = phi
+        # Ponto focal
+        self.alvo_x, self.alvo_y, self.alvo_z = alvo
+        # Lente e área de desenho
+        self.fovy = fovy
+        self.near = near
+        self.far = far
+        self.viewport = (1, 1)
+
+        # Parâmetros usados no último cálculo de cada matriz
+        self._chave_visao = None
+        self._chave_projecao = None
+        self._posicao = (0.0, 0.0, 0.0)
+        self._visao = np.eye(4)
+        self._projecao = np.eye(4)
+        self._projecao_visao = None
+        self._planos = None
+        self._inversa = None
+
+        # Seguimento: desvio do alvo em relação ao objeto (decai até zero) e distância desejada
+        self.seguindo = False
+        self.suavizacao = SUAVIZACAO_FOCO
+        self._desvio = np.zeros(3)
+        self._dist_destino = None
+
+        # O que já está carregado no OpenGL
+        self._visao_enviada = False
+        self._projecao_enviada = False
+        self._viewport_enviado = None
+
+        # Envios de matriz ao OpenGL (para medir o efeito do cache)
+        self.envios = 0
+
+    # ---------------- parâmetros ----------------
+
+    def parametros(self):
+        """Tupla com todos os parâmetros (igual entre dois quadros = mesma imagem)."""
+        return (self.dist, self.theta, self.phi, self.alvo_x, self.alvo_y, self.alvo_z,
+                self.fovy, self.near, self.far) + self.viewport
+
+    def definir_viewport(self, largura, altura):
+        self.viewport = (max(int(largura), 1), max(int(altura), 1))
+
+    def definir_alvo(self, x, y, z):
+        self.alvo_x, self.alvo_y, self.alvo_z = float(x), float(y), float(z)
+
+    def focar(self, posicao, dist=None):
+        """
+        Começa a seguir um objeto que está em `posicao`. O alvo desliza até ele
+        (e a distância até `dist`, se dada) em vez de saltar.
+        """
+        self._desvio = np.array((self.alvo_x, self.alvo_y, self.alvo_z)) - np.asarray(posicao, dtype=np.float64)
+        self._dist_destino = dist
+        self.seguindo = True
+
+    def seguir(self, posicao, dt):
+        """
+        Acompanha o objeto focado, agora em `posicao`. O alvo é a posição do
+        objeto mais um desvio que decai exponencialmente: a câmera não fica
+        para trás mesmo com o objeto em alta velocidade (time warp).
+        """
+        if not self.seguindo:
+            return
+        fator = math.exp(-dt / self.suavizacao) if self.suavizacao > 0.0 else 0.0
+        self._desvio *= fator
+        if np.abs(self._desvio).max() < 1e-6:
+            self._desvio[:] = 0.0
+        self.definir_alvo(*(np.asarray(posicao, dtype=np.float64) + self._desvio))
+
+        if self._dist_destino is not None:
+            self.dist = self._dist_destino + (self.dist - self._dist_destino) * fator
+            if abs(self.dist - self._dist_destino) < 1e-4:
+                self.dist = self._dist_destino
+                self._dist_destino = None
+
+    def cancelar_zoom(self):
+        """Interrompe a transição de distância (o usuário assumiu o zoom)."""
+        self._dist_destino = None
+
+    def soltar(self):
+        """Para de seguir (o alvo fica onde está)."""
+        self.seguindo = False
+        self._dist_destino = None
+
+    def invalidar(self):
+        """Força o reenvio na próxima `aplicar()` (ex.: alguém alterou as matrizes do OpenGL)."""
+        self._visao_enviada = False
+        self._projecao_enviada = False
+        self._viewport_enviado = None
+
+    # ---------------- matrizes ----------------
+
+    def _atualizar(self):
+        """Recalcula as matrizes cujos parâmetros mudaram."""
+        chave = (self.dist, self.theta, self.phi, self.alvo_x, self.alvo_y, self.alvo_z)
+        if chave != self._chave_visao:
+            self._chave_visao = chave
+            # Coordenadas esféricas (dist, theta, phi) -> offset cartesiano do olho
+            seno_phi = math.sin(self.phi)
+            self._posicao = (self.alvo_x + self.dist * seno_phi * math.cos(self.theta),
+                             self.alvo_y + self.dist * math.cos(self.phi),
+                             self.alvo_z + self.dist * seno_phi * math.sin(self.theta))
+            self._visao = matriz_look_at(self._posicao, (self.alvo_x, self.alvo_y, self.alvo_z))
+            self._visao_enviada = False
+            self._projecao_visao = None
+
+        chave = (self.fovy, self.near, self.far) + self.viewport
+        if chave != self._chave_projecao:
+            self._chave_projecao = chave
+            largura, altura = self.viewport
+            self._projecao = matriz_perspectiva(self.fovy, largura / altura, self.near, self.far)
+            self._projecao_enviada = False
+            self._projecao_visao = None
+
+    @property
+    def posicao(self):
+        """Posição (x, y, z) do olho no mundo."""
+        self._atualizar()
+        return self._posicao
+
+    @property
+    def visao(self):
+        """Matriz de visão 4x4 (equivalente ao gluLookAt)."""
+        self._atualizar()
+        return self._visao
+
+    @property
+    def projecao(self):
+        """Matriz de projeção 4x4 (equivalente ao gluPerspective)."""
+        self._atualizar()
+        return self._projecao
+
+    @property
+    def projecao_visao(self):
+        """Produto projeção * visão (mundo -> clip)."""
+        self._atualizar()
+        if self._projecao_visao is None:
+            self._projecao_visao = self._projecao @ self._visao
+            self._planos = None
+            self._inversa = None
+        return self._projecao_visao
+
+    @property
+    def inversa(self):
+        """Inversa de projeção * visão (clip -> mundo), usada no picking."""
+        matriz = self.projecao_visao
+        if self._inversa is None:
+            self._inversa = np.linalg.inv(matriz)
+        return self._inversa
+
+    @property
+    def planos(self):
+        """Planos do frustum (6, 4) para o culling."""
+        matriz = self.projecao_visao
+        if self._planos is None:
+            self._planos = planos_frustum(matriz)
+        return self._planos
+
+    @property
+    def distancia_focal_px(self):
+        """Distância focal da projeção em pixels (converte tamanhos do mundo para a tela)."""
+        return (self.viewport[1] * 0.5) / math.tan(math.radians(self.fovy) * 0.5)
+
+    # ---------------- OpenGL ----------------
+
+    def aplicar(self):
+        """
+        Carrega viewport, projeção e visão no OpenGL (só o que mudou).
+        Ao retornar, o modo de matriz é GL_MODELVIEW com a matriz de visão.
+        """
+        self._atualizar()
+
+        if self._viewport_enviado != self.viewport:
+            glViewport(0, 0, *self.viewport)
+            self._viewport_enviado = self.viewport
+
+        if not self._projecao_enviada:
+            glMatrixMode(GL_PROJECTION)
+            # NumPy é row-major e o OpenGL espera column-major: envia a transposta
+            glLoadMatrixf(np.ascontiguousarray(self._projecao.T, dtype=np.float32))
+            self._projecao_enviada = True
+            self.envios += 1
+
+        glMatrixMode(GL_MODELVIEW)
+        if not self._visao_enviada:
+            glLoadMatrixf(np.ascontiguousarray(self._visao.T, dtype=np.float32))
+            self._visao_enviada = True
+            self.envios += 1
@@ -0,0 +1,244 @@
+# src/app/captura.py
+# Captura de quadros para vídeo ou sequência de imagens, sem travar o loop.
+#
+# A leitura dos pixels é assíncrona: glReadPixels escreve em um Pixel Buffer
+# Object (anel de PBOS buffers) e retorna na hora; o conteúdo só é copiado
+# para a CPU PBOS quadros depois, quando a GPU já terminou a transferência.
+# A codificação (PNG ou vídeo) e a escrita em disco rodam em um pool de
+# threads. Os buffers de quadro vêm de uma fila limitada: com todos em uso
+# (disco ou codificação mais lentos que a renderização), o quadro é descartado
+# e contado, ou o loop espera por um buffer livre (modo sem descarte).
+
+import ctypes
+import os
+import queue
+import struct
+import threading
+import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from OpenGL.GL import *
+
+from src.config import FPS, FILA_CAPTURA
+
+# Pixel Buffer Objects no anel (quadros entre a leitura e a cópia para a CPU)
+PBOS = 3
+
+# Threads de codificação e escrita
+TRABALHADORES = 2
+
+# Compressão zlib dos PNG (1 = mais rápido, 9 = menor); o zlib libera o GIL
+NIVEL_PNG = 3
+
+# Extensões gravadas como vídeo (um arquivo); qualquer outro destino é uma pasta de PNG
+EXTENSOES_VIDEO = ('.y4m',)
+
+def _bloco_png(tipo, dados):
+    """Bloco PNG: tamanho, tipo, dados e CRC32."""
+    return struct.pack('>I', len(dados)) + tipo + dados + struct.pack('>I', zlib.crc32(tipo + dados))
+
+def codificar_png(imagem, nivel=NIVEL_PNG):
+    """Bytes de um PNG RGB 8 bits a partir de um array (altura, largura, 3) uint8."""
+    altura, largura, _ = imagem.shape
+    # Cada linha começa com o tipo de filtro (0: nenhum)
+    linhas = np.zeros((altura, 1 + largura * 3), dtype=np.uint8)
+    linhas[:, 1:] = imagem.reshape(altura, -1)
+    return (b'\x89PNG\r\n\x1a\n'
+            + _bloco_png(b'IHDR', struct.pack('>IIBBBBB', largura, altura, 8, 2, 0, 0, 0))
+            + _bloco_png(b'IDAT', zlib.compress(linhas.tobytes(), nivel))
+            + _bloco_png(b'IEND', b''))
+
+def rgb_para_yuv444(imagem):
+    """Planos Y, Cb e Cr (BT.601, faixa limitada) de um array (altura, largura, 3) uint8."""
+    r, g, b = (imagem[:, :, i].astype(np.int32) for i in range(3))
+    y = ((66 * r + 129 * g + 25 * b + 128) >> 8) + 16
+    cb = ((-38 * r - 74 * g + 112 * b + 128) >> 8) + 128
+    cr = ((112 * r - 94 * g - 18 * b + 128) >> 8) + 128
+    return np.stack([y, cb, cr]).astype(np.uint8)
+
+class CapturaQuadros:
+    """
+    Grava os quadros renderizados em `destino`:
+    - pasta: sequência `prefixo_00000.png`, `prefixo_00001.png`, ...
+    - arquivo `.y4m`: vídeo YUV4MPEG2 (4:4:4, sem compressão) a `fps` quadros
+      por segundo, aberto por ffmpeg, mpv e VLC. Todos os quadros têm o tamanho
+      do primeiro; quadros de outro tamanho (janela redimensionada) são descartados.
+
+    Uso (com o quadro já desenhado, antes do flip):
+        captura.capturar(largura, altura)            # janela
+        captura.capturar(largura, altura, alvo.fbo)  # FBO
+        ...
+        captura.encerrar()                           # esvazia o anel e a fila
+
+    Com `descartar=True` o loop nunca espera pela codificação: sem buffer livre
+    o quadro é descartado (`descartados`). Com `descartar=False` (renderização
+    em lote) nenhum quadro é perdido e o loop espera pela fila.
+    """
+    def __init__(self, destino, descartar=True, prefixo="quadro", fps=FPS,
+                 fila=FILA_CAPTURA, pbos=PBOS, trabalhadores=TRABALHADORES):
+        self.destino = destino
+        self.descartar = descartar
+        self.prefixo = prefixo
+        self.fps = fps
+        self.video = destino.lower().endswith(EXTENSOES_VIDEO)
+
+        # Contadores (lidos pelo HUD e no fim da captura)
+        self.capturados = 0    # quadros aceitos (numerados em sequência, sem lacunas)
+        self.descartados = 0
+
+        if self.video:
+            pasta = os.path.dirname(destino)
+            if pasta:
+                os.makedirs(pasta, exist_ok=True)
+            self._arquivo = open(destino, 'wb')
+            self._tamanho_video = None
+            # Ordem de escrita: cada quadro espera o anterior ser gravado
+            self._vez = threading.Condition()
+            self._proximo = 0
+        else:
+            os.makedirs(destino, exist_ok=True)
+            self._arquivo = None
+
+        # Buffers de quadro livres; o tamanho da fila limita a memória e os quadros em espera
+        self._livres = queue.Queue()
+        for _ in range(max(1, int(fila))):
+            self._livres.put(None)   # alocado no primeiro uso (o tamanho vem do quadro)
+        self._executor = ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix="captura")
+        self._tarefas = deque()
+
+        # Anel de PBOs; sem suporte, a leitura é síncrona (a codificação continua em threads)
+        try:
+            self._pbos = list(np.atleast_1d(glGenBuffers(pbos)))
+        except Exception:
+            self._pbos = []
+        self._tamanhos_pbo = [0] * len(self._pbos)
+        # Por PBO: (largura, altura) da leitura em voo, ou None
+        self._em_voo = [None] * len(self._pbos)
+        self._indice = 0
+
+    @property
+    def fila(self):
+        """Quadros esperando codificação ou escrita."""
+        return sum(1 for tarefa in self._tarefas if not tarefa.done())
+
+    def _buffer_livre(self, tamanho):
+        """Um buffer de `tamanho` bytes, ou None se a fila estiver cheia (modo com descarte)."""
+        try:
+            buffer = self._livres.get(block=not self.descartar)
+        except queue.Empty:
+            return None
+        if buffer is None or buffer.size != tamanho:
+            buffer = np.empty(tamanho, dtype=np.uint8)
+        return buffer
+
+    def _aceitar(self, largura, altura):
+        """Número do quadro, ou None se ele deve ser descartado."""
+        if self.video:
+            if self._tamanho_video is None:
+                self._tamanho_video = (largura, altura)
+                self._arquivo.write(f"YUV4MPEG2 W{largura} H{altura} F{int(self.fps)}:1 Ip A1:1 C444\n".encode())
+            elif self._tamanho_video != (largura, altura):
+                self.descartados += 1
+                return None
+        numero = self.capturados
+        self.capturados += 1
+        return numero
+
+    def _entregar(self, largura, altura, ler):
+        """
+        Copia o quadro com `ler(buffer)` para um buffer livre e o entrega ao pool.
+        Sem buffer livre (fila cheia, modo com descarte) o quadro é descartado.
+        """
+        buffer = self._buffer_livre(largura * altura * 4)
+        if buffer is None:
+            self.descartados += 1
+            return
+        numero = self._aceitar(largura, altura)
+        if numero is None:
+            self._livres.put(buffer)
+            return
+        ler(buffer)
+        self._tarefas.append(self._executor.submit(self._codificar, buffer, numero, largura, altura))
+        # Recolhe as tarefas concluídas (propagando erros de escrita)
+        while self._tarefas and self._tarefas[0].done():
+            self._tarefas.popleft().result()
+
+    def capturar(self, largura, altura, fbo=0):
+        """Lê o quadro atual de `fbo` (0 = janela, buffer de trás) sem esperar pela GPU."""
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, fbo)
+        glPixelStorei(GL_PACK_ALIGNMENT, 4)
+        if not self._pbos:
+            self._entregar(largura, altura,
+                           lambda buffer: glReadPixels(0, 0, largura, altura, GL_RGBA, GL_UNSIGNED_BYTE, buffer))
+            glBindFramebuffer(GL_READ_FRAMEBUFFER, 0)
+            return
+
+        i = self._indice
+        self._indice = (i + 1) % len(self._pbos)
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, self._pbos[i])
+        # O PBO guarda a leitura de `PBOS` quadros atrás: a GPU já deve tê-la concluído
+        self._recolher(i)
+
+        tamanho = largura * altura * 4
+        if self._tamanhos_pbo[i] != tamanho:
+            glBufferData(GL_PIXEL_PACK_BUFFER, tamanho, None, GL_STREAM_READ)
+            self._tamanhos_pbo[i] = tamanho
+        # Com um PBO vinculado, o último argumento é a posição no buffer: a chamada não espera
+        glReadPixels(0, 0, largura, altura, GL_RGBA, GL_UNSIGNED_BYTE, ctypes.c_void_p(0))
+        self._em_voo[i] = (largura, altura)
+
+        glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, 0)
+
+    def _recolher(self, i):
+        """Entrega ao pool a leitura em voo no PBO `i` (já vinculado), se houver."""
+        if self._em_voo[i] is None:
+            return
+        largura, altura = self._em_voo[i]
+        self._em_voo[i] = None
+        self._entregar(largura, altura,
+                       lambda buffer: glGetBufferSubData(GL_PIXEL_PACK_BUFFER, 0, buffer.nbytes, buffer))
+
+    def _codificar(self, buffer, numero, largura, altura):
+        """Executado nas threads do pool: converte, grava e devolve o buffer à fila."""
+        try:
+            # RGBA de baixo para cima -> RGB na ordem das imagens
+            imagem = buffer.reshape(altura, largura, 4)[::-1, :, :3]
+            if self.video:
+                dados = b'FRAME\n' + rgb_para_yuv444(imagem).tobytes()
+                with self._vez:
+                    self._vez.wait_for(lambda: self._proximo == numero)
+                    try:
+                        self._arquivo.write(dados)
+                    finally:
+                        self._proximo += 1
+                        self._vez.notify_all()
+            else:
+                caminho = os.path.join(self.destino, f"{self.prefixo}_{numero:05d}.png")
+                with open(caminho, 'wb') as arquivo:
+                    arquivo.write(codificar_png(imagem))
+        finally:
+            self._livres.put(buffer)
+
+    def encerrar(self):
+        """Recolhe as leituras em voo, espera a fila esvaziar e fecha o vídeo."""
+        # Os últimos quadros não são descartados: espera por buffers livres
+        self.descartar = False
+        if self._pbos:
+            # Na ordem em que foram lidos (o mais antigo está no índice atual)
+            for k in range(len(self._pbos)):
+                i = (self._indice + k) % len(self._pbos)
+                glBindBuffer(GL_PIXEL_PACK_BUFFER, self._pbos[i])
+                self._recolher(i)
+            glBindBuffer(GL_PIXEL_PACK_BUFFER, 0)
+            glDeleteBuffers(len(self._pbos), self._pbos)
+            self._pbos = []
+
+        self._executor.shutdown(wait=True)
+        while self._tarefas:
+            self._tarefas.popleft().result()
+        if self._arquivo is not None:
+            self._arquivo.close()
+            self._arquivo = None
@@ -0,0 +1,178 @@
+# src/app/cinturao.py
+# Cinturão de asteroides: dezenas/centenas de milhares de partículas
+# animadas pelo motor Kepleriano e desenhadas em uma única chamada (point sprites).
+
+import numpy as np
+from OpenGL.GL import *
+
+from src.app.kepler import MotorOrbital
+from src.app.picking import GradeEspacial, ponto_atingido
+from src.formas.buffers import BufferStreaming
+from src.formas.estado_gl import estado_gl
+
+# Região entre Marte (13.0) e Júpiter (17.0)
+RAIO_INTERNO = 14.0
+RAIO_EXTERNO = 16.0
+
+# Período da Terra (raio 10.0) em unidades de `Planetario.angle`; os asteroides
+# seguem a 3ª Lei de Kepler a partir dele: T = T_terra * (a / 10)^1.5
+PERIODO_TERRA = 360.0
+
+# Tamanho (px) dos pontos e resolução da textura do sprite
+TAMANHO_PONTO = 2.0
+RESOLUCAO_SPRITE = 16
+
+class CinturaoAsteroides:
+    """
+    Mantém as posições de `quantidade` partículas em um array NumPy (N, 3),
+    atualizado de forma vetorizada a cada tick, e as envia à GPU uma vez por
+    quadro através de um anel de VBOs (ver `BufferStreaming`).
+    """
+    def __init__(self, quantidade, semente=7):
+        self.quantidade = int(quantidade)
+
+        # Elementos orbitais aleatórios (órbitas pouco excêntricas e pouco inclinadas)
+        rng = np.random.default_rng(semente)
+        n = self.quantidade
+        a = rng.uniform(RAIO_INTERNO, RAIO_EXTERNO, n)
+        self.motor = MotorOrbital(iteracoes_max=3)
+        self.motor.adicionar(
+            a=a,
+            e=rng.uniform(0.0, 0.08, n),
+            i=np.abs(rng.normal(0.0, 0.04, n)),
+            raan=rng.uniform(0.0, 2 * np.pi, n),
+            argp=rng.uniform(0.0, 2 * np.pi, n),
+            m0=rng.uniform(0.0, 2 * np.pi, n),
+            periodo=PERIODO_TERRA * (a / 10.0) ** 1.5,
+        )
+
+        # Posições calculadas só quando lidas (desenho, picking): sem ninguém olhando,
+        # ex. na reprodução rápida de uma gravação, o tick não paga o motor inteiro
+        self._posicoes = self.motor.posicoes(0.0)
+        self._tempo_pendente = None
+        self._tempo = 0.0          # instante das posições (None se vieram de fora do motor)
+        self._sujo = True
+        # Incrementada sempre que as posições mudam (o motor reaproveita o mesmo array)
+        self.versao = 0
+
+        # Esfera envolvente do cinturão inteiro (maior apoastro), para o culling
+        self.raio_limite = float(np.max(self.motor.a * (1.0 + self.motor.e))) if n else 0.0
+
+        # Índice espacial para o picking. Construir custa tanto quanto testar todas as
+        # partículas, então só compensa com o cinturão parado: é construído no segundo
+        # clique sobre as mesmas posições (com o cinturão andando, os cliques testam tudo)
+        self.indice = GradeEspacial()
+        self._versao_clique = None
+
+        # Recursos OpenGL (criados sob demanda, já com contexto ativo)
+        self._buffer = None
+        self._textura = None
+
+    @property
+    def posicoes(self):
+        """Posições (N, 3) de todas as partículas no instante da última `atualizar`."""
+        if self._tempo_pendente is not None:
+            self._posicoes = self.motor.posicoes(self._tempo_pendente)
+            self._tempo_pendente = None
+            self.versao += 1
+        return self._posicoes
+
+    def atualizar(self, tempo):
+        """Passa as partículas para o instante `tempo` (recalculadas na próxima leitura de `posicoes`)."""
+        if tempo == self._tempo:
+            return
+        self._tempo = self._tempo_pendente = tempo
+        self._sujo = True
+
+    def definir_posicoes(self, posicoes):
+        """Usa posições (M, 3) calculadas fora do motor (ex.: pela física de N corpos)."""
+        self._posicoes = np.ascontiguousarray(posicoes, dtype=np.float32)
+        self._tempo = self._tempo_pendente = None
+        self._sujo = True
+        self.versao += 1
+
+    def selecionar(self, origem, direcao, tangente):
+        """Índice da partícula dentro do cone do clique (ver `picking.py`) ou -1."""
+        if self.quantidade == 0:
+            return -1
+        posicoes = self.posicoes
+        parado = self._versao_clique == self.versao
+        self._versao_clique = self.versao
+        if not self.indice.atualizado(self.versao):
+            if not parado:
+                return ponto_atingido(origem, direcao, posicoes, tangente)
+            self.indice.construir(posicoes, self.versao)
+        candidatos = self.indice.candidatos(origem, direcao, tangente)
+        return ponto_atingido(origem, direcao, posicoes, tangente, candidatos)
+
+    def enviar(self):
+        """
+        Envia as posições ao VBO se mudaram desde o último envio (`desenhar`
+        já chama; separado para quem mede o envio à parte).
+        """
+        if self._buffer is None:
+            self._buffer = BufferStreaming()
+            self._textura = self._criar_textura_sprite()
+        if self._sujo:
+            self._buffer.enviar(self.posicoes)
+            self._sujo = False
+
+    def desenhar(self, escala=1.0):
+        """
+        Envia as posições (se mudaram) e desenha todas as partículas de uma vez.
+        `escala`: resolução do alvo em relação à janela (mantém o tamanho dos pontos na tela).
+        """
+        if self.quantidade == 0:
+            return
+        self.enviar()
+
+        estado_gl.empilhar()
+
+        # Partículas não são iluminadas e não escrevem no Z-Buffer (mas são ocultadas pelos planetas)
+        estado_gl.desabilitar(GL_LIGHTING)
+        estado_gl.mascara_profundidade(False)
+        estado_gl.habilitar(GL_BLEND)
+        estado_gl.funcao_blend(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+        # Point sprites: cada ponto vira um quadrado texturizado com a "bolinha"
+        estado_gl.habilitar(GL_TEXTURE_2D)
+        estado_gl.vincular_textura(self._textura)
+        estado_gl.habilitar(GL_POINT_SPRITE)
+        estado_gl.coord_ponto(True)
+        estado_gl.tamanho_ponto(max(TAMANHO_PONTO * escala, 1.0))
+
+        estado_gl.cor(0.75, 0.68, 0.6, 0.6)
+        self._buffer.desenhar(GL_POINTS)
+
+        estado_gl.desempilhar()
+
+    def liberar(self):
+        """Libera os recursos OpenGL."""
+        if self._buffer is not None:
+            self._buffer.liberar()
+            glDeleteTextures([self._textura])
+            estado_gl.textura_apagada(self._textura)
+            self._buffer = None
+            self._textura = None
+
+    @staticmethod
+    def _criar_textura_sprite():
+        """Gera uma textura pequena com um disco de borda suave (alpha radial)."""
+        r = RESOLUCAO_SPRITE
+        eixo = (np.arange(r) + 0.5) / r * 2.0 - 1.0
+        dist = np.sqrt(eixo[:, None] ** 2 + eixo[None, :] ** 2)
+        alpha = np.clip(1.0 - dist, 0.0, 1.0) ** 0.5
+
+        pixels = np.empty((r, r, 4), dtype=np.uint8)
+        pixels[..., :3] = 255
+        pixels[..., 3] = (alpha * 255).astype(np.uint8)
+
+        tex_id = glGenTextures(1)
+        estado_gl.vincular_textura(tex_id)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, r, r, 0, GL_RGBA, GL_UNSIGNED_BYTE, pixels)
+        return tex_id
@@ -0,0 +1,221 @@
+# src/app/corpos.py
+# Tabela de corpos celestes e grafo de cena.
+# Cada corpo é uma linha de dados (pai, órbita, rotação, raio, textura, anéis);
+# as transformações de mundo de todos são calculadas juntas com NumPy.
+
+import numpy as np
+
+# Catálogo do Sistema Solar.
+# As taxas são em graus por unidade de `Planetario.angle` (o "relógio" da simulação):
+#   - taxa_orbita:   translação ao redor do pai
+#   - taxa_rotacao:  giro em torno do próprio eixo
+# Os pais devem aparecer antes dos filhos.
+CATALOGO_CORPOS = [
+    {'nome': 'sun',     'pai': None,    'raio_orbita': 0.0,  'taxa_orbita': 0.0,  'taxa_rotacao': 0.9,   'raio': 5.0,  'textura': 'sun', 'emissivo': True},
+    {'nome': 'mercury', 'pai': None,    'raio_orbita': 6.0,  'taxa_orbita': 4.15, 'taxa_rotacao': 100.0, 'raio': 0.38, 'textura': 'mercury'},
+    {'nome': 'venus',   'pai': None,    'raio_orbita': 8.0,  'taxa_orbita': 1.62, 'taxa_rotacao': -1.8,  'raio': 0.85, 'textura': 'venus'},  # Rotação retrógrada
+    {'nome': 'earth',   'pai': None,    'raio_orbita': 10.0, 'taxa_orbita': 1.0,  'taxa_rotacao': 2.0,   'raio': 1.0,  'textura': 'earth'},
+    {'nome': 'moon',    'pai': 'earth', 'raio_orbita': 1.5,  'taxa_orbita': 2.0,  'taxa_rotacao': 0.0,   'raio': 0.3,  'textura': 'moon'},
+    {'nome': 'mars',    'pai': None,    'raio_orbita': 13.0, 'taxa_orbita': 0.53, 'taxa_rotacao': 6.0,   'raio': 0.53, 'textura': 'mars'},
+    {'nome': 'jupiter', 'pai': None,    'raio_orbita': 17.0, 'taxa_orbita': 0.3,  'taxa_rotacao': 7.0,   'raio': 1.85, 'textura': 'jupiter'},
+    {'nome': 'saturn',  'pai': None,    'raio_orbita': 23.0, 'taxa_orbita': 0.2,  'taxa_rotacao': 7.0,   'raio': 1.55, 'textura': 'saturn',
+     'aneis': (2.0, 2.5, 'satRing')},
+    {'nome': 'uranus',  'pai': None,    'raio_orbita': 27.0, 'taxa_orbita': 0.16, 'taxa_rotacao': 12.0,  'raio': 1.2,  'textura': 'uranus'},
+    {'nome': 'neptune', 'pai': None,    'raio_orbita': 33.0, 'taxa_orbita': 0.1,  'taxa_rotacao': 6.0,   'raio': 1.38, 'textura': 'neptune'},
+]
+
+# Rotação fixa de -90° em X: alinha o polo das esferas GLU (eixo Z) com o eixo Y do mundo
+_ROT_X_MENOS_90 = np.array([
+    [1.0, 0.0,  0.0, 0.0],
+    [0.0, 0.0,  1.0, 0.0],
+    [0.0, -1.0, 0.0, 0.0],
+    [0.0, 0.0,  0.0, 1.0],
+])
+
+def _rotacoes_y(graus):
+    """Matrizes (N, 4, 4) equivalentes a glRotatef(graus, 0, 1, 0)."""
+    rad = np.radians(graus)
+    c, s = np.cos(rad), np.sin(rad)
+    m = np.zeros((len(rad), 4, 4))
+    m[:, 0, 0] = c
+    m[:, 0, 2] = s
+    m[:, 1, 1] = 1.0
+    m[:, 2, 0] = -s
+    m[:, 2, 2] = c
+    m[:, 3, 3] = 1.0
+    return m
+
+class SistemaCorpos:
+    """
+    Registro de corpos celestes + grafo de cena.
+
+    Cada corpo tem dois referenciais:
+      - `orbitas[i]`: referencial orbital (pai * RotY(órbita) * Translação). Os filhos
+        (luas, anéis) são presos aqui, então não herdam o giro do planeta.
+      - `corpos[i]`: referencial de desenho (orbital * RotY(giro) * RotX(-90)).
+
+    As matrizes estão na convenção matemática (vetor coluna); use as versões `_gl`
+    (transpostas, float32) com glMultMatrixf.
+    """
+    def __init__(self, catalogo=None):
+        self.nomes = []
+        self.texturas = []
+        self.emissivos = []
+        self.aneis = []          # (raio_interno, raio_externo, textura) ou None
+        self._indices = {}
+
+        self.pai = np.zeros(0, dtype=np.int64)
+        self.nivel = np.zeros(0, dtype=np.int64)
+        self.raio_orbita = np.zeros(0)
+        self.taxa_orbita = np.zeros(0)
+        self.taxa_rotacao = np.zeros(0)
+        self.raio = np.zeros(0)
+        self.raio_limite = np.zeros(0)   # esfera envolvente (inclui anéis), usada no culling
+
+        self.orbitas = np.zeros((0, 4, 4))
+        self.corpos = np.zeros((0, 4, 4))
+        self.orbitas_gl = np.zeros((0, 4, 4), dtype=np.float32)
+        self.corpos_gl = np.zeros((0, 4, 4), dtype=np.float32)
+
+        # Posições (N, 3) em relação ao pai impostas de fora (ex.: efemérides); None = órbitas do catálogo
+        self.locais = None
+
+        # Flags de "sujo": só recalcula quem mudou (ou cujo pai mudou)
+        self._sujo = np.zeros(0, dtype=bool)
+        self._tempo_anterior = None
+
+        for corpo in catalogo or []:
+            self.registrar(**corpo)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def indice(self, nome):
+        """Retorna o índice de um corpo pelo nome."""
+        return self._indices[nome]
+
+    def registrar(self, nome, pai=None, raio_orbita=0.0, taxa_orbita=0.0, taxa_rotacao=0.0,
+                  raio=1.0, textura=None, aneis=None, emissivo=False):
+        """Adiciona um corpo ao sistema. O pai (se houver) já deve estar registrado."""
+        if nome in self._indices:
+            raise ValueError(f"Corpo já registrado: {nome}")
+
+        if pai is None:
+            i_pai, nivel = -1, 0
+        else:
+            i_pai = self._indices[pai]
+            nivel = int(self.nivel[i_pai]) + 1
+
+        self._indices[nome] = len(self.nomes)
+        self.nomes.append(nome)
+        self.texturas.append(textura)
+        self.emissivos.append(bool(emissivo))
+        self.aneis.append(aneis)
+
+        self.pai = np.append(self.pai, i_pai)
+        self.nivel = np.append(self.nivel, nivel)
+        self.raio_orbita = np.append(self.raio_orbita, float(raio_orbita))
+        self.taxa_orbita = np.append(self.taxa_orbita, float(taxa_orbita))
+        self.taxa_rotacao = np.append(self.taxa_rotacao, float(taxa_rotacao))
+        self.raio = np.append(self.raio, float(raio))
+        self.raio_limite = np.append(self.raio_limite, max(float(raio), aneis[1] if aneis else 0.0))
+
+        identidade = np.eye(4)[None]
+        self.orbitas = np.concatenate([self.orbitas, identidade])
+        self.corpos = np.concatenate([self.corpos, identidade])
+        self._sujo = np.append(self._sujo, True)
+        self._tempo_anterior = None
+
+    def marcar_sujo(self, nome):
+        """Força o recálculo de um corpo (e de sua subárvore) no próximo `atualizar`."""
+        self._sujo[self._indices[nome]] = True
+
+    def definir_locais(self, locais):
+        """
+        Impõe a posição de cada corpo em relação ao pai, (N, 3) em coordenadas
+        da cena, no lugar das órbitas circulares do catálogo (o referencial
+        orbital vira só a translação). `None` volta às órbitas do catálogo.
+        """
+        self.locais = None if locais is None else np.asarray(locais, dtype=np.float64)
+        self._sujo[:] = True
+
+    def definir_transformacoes(self, orbitas, corpos, tempo):
+        """
+        Usa matrizes de mundo (N, 4, 4) calculadas em outro lugar (ex.: no processo
+        da simulação) como o estado no instante `tempo`: `atualizar(tempo)` não
+        recalcula nada até o tempo mudar ou algum corpo ficar sujo.
+        """
+        self.orbitas = orbitas
+        self.corpos = corpos
+        self.orbitas_gl = np.ascontiguousarray(orbitas.transpose(0, 2, 1), dtype=np.float32)
+        self.corpos_gl = np.ascontiguousarray(corpos.transpose(0, 2, 1), dtype=np.float32)
+        self._sujo[:] = False
+        self._tempo_anterior = tempo
+
+    def atualizar(self, tempo):
+        """
+        Recalcula as transformações de mundo para o instante `tempo`
+        (em unidades de `Planetario.angle`). Corpos parados cujo pai não
+        mudou (subárvores estáticas) são pulados.
+        """
+        n = len(self.nomes)
+        if n == 0:
+            return
+
+        if tempo != self._tempo_anterior:
+            # Com o tempo avançando, só quem orbita/gira de fato fica sujo
+            muda_orbita = self._sujo | (self.taxa_orbita != 0.0)
+            muda_giro = self._sujo | (self.taxa_rotacao != 0.0)
+        else:
+            muda_orbita = self._sujo.copy()
+            muda_giro = self._sujo.copy()
+
+        if not muda_orbita.any() and not muda_giro.any():
+            return
+
+        # Propaga "sujo" dos pais para os filhos, nível a nível
+        niveis = [np.nonzero(self.nivel == d)[0] for d in range(int(self.nivel.max()) + 1)]
+        for idx in niveis[1:]:
+            muda_orbita[idx] |= muda_orbita[self.pai[idx]]
+        muda_giro |= muda_orbita
+
+        # --- Referencial orbital: RotY(órbita) * Translação(raio_orbita, 0, 0) ---
+        # (ou só Translação(locais), com posições impostas)
+        sel = np.nonzero(muda_orbita)[0]
+        if len(sel):
+            if self.locais is not None:
+                local = np.tile(np.eye(4), (len(sel), 1, 1))
+                local[:, :3, 3] = self.locais[sel]
+            else:
+                local = _rotacoes_y(self.taxa_orbita[sel] * tempo)
+                # Translação após a rotação: coluna 3 = R * (r, 0, 0)
+                local[:, 0, 3] = local[:, 0, 0] * self.raio_orbita[sel]
+                local[:, 2, 3] = local[:, 2, 0] * self.raio_orbita[sel]
+
+            locais = np.zeros((n, 4, 4))
+            locais[sel] = local
+            for d, idx in enumerate(niveis):
+                idx = idx[muda_orbita[idx]]
+                if len(idx) == 0:
+                    continue
+                if d == 0:
+                    self.orbitas[idx] = locais[idx]
+                else:
+                    self.orbitas[idx] = self.orbitas[self.pai[idx]] @ locais[idx]
+
+        # --- Referencial de desenho: orbital * RotY(giro) * RotX(-90) ---
+        sel = np.nonzero(muda_giro)[0]
+        if len(sel):
+            giro = _rotacoes_y(self.taxa_rotacao[sel] * tempo) @ _ROT_X_MENOS_90
+            self.corpos[sel] = self.orbitas[sel] @ giro
+
+        # Versões prontas para glMultMatrixf (coluna-maior)
+        self.orbitas_gl = np.ascontiguousarray(self.orbitas.transpose(0, 2, 1), dtype=np.float32)
+        self.corpos_gl = np.ascontiguousarray(self.corpos.transpose(0, 2, 1), dtype=np.float32)
+
+        self._sujo[:] = False
+        self._tempo_anterior = tempo
+
+    def posicoes(self):
+        """Posições de mundo (N, 3) dos centros dos corpos."""
+        return self.orbitas[:, :3, 3]
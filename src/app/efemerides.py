@@ -0,0 +1,143 @@
+# src/app/efemerides.py
+# Efemérides pré-calculadas (posições reais dos corpos em datas reais).
+# A tabela vem junto com o projeto (src/assets/efemerides.bin, gerada por
+# `src/app/gerar_efemerides.py`) e é lida por `numpy.memmap`: avaliar uma data
+# toca só as poucas linhas de coeficientes daquele instante, sem carregar o
+# arquivo inteiro e sem acesso à rede.
+#
+# Formato (little-endian):
+#   "EFEM" | versão (uint32) | tamanho do cabeçalho (uint32) | cabeçalho JSON
+#   | zeros até múltiplo de ALINHAMENTO | coeficientes float32 (linhas, 3, n)
+# Cada corpo ocupa `segmentos` linhas consecutivas a partir de `linha`; cada
+# linha guarda os `n` coeficientes de Chebyshev de x, y, z em um intervalo de
+# `intervalo` dias a partir de `inicio` (data juliana). Posições em UA na
+# eclíptica J2000, heliocêntricas (ou relativas a `centro`, ex.: a Lua).
+
+import json
+import struct
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+from src.config import ARQUIVO_EFEMERIDES
+
+MAGICO = b"EFEM"
+VERSAO = 1
+ALINHAMENTO = 64
+
+# Data juliana de J2000.0 e da época Unix (1970-01-01 00:00 UTC)
+JD_J2000 = 2451545.0
+JD_UNIX = 2440587.5
+
+def jd_de_data(data):
+    """Data juliana de um `datetime` (sem fuso = UTC)."""
+    if data.tzinfo is None:
+        data = data.replace(tzinfo=timezone.utc)
+    return JD_UNIX + data.timestamp() / 86400.0
+
+def data_de_jd(jd):
+    """`datetime` (UTC) de uma data juliana."""
+    return datetime(1970, 1, 1, tzinfo=timezone.utc) + timedelta(days=float(jd) - JD_UNIX)
+
+def base_chebyshev(x, n):
+    """
+    Polinômios T_0..T_{n-1} em `x` (em [-1, 1]): array (n,) + x.shape.
+    Usa T_j(x) = cos(j arccos x): uma operação vetorizada em vez da
+    recorrência, que custaria um passo do NumPy por grau.
+    """
+    angulo = np.arccos(np.clip(np.asarray(x, dtype=np.float64), -1.0, 1.0))
+    return np.cos(np.multiply.outer(np.arange(n, dtype=np.float64), angulo))
+
+class Efemerides:
+    """
+    Leitor da tabela de efemérides.
+
+        ef = Efemerides()
+        ef.posicoes(jd)                  # (N, 3) UA, na ordem de `ef.nomes`
+        ef.posicoes(jds, ['earth'])      # (T, 1, 3) para vários instantes
+        ef.elementos(jd)                 # (N, 5): a, e, i, Ω, ω (para as linhas de órbita)
+
+    A avaliação é vetorizada em corpos e instantes: um único gather das linhas
+    necessárias do memmap e uma soma de Chebyshev para todos de uma vez.
+    """
+    def __init__(self, caminho=ARQUIVO_EFEMERIDES):
+        with open(caminho, 'rb') as arquivo:
+            magico, versao, tamanho = arquivo.read(4), *struct.unpack('<II', arquivo.read(8))
+            if magico != MAGICO or versao != VERSAO:
+                raise ValueError(f"Arquivo de efemérides inválido: {caminho}")
+            cabecalho = json.loads(arquivo.read(tamanho).decode('utf-8'))
+
+        self.caminho = caminho
+        self.inicio = float(cabecalho['inicio'])
+        self.fim = float(cabecalho['fim'])
+        self.coeficientes = int(cabecalho['coeficientes'])
+
+        corpos = cabecalho['corpos']
+        self.nomes = [c['nome'] for c in corpos]
+        self.centros = [c['centro'] for c in corpos]
+        self._indices = {nome: i for i, nome in enumerate(self.nomes)}
+        self._linha = np.array([c['linha'] for c in corpos], dtype=np.int64)
+        self._segmentos = np.array([c['segmentos'] for c in corpos], dtype=np.int64)
+        self._intervalo = np.array([c['intervalo'] for c in corpos], dtype=np.float64)
+        self._elementos = np.array([c['elementos'] for c in corpos], dtype=np.float64)
+        self._taxas = np.array([c['taxas'] for c in corpos], dtype=np.float64)
+
+        deslocamento = -(-(12 + tamanho) // ALINHAMENTO) * ALINHAMENTO
+        linhas = int(self._segmentos.sum())
+        self._memmap = np.memmap(caminho, dtype='<f4', mode='r', offset=deslocamento,
+                                 shape=(linhas, 3, self.coeficientes))
+        # Vista ndarray do mesmo mapeamento (as páginas continuam sendo lidas sob demanda);
+        # indexar a subclasse memmap custa mais que o próprio gather
+        self._dados = self._memmap.view(np.ndarray)
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def indice(self, nome):
+        return self._indices[nome]
+
+    def contem(self, jd):
+        """Se a data juliana `jd` está coberta pela tabela."""
+        return self.inicio <= jd <= self.fim
+
+    def verificar(self, jd_min, jd_max=None):
+        """ValueError se alguma data de [jd_min, jd_max] estiver fora da tabela."""
+        if jd_min < self.inicio or (jd_min if jd_max is None else jd_max) > self.fim:
+            raise ValueError(f"Data fora das efemérides ({data_de_jd(self.inicio):%Y-%m-%d} "
+                             f"a {data_de_jd(self.fim):%Y-%m-%d})")
+
+    def _selecao(self, nomes):
+        if nomes is None:
+            return np.arange(len(self.nomes))
+        return np.array([self._indices[nome] for nome in nomes], dtype=np.int64)
+
+    def posicoes(self, jd, nomes=None):
+        """
+        Posições (UA) em `jd` (escalar -> (N, 3); array de T datas -> (T, N, 3)).
+        `nomes` restringe e ordena os corpos. Datas fora da tabela geram ValueError.
+        """
+        escalar = np.ndim(jd) == 0
+        jd = np.atleast_1d(np.asarray(jd, dtype=np.float64))
+        self.verificar(jd.min(), jd.max())
+
+        sel = self._selecao(nomes)
+        # Intervalo de cada (data, corpo) e posição dentro dele em [-1, 1]
+        u = (jd[:, None] - self.inicio) / self._intervalo[sel]
+        k = np.minimum(u.astype(np.int64), self._segmentos[sel] - 1)
+        tau = 2.0 * (u - k) - 1.0
+
+        # Só as linhas necessárias saem do arquivo (gather no memmap)
+        linhas = self._dados[(self._linha[sel] + k).ravel()]              # (T*N, 3, n) float32
+        base = base_chebyshev(tau.ravel(), self.coeficientes)             # (n, T*N)
+        posicoes = (linhas @ base.T[:, :, None]).reshape(len(jd), len(sel), 3)
+        return posicoes[0] if escalar else posicoes
+
+    def elementos(self, jd, nomes=None):
+        """
+        Elementos médios (N, 5) em `jd`: a (UA), e, i, Ω, ω (radianos), com
+        Ω e ω avançados pelas taxas seculares. Servem para desenhar as órbitas.
+        """
+        sel = self._selecao(nomes)
+        elementos = self._elementos[sel].copy()
+        elementos[:, 3:5] += self._taxas[sel] * (float(jd) - JD_J2000)
+        return elementos
@@ -0,0 +1,62 @@
+# src/app/frustum.py
+# Descarte por frustum (view-frustum culling).
+# As matrizes são montadas em NumPy a partir dos mesmos parâmetros de
+# gluPerspective/gluLookAt, sem consultar o OpenGL.
+
+import math
+import numpy as np
+
+def matriz_perspectiva(fovy, aspecto, near, far):
+    """Equivalente a gluPerspective (convenção de vetor coluna)."""
+    f = 1.0 / math.tan(math.radians(fovy) * 0.5)
+    m = np.zeros((4, 4))
+    m[0, 0] = f / aspecto
+    m[1, 1] = f
+    m[2, 2] = (far + near) / (near - far)
+    m[2, 3] = 2.0 * far * near / (near - far)
+    m[3, 2] = -1.0
+    return m
+
+def matriz_look_at(olho, alvo, cima=(0.0, 1.0, 0.0)):
+    """Equivalente a gluLookAt (convenção de vetor coluna)."""
+    olho = np.asarray(olho, dtype=np.float64)
+    frente = np.asarray(alvo, dtype=np.float64) - olho
+    frente /= np.linalg.norm(frente)
+    lado = np.cross(frente, cima)
+    lado /= np.linalg.norm(lado)
+    cima_real = np.cross(lado, frente)
+
+    m = np.eye(4)
+    m[0, :3] = lado
+    m[1, :3] = cima_real
+    m[2, :3] = -frente
+    m[:3, 3] = -m[:3, :3] @ olho
+    return m
+
+def planos_frustum(matriz):
+    """
+    Extrai os 6 planos (esq, dir, baixo, cima, perto, longe) de uma matriz
+    projeção * visão. Retorna (6, 4) com normais unitárias apontando para dentro.
+    """
+    linhas = np.asarray(matriz, dtype=np.float64)
+    planos = np.array([
+        linhas[3] + linhas[0],
+        linhas[3] - linhas[0],
+        linhas[3] + linhas[1],
+        linhas[3] - linhas[1],
+        linhas[3] + linhas[2],
+        linhas[3] - linhas[2],
+    ])
+    planos /= np.linalg.norm(planos[:, :3], axis=1)[:, None]
+    return planos
+
+def esferas_visiveis(planos, centros, raios):
+    """
+    Teste vetorizado de N esferas contra o frustum.
+    Uma esfera é descartada se estiver inteira atrás de algum dos planos.
+    """
+    centros = np.asarray(centros, dtype=np.float64).reshape(-1, 3)
+    raios = np.asarray(raios, dtype=np.float64).reshape(-1)
+    # Distância com sinal de cada centro a cada plano: (N, 6)
+    distancias = centros @ planos[:, :3].T + planos[:, 3]
+    return np.all(distancias >= -raios[:, None], axis=1)
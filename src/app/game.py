@@ -2,20 +2,31 @@
 # Este arquivo contém a lógica principal da janela e o loop do jogo usando Pygame.
 # Ele serve como a "ponte" entre o sistema operacional (janela/eventos) e o Planetário (renderização).
 
+import time
+
 import pygame
 from pygame.locals import *
 from OpenGL.GL import *
 from OpenGL.GLU import *
 
 # Importa configurações globais e a classe principal da simulação
-from src.config import LARGURA_TELA, ALTURA_TELA, TITULO_JANELA, FPS
+from src.config import (LARGURA_TELA, ALTURA_TELA, TITULO_JANELA, FPS, ARQUIVO_PERFIL, MODO_OCIOSO, ESPERA_OCIOSO_MS,
+                        ESCALA_DINAMICA, SIMULACAO_EM_PROCESSO)
 from src.app.planetario import Planetario
+from src.app.perfil import Perfilador
+from src.app.hud import HudDesempenho
+from src.app.resolucao import ResolucaoDinamica
+from src.app.gravacao import Gravador, Reproducao, restaurar_estado
+from src.app.captura import CapturaQuadros
+from src.formas.estatisticas import estatisticas
+from src.formas.estado_gl import estado_gl
+from src.formas.texto import obter_fonte
 
 class Jogo:
     """
     Gerencia a janela principal, contexto OpenGL e o loop de eventos (Game Loop).
     """
-    def __init__(self):
+    def __init__(self, perfil=False, processo=SIMULACAO_EM_PROCESSO, gravar=None, reproduzir=None, saida=None):
         # Inicializa subsistemas do Pygame
         pygame.init()
         pygame.font.init() # Inicializa fontes
@@ -23,18 +34,62 @@ class Jogo:
         # Cria a janela com suporte a OpenGL e redimensionamento
         pygame.display.set_mode((LARGURA_TELA, ALTURA_TELA), DOUBLEBUF | OPENGL | RESIZABLE)
         pygame.display.set_caption(TITULO_JANELA)
+        # Contexto novo: o espelho do estado volta aos valores padrão
+        estado_gl.reiniciar()
         
         self.clock = pygame.time.Clock()
         self.planetario = Planetario()
+        if processo and not reproduzir:
+            # Lógica da simulação em outro processo; aqui fica só o desenho
+            self.planetario.usar_processo()
         self.running = True
         
         # Estado da tela de ajuda
         self.mostrar_ajuda = True
         self.textura_ajuda = self._criar_textura_ajuda()
+        
+        # Gravação da sessão (o arquivo é aberto no início do loop, depois das opções
+        # da linha de comando) ou reprodução de uma gravação no ritmo original
+        self.gravar = gravar
+        self.gravador = None
+        self.reproducao = None
+        if reproduzir:
+            self.reproducao = Reproducao(reproduzir)
+            cabecalho = self.reproducao.cabecalho
+            restaurar_estado(self.planetario, cabecalho['estado'])
+            self.planetario.agora = self.reproducao.agora
+            self.mostrar_ajuda = cabecalho['ajuda']
+            pygame.display.set_mode((cabecalho['largura'], cabecalho['altura']), DOUBLEBUF | OPENGL | RESIZABLE)
+        
+        # Medição de desempenho por fase. Fica ligada com `perfil=True` (main.py --perfil)
+        # ou enquanto o painel (F3) estiver visível; desligada, custa só um `if` por fase.
+        self.perfil = perfil
+        self.perfilador = Perfilador()
+        self.perfilador.ativo = perfil
+        self.hud = HudDesempenho(self.perfilador)
+        
+        # Modo ocioso: quadros que deixaram de ser desenhados por nada ter mudado
+        # (equivalente em quadros a FPS do tempo parado)
+        self.modo_ocioso = MODO_OCIOSO
+        self.quadros_pulados = 0.0
+        self._ultimo_estado = None
+        
+        # Título da janela (mostra a data no modo de data real)
+        self._titulo = TITULO_JANELA
+        
+        # Resolução dinâmica da cena (a interface fica sempre em resolução nativa)
+        self.resolucao = ResolucaoDinamica() if ESCALA_DINAMICA else None
+        
+        # Captura dos quadros apresentados (vídeo ou PNG); descarta quadros em vez de travar a janela
+        self.captura = CapturaQuadros(saida) if saida else None
+        self.hud.captura = self.captura
 
     def _criar_textura_ajuda(self):
-        """Gera uma textura OpenGL contendo o texto de instruções."""
-        font = pygame.font.SysFont("Arial", 20, bold=True)
+        """
+        Gera uma textura OpenGL contendo o texto de instruções.
+        O texto é fixo, então é rasterizado uma vez só (textos que mudam usam o atlas de `texto.py`).
+        """
+        font = obter_fonte("Arial", 20, negrito=True)
         texto_linhas = [
             "INSTRUÇÕES DO SISTEMA SOLAR",
             "",
@@ -42,17 +97,25 @@ class Jogo:
             "  [Z] / [X] : Zoom In / Zoom Out",
             "  [W, A, S, D] : Orbitar Câmera (Girar ao redor do foco)",
             "  [Setas] : Panning (Mover o ponto de foco pelo espaço)",
+            "  [Clique Esq. / Dir.] : Seguir o objeto clicado / Soltar",
             "",
             "Outros:",
             "  [Insert] : Mostrar/Ocultar Linhas de Órbita",
+            "  [B] : Mostrar/Ocultar Cinturão de Asteroides",
+            "  [R] : Mostrar/Ocultar Rastros dos Corpos",
             "  [C] : Segure para Aumentar Velocidade (Turbo)",
+            "  [.] / [,] : Acelerar / Desacelerar o Tempo (x10)",
+            "  [Backspace] : Voltar à Velocidade Normal",
+            "  [T] : Posições Reais de Hoje (Tempo Real) / Voltar",
+            "  [G] : Física de N Corpos (Gravidade Mútua) / Voltar",
             "  [F] : Pausar/Continuar Simulação",
+            "  [F3] : Mostrar/Ocultar Painel de Desempenho",
             "  [ESC] : Abrir/Fechar esta tela de ajuda",
         ]
         
         # Renderiza texto em uma Surface Pygame
         # Cor branca, fundo semi-transparente preto
-        w, h = 600, 400
+        w, h = 600, 650
         surface = pygame.Surface((w, h), pygame.SRCALPHA)
         surface.fill((0, 0, 0, 200)) # Fundo preto semi-transparente
         
@@ -69,11 +132,10 @@ class Jogo:
         # Converte para textura OpenGL
         data = pygame.image.tostring(surface, "RGBA", 1)
         tex_id = glGenTextures(1)
-        glBindTexture(GL_TEXTURE_2D, tex_id)
+        estado_gl.vincular_textura(tex_id)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
         glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
         glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, w, h, 0, GL_RGBA, GL_UNSIGNED_BYTE, data)
-        glBindTexture(GL_TEXTURE_2D, 0)
         
         return tex_id
 
@@ -82,7 +144,7 @@ class Jogo:
         if not self.textura_ajuda: return
 
         # Salva estados anteriores
-        glPushAttrib(GL_ENABLE_BIT | GL_CURRENT_BIT)
+        estado_gl.empilhar()
         glMatrixMode(GL_PROJECTION)
         glPushMatrix()
         glLoadIdentity()
@@ -91,17 +153,17 @@ class Jogo:
         glPushMatrix()
         glLoadIdentity()
         
-        glDisable(GL_DEPTH_TEST)
-        glDisable(GL_LIGHTING)
-        glEnable(GL_TEXTURE_2D)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        estado_gl.desabilitar(GL_DEPTH_TEST)
+        estado_gl.desabilitar(GL_LIGHTING)
+        estado_gl.habilitar(GL_TEXTURE_2D)
+        estado_gl.habilitar(GL_BLEND)
+        estado_gl.funcao_blend(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
         
-        glBindTexture(GL_TEXTURE_2D, self.textura_ajuda)
-        glColor4f(1, 1, 1, 1)
+        estado_gl.vincular_textura(self.textura_ajuda)
+        estado_gl.cor(1, 1, 1, 1)
         
         # Centraliza o quadro de ajuda
-        painel_w, painel_h = 600, 400
+        painel_w, painel_h = 600, 650
         x = (width - painel_w) / 2
         y = (height - painel_h) / 2
         
@@ -111,56 +173,184 @@ class Jogo:
         glTexCoord2f(1, 1); glVertex2f(x + painel_w, y + painel_h)
         glTexCoord2f(0, 1); glVertex2f(x, y + painel_h)
         glEnd()
+        estatisticas.desenho(4, 2)
         
         # Restaura estados
         glPopMatrix()
         glMatrixMode(GL_PROJECTION)
         glPopMatrix()
         glMatrixMode(GL_MODELVIEW)
-        glPopAttrib()
+        estado_gl.desempilhar()
+
+    def _atualizar_titulo(self):
+        """Mostra a data simulada no título da janela (só chama o Pygame quando o texto muda)."""
+        data = self.planetario.data()
+        texto = None
+        if data is not None:
+            texto = f"{data:%d/%m/%Y %H:%M} UTC" + (" (tempo real)" if self.planetario.tempo_real else "")
+            if self.planetario.fisica is not None:
+                texto += " (física)"
+        self.hud.data = texto
+        titulo = f"{TITULO_JANELA} - {texto}" if texto else TITULO_JANELA
+        if titulo != self._titulo:
+            pygame.display.set_caption(titulo)
+            self._titulo = titulo
 
     def executar(self):
         """Inicia e mantém o loop principal do programa."""
+        perfil = self.perfilador
+        ocioso = False
+        if self.gravar:
+            w, h = pygame.display.get_surface().get_size()
+            self.gravador = Gravador(self.gravar, self.planetario, w, h, self.mostrar_ajuda)
+            self.planetario.agora = self.gravador.agora
         while self.running:
+            perfil.iniciar_quadro()
+            
             # --- Controle de Tempo ---
-            dt = self.clock.tick(FPS)
+            eventos = []
+            if self.reproducao is not None:
+                # Reprodução: o dt de cada quadro vem da gravação, no ritmo em que foi gravado
+                dt = tempo = self.reproducao.proximo_quadro()
+                if dt is None:
+                    break
+            else:
+                # Ocioso: o último quadro não mudou nada; dorme até um evento (ou o tempo limite)
+                if ocioso:
+                    evento = pygame.event.wait(ESPERA_OCIOSO_MS)
+                    if evento.type != pygame.NOEVENT:
+                        eventos.append(evento)
+                tempo = self.clock.tick(FPS) / 1000.0   # segundos
+                # A espera não conta como tempo de simulação (ex.: ao sair da pausa)
+                dt = min(tempo, 1.0 / FPS) if ocioso else tempo
+                if self.gravador is not None:
+                    dt = self.gravador.iniciar_quadro(dt)
             w, h = pygame.display.get_surface().get_size()
+            # O picking usa o tamanho do início do quadro (igual na gravação e na reprodução)
+            self.planetario.camera.definir_viewport(w, h)
+            inicio_trabalho = time.perf_counter()
+            perfil.marcar('espera')
             
             # --- Processamento de Eventos (Discretos) ---
-            for event in pygame.event.get():
+            if self.reproducao is not None:
+                # Eventos gravados; da janela, só o pedido para fechar
+                eventos = self.reproducao.eventos + pygame.event.get(pygame.QUIT)
+            else:
+                eventos += pygame.event.get()
+                if self.gravador is not None:
+                    self.gravador.eventos(eventos)
+            # Movimento do mouse sozinho não muda nada na tela
+            houve_evento = any(event.type != pygame.MOUSEMOTION for event in eventos)
+            for event in eventos:
                 if event.type == pygame.QUIT:
                     self.running = False
                 elif event.type == pygame.VIDEORESIZE:
+                    # O novo tamanho chega ao viewport pela câmera, no início da renderização
                     pygame.display.set_mode((event.w, event.h), DOUBLEBUF | OPENGL | RESIZABLE)
-                    self.planetario.config_camera_projecao(event.w, event.h)
                 elif event.type == pygame.KEYDOWN:
                      if event.key == pygame.K_ESCAPE:
                          # Alterna exibição da ajuda
                          self.mostrar_ajuda = not self.mostrar_ajuda
+                     elif event.key == pygame.K_F3:
+                         # Painel de desempenho (a medição acompanha o painel)
+                         self.hud.alternar()
+                         perfil.ativo = self.perfil or self.hud.visivel
                      else:
                          self.planetario.processar_evento(event)
                 else:
                     self.planetario.processar_evento(event)
+            perfil.marcar('eventos')
             
             # --- Input Contínuo e Lógica ---
+            pressed_keys = None
             if not self.mostrar_ajuda:
-                pressed_keys = pygame.key.get_pressed()
+                pressed_keys = self.reproducao.teclas if self.reproducao is not None else pygame.key.get_pressed()
                 self.planetario.processar_input(pressed_keys)
+                perfil.marcar('input')
                 
                 # Turbo (Tecla C)
                 fator = 5.0 if pressed_keys[pygame.K_c] else 1.0
                 
-                self.planetario.atualizar(fator_velocidade=fator)
+                self.planetario.atualizar(dt, fator_velocidade=fator)
+                perfil.marcar('atualizar')
+            
+            self.planetario.atualizar_camera(dt)
+            if self.gravador is not None:
+                self.gravador.quadro(pressed_keys)
+            self._atualizar_titulo()
+            self.hud.fisica = self.planetario.fisica
+            
+            # --- Modo ocioso: só redesenha se algo visível mudou ---
+            # (com o painel aberto, redesenha a cada espera para atualizar a contagem)
+            estado = self.planetario.estado_visual() + (w, h, self.mostrar_ajuda, self.hud.visivel)
+            if (self.modo_ocioso and not houve_evento and estado == self._ultimo_estado
+                    and self.planetario.texturas.concluido and not (ocioso and self.hud.visivel)):
+                # A janela continua mostrando o último quadro apresentado
+                self.quadros_pulados += tempo * FPS
+                self.hud.quadros_pulados = int(self.quadros_pulados)
+                ocioso = True
+                continue
+            if ocioso:
+                # Acordou: o tempo parado (menos este quadro) também foi poupado
+                self.quadros_pulados += max(tempo * FPS - 1.0, 0.0)
+                self.hud.quadros_pulados = int(self.quadros_pulados)
+            self._ultimo_estado = estado
+            ocioso = False
             
             # --- Renderização ---
             self.planetario.config_camera_projecao(w, h)
-            # --- Renderização ---
-            self.planetario.config_camera_projecao(w, h)
-            self.planetario.renderizar()
+            perfil.marcar('camera')
+            if self.resolucao:
+                # Cena no FBO em escala reduzida, ampliada para a janela
+                self.resolucao.iniciar(w, h)
+                self.planetario.renderizar(self.resolucao.escala)
+                self.resolucao.finalizar(w, h)
+            else:
+                self.planetario.renderizar()
+            perfil.marcar('renderizar')
             
             if self.mostrar_ajuda:
                 self._desenhar_ajuda(w, h)
+            perfil.marcar('ajuda')
             
+            self.hud.desenhar(w, h)
+            perfil.marcar('hud')
+            
+            if self.captura is not None:
+                # Leitura assíncrona do buffer de trás (o que o flip vai mostrar)
+                self.captura.capturar(w, h)
+                perfil.marcar('captura')
+            
+            # Custo do quadro sem o flip: com vsync ele espera pelo próximo retraço e
+            # levaria a escala da resolução ao mínimo mesmo com folga
+            ms_trabalho = (time.perf_counter() - inicio_trabalho) * 1000.0
             pygame.display.flip()
+            perfil.marcar('flip')
+            if self.resolucao:
+                self.resolucao.concluir_quadro(ms_trabalho)
+                self.hud.escala_resolucao = self.resolucao.escala
+            perfil.fechar_quadro(estatisticas)
             
+        # Tempos por quadro para análise posterior
+        if perfil.quadros:
+            linhas = perfil.salvar_csv(ARQUIVO_PERFIL)
+            print(f"Perfil de {linhas} quadros gravado em {ARQUIVO_PERFIL}")
+        if self.quadros_pulados >= 1.0:
+            print(f"Modo ocioso: {int(self.quadros_pulados)} quadros não desenhados")
+        if self.gravador is not None:
+            tamanho = self.gravador.fechar(self.planetario)
+            print(f"Gravação: {self.gravador.quadros} quadros ({tamanho} bytes) em {self.gravar}")
+        if self.reproducao is not None:
+            confere = self.reproducao.confere(self.planetario)
+            if confere is not None:
+                print("Reprodução: estado final " + ("confere com a gravação" if confere else "difere da gravação"))
+        
+        if self.captura is not None:
+            self.captura.encerrar()
+            print(f"Captura: {self.captura.capturados} quadros em {self.captura.destino}"
+                  f" ({self.captura.descartados} descartados)")
+        
+        if self.resolucao:
+            self.resolucao.liberar()
+        self.planetario.encerrar()
         pygame.quit()
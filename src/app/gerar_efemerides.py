@@ -0,0 +1,225 @@
+# src/app/gerar_efemerides.py
+# Gera o arquivo de efemérides distribuído com o projeto (src/assets/efemerides.bin).
+#
+# As posições vêm de teorias analíticas (não há acesso à rede nem às
+# efemérides numéricas do JPL aqui):
+#   - planetas: elementos Keplerianos aproximados de E. M. Standish (JPL,
+#     "Keplerian Elements for Approximate Positions of the Major Planets",
+#     tabela de 3000 a.C. a 3000 d.C., com os termos extras de Júpiter a Netuno);
+#   - Lua: elementos médios com os principais termos de perturbação
+#     (evecção, variação, equação anual...), geocêntrica.
+# Cada corpo é ajustado por polinômios de Chebyshev em intervalos fixos; o
+# formato do arquivo está descrito em `src/app/efemerides.py`.
+#
+# Uso: python -m src.app.gerar_efemerides [--inicio 1850] [--fim 2150]
+
+import argparse
+import json
+import os
+import struct
+import sys
+from datetime import datetime, timezone
+
+import numpy as np
+
+sys.path.append(os.getcwd())
+
+from src.config import ARQUIVO_EFEMERIDES
+from src.app.efemerides import MAGICO, VERSAO, ALINHAMENTO, JD_J2000, jd_de_data, base_chebyshev
+
+# Unidade astronômica e raio equatorial da Terra (km)
+UA_KM = 149597870.7
+RAIO_TERRA_KM = 6378.14
+
+# Coeficientes por componente e intervalo (dias) de cada corpo: escolhidos para
+# um erro bem abaixo do que aparece na tela (ver o relatório impresso ao gerar)
+COEFICIENTES = 12
+INTERVALOS = {
+    'mercury': 32.0, 'venus': 128.0, 'earth': 128.0, 'mars': 256.0, 'jupiter': 1024.0,
+    'saturn': 2048.0, 'uranus': 4096.0, 'neptune': 4096.0, 'moon': 32.0,
+}
+
+# Elementos (J2000, eclíptica e equinócio J2000) e taxas por século:
+# a (UA), e, I, L, ϖ (longitude do periélio), Ω (ns)
+ELEMENTOS = {
+    'mercury': ((0.38709843, 0.20563661, 7.00559432, 252.25166724, 77.45771895, 48.33961819),
+                (0.00000000, 0.00002123, -0.00590158, 149472.67486623, 0.15940013, -0.12214182)),
+    'venus':   ((0.72332102, 0.00676399, 3.39777545, 181.97970850, 131.76755713, 76.67261496),
+                (-0.00000026, -0.00005107, 0.00043494, 58517.81560260, 0.05679648, -0.27274174)),
+    'earth':   ((1.00000018, 0.01673163, -0.00054346, 100.46691572, 102.93005885, -5.11260389),
+                (-0.00000003, -0.00003661, -0.01337178, 35999.37306329, 0.31795260, -0.24123856)),
+    'mars':    ((1.52371243, 0.09336511, 1.85181869, -4.56813164, -23.91744784, 49.71320984),
+                (0.00000097, 0.00009149, -0.00724757, 19140.29934243, 0.45223625, -0.26852431)),
+    'jupiter': ((5.20248019, 0.04853590, 1.29861416, 34.33479152, 14.27495244, 100.29282654),
+                (-0.00002864, 0.00018026, -0.00322699, 3034.90371757, 0.18199196, 0.13024619)),
+    'saturn':  ((9.54149883, 0.05550825, 2.49424102, 50.07571329, 92.86136063, 113.63998702),
+                (-0.00003065, -0.00032044, 0.00451969, 1222.11494724, 0.54179478, -0.25015002)),
+    'uranus':  ((19.18797948, 0.04685740, 0.77298127, 314.20276625, 172.43404441, 73.96250215),
+                (-0.00020455, -0.00001550, -0.00180155, 428.49512595, 0.09266985, 0.05739699)),
+    'neptune': ((30.06952752, 0.00895439, 1.77005520, 304.22289287, 46.68158724, 131.78635853),
+                (0.00006447, 0.00000818, 0.00022400, 218.46515314, 0.01009938, -0.00606302)),
+}
+
+# Termos extras da anomalia média (b, c, s, f): M += b T² + c cos(f T) + s sen(f T)
+TERMOS_EXTRAS = {
+    'jupiter': (-0.00012452, 0.06064060, -0.35635438, 38.35125000),
+    'saturn':  (0.00025899, -0.13434469, 0.87320147, 38.35125000),
+    'uranus':  (0.00058331, -0.97731848, 0.17689245, 7.67025000),
+    'neptune': (-0.00041348, 0.68346318, -0.10162547, 7.67025000),
+}
+
+def _kepler(M, e, iteracoes=30):
+    """Resolve M = E - e sen(E) em float64 (Newton)."""
+    E = M + e * np.sin(M)
+    for _ in range(iteracoes):
+        dE = (E - e * np.sin(E) - M) / (1.0 - e * np.cos(E))
+        E -= dE
+        if np.abs(dE).max() < 1e-14:
+            break
+    return E
+
+def _elementos(nome, jd):
+    """(a, e, I, ϖ, Ω, M) em radianos (exceto a, e) nos instantes `jd`."""
+    T = (np.asarray(jd, dtype=np.float64) - JD_J2000) / 36525.0
+    base, taxas = ELEMENTOS[nome]
+    a, e, I, L, peri, no = (b + t * T for b, t in zip(base, taxas))
+    M = L - peri
+    if nome in TERMOS_EXTRAS:
+        b, c, s, f = TERMOS_EXTRAS[nome]
+        M = M + b * T * T + c * np.cos(np.radians(f * T)) + s * np.sin(np.radians(f * T))
+    M = np.remainder(M + 180.0, 360.0) - 180.0
+    return a, e, np.radians(I), np.radians(peri), np.radians(no), np.radians(M)
+
+def posicoes_planeta(nome, jd):
+    """Posições heliocêntricas (len(jd), 3) em UA, eclíptica J2000."""
+    a, e, I, peri, no, M = _elementos(nome, jd)
+    E = _kepler(M, e)
+    xp = a * (np.cos(E) - e)
+    yp = a * np.sqrt(1.0 - e * e) * np.sin(E)
+    w = peri - no
+    cw, sw, cO, sO, cI, sI = np.cos(w), np.sin(w), np.cos(no), np.sin(no), np.cos(I), np.sin(I)
+    x = (cw * cO - sw * sO * cI) * xp + (-sw * cO - cw * sO * cI) * yp
+    y = (cw * sO + sw * cO * cI) * xp + (-sw * sO + cw * cO * cI) * yp
+    z = (sw * sI) * xp + (cw * sI) * yp
+    return np.stack([x, y, z], axis=-1)
+
+def posicoes_lua(jd):
+    """Posições geocêntricas (len(jd), 3) da Lua em UA, eclíptica J2000 (aprox.)."""
+    d = np.asarray(jd, dtype=np.float64) - 2451543.5
+    rad = np.radians
+    N = rad(125.1228 - 0.0529538083 * d)
+    i = rad(5.1454)
+    w = rad(318.0634 + 0.1643573223 * d)
+    e = 0.054900
+    M = rad(np.remainder(115.3654 + 13.0649929509 * d, 360.0))
+    E = _kepler(M, e)
+    xv = 60.2666 * (np.cos(E) - e)
+    yv = 60.2666 * np.sqrt(1.0 - e * e) * np.sin(E)
+    v = np.arctan2(yv, xv)
+    r = np.hypot(xv, yv)
+
+    xh = r * (np.cos(N) * np.cos(v + w) - np.sin(N) * np.sin(v + w) * np.cos(i))
+    yh = r * (np.sin(N) * np.cos(v + w) + np.cos(N) * np.sin(v + w) * np.cos(i))
+    zh = r * np.sin(v + w) * np.sin(i)
+    lon = np.arctan2(yh, xh)
+    lat = np.arctan2(zh, np.hypot(xh, yh))
+
+    # Perturbações principais (argumentos a partir do Sol médio)
+    Ms = rad(356.0470 + 0.9856002585 * d)
+    Ls = Ms + rad(282.9404 + 4.70935e-5 * d)
+    Lm = N + w + M
+    D = Lm - Ls
+    F = Lm - N
+    lon = lon + rad(-1.274 * np.sin(M - 2 * D) + 0.658 * np.sin(2 * D) - 0.186 * np.sin(Ms)
+                    - 0.059 * np.sin(2 * M - 2 * D) - 0.057 * np.sin(M - 2 * D + Ms)
+                    + 0.053 * np.sin(M + 2 * D) + 0.046 * np.sin(2 * D - Ms) + 0.041 * np.sin(M - Ms)
+                    - 0.035 * np.sin(D) - 0.031 * np.sin(M + Ms) - 0.015 * np.sin(2 * F - 2 * D)
+                    + 0.011 * np.sin(M - 4 * D))
+    lat = lat + rad(-0.173 * np.sin(F - 2 * D) - 0.055 * np.sin(M - F - 2 * D)
+                    - 0.046 * np.sin(M + F - 2 * D) + 0.033 * np.sin(F + 2 * D) + 0.017 * np.sin(2 * M + F))
+    r = r - 0.58 * np.cos(M - 2 * D) - 0.46 * np.cos(2 * D)
+
+    # Equinócio da data -> J2000 (precessão geral em longitude)
+    lon = lon - rad(1.3970 * (d - 1.5) / 36525.0)
+    r = r * RAIO_TERRA_KM / UA_KM
+    return np.stack([r * np.cos(lat) * np.cos(lon), r * np.cos(lat) * np.sin(lon), r * np.sin(lat)], axis=-1)
+
+def posicoes(nome, jd):
+    return posicoes_lua(jd) if nome == 'moon' else posicoes_planeta(nome, jd)
+
+def ajustar(nome, inicio, segmentos, intervalo, n=COEFICIENTES):
+    """
+    Coeficientes de Chebyshev (segmentos, 3, n) por interpolação nos nós de
+    Chebyshev de cada intervalo. Retorna também o erro máximo (UA) medido
+    fora dos nós.
+    """
+    k = np.arange(n)
+    nos = np.cos(np.pi * (k + 0.5) / n)[::-1]                        # (n,) em [-1, 1]
+    meio = inicio + (np.arange(segmentos) + 0.5) * intervalo          # (S,)
+    jd = meio[:, None] + nos[None, :] * (intervalo * 0.5)             # (S, n)
+    valores = posicoes(nome, jd.ravel()).reshape(segmentos, n, 3)
+
+    # Interpolação exata nos nós: coeficientes = (2/n) Σ f(x_k) T_j(x_k) (c_0 pela metade)
+    base = base_chebyshev(nos, n)                                     # (n, n): T_j(x_k)
+    coeficientes = np.einsum('skc,jk->scj', valores, base) * (2.0 / n)
+    coeficientes[:, :, 0] *= 0.5
+
+    # Erro em pontos intermediários
+    teste = np.linspace(-1.0, 1.0, 4 * n + 1)
+    jd_teste = meio[:, None] + teste[None, :] * (intervalo * 0.5)
+    esperado = posicoes(nome, jd_teste.ravel()).reshape(segmentos, len(teste), 3)
+    calculado = np.einsum('scj,jt->stc', coeficientes.astype(np.float32).astype(np.float64),
+                          base_chebyshev(teste, n))
+    erro = float(np.abs(calculado - esperado).max())
+    return coeficientes.astype('<f4'), erro
+
+def gerar(caminho=ARQUIVO_EFEMERIDES, ano_inicio=1850, ano_fim=2150, n=COEFICIENTES):
+    inicio = jd_de_data(datetime(ano_inicio, 1, 1, tzinfo=timezone.utc))
+    fim = jd_de_data(datetime(ano_fim, 1, 1, tzinfo=timezone.utc))
+
+    corpos, blocos, linha = [], [], 0
+    for nome, intervalo in INTERVALOS.items():
+        segmentos = int(np.ceil((fim - inicio) / intervalo))
+        coeficientes, erro = ajustar(nome, inicio, segmentos, intervalo, n)
+        # Elementos médios em J2000 e taxas (rad/dia) de Ω e ω, para as linhas de órbita
+        if nome == 'moon':
+            d = JD_J2000 - 2451543.5
+            elementos = [60.2666 * RAIO_TERRA_KM / UA_KM, 0.0549, np.radians(5.1454),
+                         np.radians(125.1228 - 0.0529538083 * d), np.radians(318.0634 + 0.1643573223 * d)]
+            taxas = [np.radians(-0.0529538083), np.radians(0.1643573223)]
+        else:
+            a, e, I, peri, no, _ = _elementos(nome, JD_J2000)
+            elementos = [a, e, I, no, peri - no]
+            taxa_peri, taxa_no = ELEMENTOS[nome][1][4:6]
+            taxas = [np.radians(taxa_no / 36525.0), np.radians((taxa_peri - taxa_no) / 36525.0)]
+        corpos.append({
+            'nome': nome, 'centro': 'earth' if nome == 'moon' else None,
+            'linha': linha, 'segmentos': segmentos, 'intervalo': intervalo,
+            'elementos': [float(v) for v in elementos],
+            'taxas': [float(v) for v in taxas],
+            'erro_km': erro * UA_KM,
+        })
+        blocos.append(coeficientes)
+        linha += segmentos
+        print(f"{nome:<8} {segmentos:6d} intervalos de {intervalo:6.0f} dias   erro máx. {erro * UA_KM:10.1f} km")
+
+    cabecalho = json.dumps({'inicio': inicio, 'fim': fim, 'coeficientes': n, 'unidade': 'UA',
+                            'referencial': 'eclíptica J2000', 'corpos': corpos}).encode('utf-8')
+    deslocamento = -(-(12 + len(cabecalho)) // ALINHAMENTO) * ALINHAMENTO
+    dados = np.concatenate(blocos)
+
+    os.makedirs(os.path.dirname(caminho) or ".", exist_ok=True)
+    with open(caminho, 'wb') as arquivo:
+        arquivo.write(MAGICO + struct.pack('<II', VERSAO, len(cabecalho)))
+        arquivo.write(cabecalho)
+        arquivo.write(b'\0' * (deslocamento - 12 - len(cabecalho)))
+        arquivo.write(dados.tobytes())
+    print(f"{caminho}: {os.path.getsize(caminho) / 1024:.0f} KiB, {ano_inicio}-{ano_fim}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Gera a tabela de efemérides (Chebyshev) dos corpos")
+    parser.add_argument("--inicio", type=int, default=1850, help="primeiro ano coberto")
+    parser.add_argument("--fim", type=int, default=2150, help="ano final (1º de janeiro, exclusivo)")
+    parser.add_argument("--saida", default=ARQUIVO_EFEMERIDES, help="arquivo gerado")
+    args = parser.parse_args()
+    gerar(args.saida, args.inicio, args.fim)
@@ -0,0 +1,312 @@
+# src/app/gravacao.py
+# Gravação e reprodução determinística das sessões.
+# O laço da janela grava, por quadro, o dt, o instante e as teclas contínuas
+# (uma máscara de bits), além dos eventos discretos que chegam ao Planetário;
+# reproduzir o arquivo repete a mesma lógica, quadro a quadro, com a mesma
+# entrada: no ritmo original (janela) ou o mais rápido possível, sem desenhar.
+#
+# Formato (little-endian):
+#   "GRAV" | versão (uint32) | tamanho do cabeçalho (uint32) | cabeçalho JSON
+#   | registros, cada um começando por um byte de tipo:
+#       'Q' instante (uint32, ms desde o início) | dt (float32, s) | teclas (uint16)
+#       'K' tecla pressionada (int32)
+#       'M' clique: botão (uint8) | x, y (int16)
+#       'R' janela redimensionada: largura, altura (uint16)
+#       'S' fechar a janela
+#       'F' resumo do estado final (16 bytes, ver `resumo_estado`)
+# Os eventos de um quadro vêm antes do seu registro 'Q'. O cabeçalho guarda o
+# estado inicial do Planetário (relógio, modos, câmera) e o tamanho da janela.
+# Durante a gravação, o dt e o instante já são arredondados para o que cabe no
+# registro antes de a lógica usá-los: a reprodução vê exatamente os mesmos valores.
+
+import hashlib
+import json
+import struct
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pygame
+
+from src.app.efemerides import JD_J2000
+
+MAGICO = b"GRAV"
+VERSAO = 1
+
+# Teclas lidas continuamente em `processar_input` (e o turbo): bit k = TECLAS_CONTINUAS[k]
+TECLAS_CONTINUAS = (pygame.K_z, pygame.K_x, pygame.K_w, pygame.K_a, pygame.K_s, pygame.K_d,
+                    pygame.K_UP, pygame.K_DOWN, pygame.K_LEFT, pygame.K_RIGHT, pygame.K_c)
+_BITS = {tecla: k for k, tecla in enumerate(TECLAS_CONTINUAS)}
+
+_QUADRO = struct.Struct('<cIfH')
+_TECLA = struct.Struct('<ci')
+_CLIQUE = struct.Struct('<cBhh')
+_TAMANHO = struct.Struct('<cHH')
+_FINAL = struct.Struct('<c16s')
+
+def mascara_teclas(teclas):
+    """Máscara de bits das TECLAS_CONTINUAS pressionadas em `teclas` (ex.: `pygame.key.get_pressed()`)."""
+    mascara = 0
+    for k, tecla in enumerate(TECLAS_CONTINUAS):
+        if teclas[tecla]:
+            mascara |= 1 << k
+    return mascara
+
+class TeclasGravadas:
+    """Substitui `pygame.key.get_pressed()` na reprodução (teclas fora da máscara: soltas)."""
+    def __init__(self, mascara=0):
+        self.mascara = mascara
+
+    def __getitem__(self, tecla):
+        k = _BITS.get(tecla)
+        return k is not None and bool(self.mascara >> k & 1)
+
+def estado_planetario(planetario):
+    """Estado inicial da sessão (o que as opções da linha de comando podem ter mudado)."""
+    r, cam = planetario.relogio, planetario.camera
+    return {
+        'tempo_anterior': r.tempo_anterior, 'tempo_atual': r.tempo_atual, 'acumulador': r._acumulador,
+        'warp': r.warp, 'pausado': planetario.paused, 'modo_data': planetario.modo_data,
+        'tempo_real': planetario.tempo_real, 'fisica': planetario.fisica is not None,
+        'mostrar_orbitas': planetario.mostrar_orbitas, 'mostrar_cinturao': planetario.mostrar_cinturao,
+        'mostrar_rastros': planetario.mostrar_rastros,
+        'camera': [cam.dist, cam.theta, cam.phi, cam.alvo_x, cam.alvo_y, cam.alvo_z],
+    }
+
+def restaurar_estado(planetario, estado):
+    """Leva um Planetário recém-criado ao estado de `estado_planetario`."""
+    from src.app.planetario import DIAS_POR_UNIDADE
+
+    r = planetario.relogio
+    if estado['modo_data']:
+        planetario.definir_data(JD_J2000 + estado['tempo_atual'] * DIAS_POR_UNIDADE)
+    if estado['fisica']:
+        planetario.definir_tempo(estado['tempo_atual'])
+        planetario.iniciar_fisica()
+    r.tempo_anterior, r.tempo_atual, r._acumulador = estado['tempo_anterior'], estado['tempo_atual'], estado['acumulador']
+    r.warp = estado['warp']
+    planetario.angle = r.tempo
+    planetario.paused = estado['pausado']
+    planetario.tempo_real = estado['tempo_real']
+    planetario.mostrar_orbitas = estado['mostrar_orbitas']
+    planetario.mostrar_cinturao = estado['mostrar_cinturao']
+    planetario.mostrar_rastros = estado['mostrar_rastros']
+    cam = planetario.camera
+    cam.dist, cam.theta, cam.phi = estado['camera'][:3]
+    cam.definir_alvo(*estado['camera'][3:])
+    if planetario.fisica is None and planetario.mostrar_cinturao:
+        planetario.cinturao.atualizar(planetario.angle)
+
+def resumo_estado(planetario):
+    """Hash (16 bytes) do estado lógico: tempo, relógio, câmera, foco e posições dos corpos."""
+    r, cam = planetario.relogio, planetario.camera
+    planetario.corpos.atualizar(planetario.angle)
+    h = hashlib.blake2b(digest_size=16)
+    h.update(np.array([planetario.angle, r.tempo_atual, r.warp, planetario.paused, planetario.modo_data,
+                       planetario.fisica is not None, cam.dist, cam.theta, cam.phi,
+                       cam.alvo_x, cam.alvo_y, cam.alvo_z], dtype=np.float64).tobytes())
+    h.update(repr(planetario.foco).encode())
+    h.update(np.ascontiguousarray(planetario.corpos.posicoes(), dtype=np.float64).tobytes())
+    return h.digest()
+
+class Gravador:
+    """
+    Grava uma sessão da janela (ver `Jogo.executar`):
+
+        g = Gravador(caminho, planetario, largura, altura, ajuda)
+        planetario.agora = g.agora          # o tempo real usa o instante gravado
+        # a cada quadro:
+        dt = g.iniciar_quadro(dt); g.eventos(eventos); g.quadro(teclas)
+        g.fechar(planetario)
+    """
+    def __init__(self, caminho, planetario, largura, altura, ajuda):
+        self.caminho = caminho
+        self.inicio = time.time()
+        self.instante = 0.0
+        self.quadros = 0
+        self._dt = 0.0
+        cabecalho = json.dumps({
+            'inicio': self.inicio, 'largura': int(largura), 'altura': int(altura), 'ajuda': bool(ajuda),
+            'estado': estado_planetario(planetario),
+        }).encode('utf-8')
+        self._arquivo = open(caminho, 'wb')
+        self._arquivo.write(MAGICO + struct.pack('<II', VERSAO, len(cabecalho)) + cabecalho)
+
+    def agora(self):
+        """Instante do quadro atual (`datetime` UTC): o mesmo valor volta na reprodução."""
+        return datetime.fromtimestamp(self.inicio + self.instante, timezone.utc)
+
+    def iniciar_quadro(self, dt):
+        """Marca o instante do quadro e devolve `dt` na precisão gravada (é o que a lógica deve usar)."""
+        self.instante = int((time.time() - self.inicio) * 1000.0) / 1000.0
+        self._dt = float(np.float32(dt))
+        return self._dt
+
+    def eventos(self, eventos):
+        """Grava os eventos do quadro que mudam a simulação ou a tela."""
+        escrever = self._arquivo.write
+        for evento in eventos:
+            if evento.type == pygame.KEYDOWN:
+                escrever(_TECLA.pack(b'K', evento.key))
+            elif evento.type == pygame.MOUSEBUTTONDOWN:
+                escrever(_CLIQUE.pack(b'M', evento.button, *evento.pos))
+            elif evento.type == pygame.VIDEORESIZE:
+                escrever(_TAMANHO.pack(b'R', evento.w, evento.h))
+            elif evento.type == pygame.QUIT:
+                escrever(b'S')
+
+    def quadro(self, teclas=None):
+        """Fecha o quadro com as teclas contínuas lidas (None: não lidas, ex.: tela de ajuda)."""
+        mascara = 0 if teclas is None else mascara_teclas(teclas)
+        self._arquivo.write(_QUADRO.pack(b'Q', round(self.instante * 1000.0), self._dt, mascara))
+        self.quadros += 1
+
+    def fechar(self, planetario):
+        """Grava o resumo do estado final e fecha o arquivo. Retorna o tamanho em bytes."""
+        self._arquivo.write(_FINAL.pack(b'F', resumo_estado(planetario)))
+        tamanho = self._arquivo.tell()
+        self._arquivo.close()
+        return tamanho
+
+class Reproducao:
+    """
+    Lê uma gravação quadro a quadro.
+
+        rep = Reproducao(caminho)
+        restaurar_estado(planetario, rep.cabecalho['estado'])
+        planetario.agora = rep.agora
+        while (dt := rep.proximo_quadro()) is not None:
+            rep.eventos, rep.teclas   # entrada do quadro
+        rep.confere(planetario)       # None se a gravação não tem resumo final
+
+    Com `ritmo_real`, `proximo_quadro` espera até o instante gravado do quadro.
+    """
+    def __init__(self, caminho, ritmo_real=True):
+        with open(caminho, 'rb') as arquivo:
+            dados = arquivo.read()
+        if dados[:4] != MAGICO:
+            raise ValueError(f"Arquivo de gravação inválido: {caminho}")
+        versao, tamanho = struct.unpack_from('<II', dados, 4)
+        if versao != VERSAO:
+            raise ValueError(f"Versão de gravação não suportada: {versao}")
+        self.cabecalho = json.loads(dados[12:12 + tamanho].decode('utf-8'))
+        self.inicio = self.cabecalho['inicio']
+        self.caminho = caminho
+        self.ritmo_real = ritmo_real
+
+        self._dados = dados
+        self._posicao = 12 + tamanho
+        self._relogio = None
+        self.resumo_final = None
+        self.terminou = False
+
+        self.instante = 0.0
+        self.eventos = []
+        self.teclas = TeclasGravadas()
+        self.quadros = 0
+
+    def agora(self):
+        return datetime.fromtimestamp(self.inicio + self.instante, timezone.utc)
+
+    @property
+    def duracao(self):
+        """Instante do último quadro lido (s)."""
+        return self.instante
+
+    def proximo_quadro(self):
+        """Lê o próximo quadro (eventos, teclas, instante) e devolve o seu dt, ou None no fim."""
+        dados, p = self._dados, self._posicao
+        eventos = []
+        while p < len(dados):
+            tipo = dados[p:p + 1]
+            if tipo == b'Q':
+                _, milissegundos, dt, mascara = _QUADRO.unpack_from(dados, p)
+                self.instante = milissegundos / 1000.0
+                self._posicao = p + _QUADRO.size
+                self.eventos = eventos
+                self.teclas = TeclasGravadas(mascara)
+                self.quadros += 1
+                if self.ritmo_real:
+                    self._aguardar()
+                return dt
+            elif tipo == b'K':
+                _, tecla = _TECLA.unpack_from(dados, p)
+                eventos.append(pygame.event.Event(pygame.KEYDOWN, key=tecla, mod=0, unicode='', scancode=0))
+                p += _TECLA.size
+            elif tipo == b'M':
+                _, botao, x, y = _CLIQUE.unpack_from(dados, p)
+                eventos.append(pygame.event.Event(pygame.MOUSEBUTTONDOWN, button=botao, pos=(x, y)))
+                p += _CLIQUE.size
+            elif tipo == b'R':
+                _, largura, altura = _TAMANHO.unpack_from(dados, p)
+                eventos.append(pygame.event.Event(pygame.VIDEORESIZE, w=largura, h=altura, size=(largura, altura)))
+                p += _TAMANHO.size
+            elif tipo == b'S':
+                eventos.append(pygame.event.Event(pygame.QUIT))
+                p += 1
+            elif tipo == b'F':
+                self.resumo_final = _FINAL.unpack_from(dados, p)[1]
+                p += _FINAL.size
+            else:
+                raise ValueError(f"Registro inválido na posição {p} de {self.caminho}")
+        self._posicao = p
+        self.eventos = []
+        self.terminou = True
+        return None
+
+    def _aguardar(self):
+        """Dorme até o instante gravado do quadro (medido a partir do primeiro quadro)."""
+        if self._relogio is None:
+            self._relogio = time.perf_counter() - self.instante
+            return
+        espera = self._relogio + self.instante - time.perf_counter()
+        if espera > 0.0:
+            time.sleep(espera)
+
+    def confere(self, planetario):
+        """Se o estado final bate com o gravado (None se a gravação não tem resumo ou não chegou ao fim)."""
+        if not self.terminou:
+            # O quadro com o pedido para fechar é o último: falta só ler o resumo
+            self.ritmo_real = False
+            if self.proximo_quadro() is not None:
+                return None
+        if self.resumo_final is None:
+            return None
+        return resumo_estado(planetario) == self.resumo_final
+
+def reproduzir_rapido(caminho):
+    """
+    Reproduz a gravação sem janela e sem desenhar, o mais rápido possível
+    (mesma ordem de eventos, teclas e atualização do laço de `Jogo.executar`).
+    Retorna (planetario, reproducao).
+    """
+    from src.app.planetario import Planetario
+
+    rep = Reproducao(caminho, ritmo_real=False)
+    planetario = Planetario(grafico=False)
+    restaurar_estado(planetario, rep.cabecalho['estado'])
+    planetario.agora = rep.agora
+    ajuda = rep.cabecalho['ajuda']
+    tamanho = (rep.cabecalho['largura'], rep.cabecalho['altura'])
+
+    while True:
+        dt = rep.proximo_quadro()
+        if dt is None:
+            break
+        # Como na janela: o tamanho vale a partir do quadro seguinte ao redimensionamento
+        planetario.camera.definir_viewport(*tamanho)
+        for evento in rep.eventos:
+            if evento.type == pygame.VIDEORESIZE:
+                tamanho = (evento.w, evento.h)
+            elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_ESCAPE:
+                ajuda = not ajuda
+            elif evento.type == pygame.KEYDOWN and evento.key == pygame.K_F3:
+                pass    # painel de desempenho: não muda a simulação
+            elif evento.type != pygame.QUIT:
+                planetario.processar_evento(evento)
+        if not ajuda:
+            planetario.processar_input(rep.teclas)
+            fator = 5.0 if rep.teclas[pygame.K_c] else 1.0
+            planetario.atualizar(dt, fator_velocidade=fator)
+        planetario.atualizar_camera(dt)
+    return planetario, rep
@@ -0,0 +1,358 @@
+# src/app/gravidade.py
+# Gravitação de N corpos com integrador simplético (leapfrog
+# kick-drift-kick) sobre arrays NumPy.
+#
+# Cada corpo tem um parâmetro gravitacional μ = G·m. Corpos com μ = 0 são
+# partículas de teste: sentem a gravidade, mas não a exercem. O custo de
+# cada avaliação é (alvos × fontes): até `limite_barnes_hut` fontes a soma é
+# direta (exata); acima disso, as fontes vão para uma octree de
+# Barnes-Hut e cada alvo percorre só as células que o critério de abertura
+# exige (~ log N por alvo).
+#
+# A octree é linear: as fontes são ordenadas pelo código de Morton e cada
+# nível vira uma lista de células contíguas (massa e centro de massa por
+# `reduceat`). O percurso é feito nível a nível para todos os alvos de uma
+# vez, com pares (alvo, célula) em arrays, sem recursão em Python.
+
+import numpy as np
+
+from src.config import LIMITE_BARNES_HUT
+
+# Parâmetro de abertura de Barnes-Hut (tamanho da célula / distância)
+THETA = 0.5
+
+# Profundidade máxima da octree (códigos de Morton de 3 * 10 bits)
+NIVEIS = 10
+
+# Alvos por bloco no percurso da octree
+ALVOS_POR_BLOCO = 4096
+
+# Parâmetro gravitacional do Sol em UA³/dia² (quadrado da constante gaussiana k)
+GM_SOL = 0.01720209895 ** 2
+
+# Massa do Sol / massa de cada corpo (a Lua a partir da razão Terra/Lua)
+RAZAO_MASSA_SOL = {
+    'mercury': 6023600.0,
+    'venus': 408523.71,
+    'earth': 332946.05,
+    'moon': 332946.05 * 81.30057,
+    'mars': 3098703.59,
+    'jupiter': 1047.3486,
+    'saturn': 3497.898,
+    'uranus': 22902.98,
+    'neptune': 19412.24,
+}
+
+# Meio intervalo (dias) das diferenças centrais que estimam as velocidades das efemérides
+PASSO_VELOCIDADE = 0.05
+
+def _espalhar_bits(x):
+    """Intercala 2 zeros entre os 10 bits menos significativos de cada valor (Morton 3D)."""
+    x = x.astype(np.uint64) & np.uint64(0x3FF)
+    x = (x | (x << np.uint64(16))) & np.uint64(0x30000FF)
+    x = (x | (x << np.uint64(8))) & np.uint64(0x300F00F)
+    x = (x | (x << np.uint64(4))) & np.uint64(0x30C30C3)
+    x = (x | (x << np.uint64(2))) & np.uint64(0x9249249)
+    return x
+
+class ArvoreOctal:
+    """
+    Octree de Barnes-Hut construída sobre as fontes (posições e μ > 0).
+    `campo(alvos)` devolve a aceleração (T, 3) e, se pedido, o potencial (T,).
+    """
+    def __init__(self, posicoes, mu, niveis=NIVEIS):
+        posicoes = np.asarray(posicoes, dtype=np.float64)
+        mu = np.asarray(mu, dtype=np.float64)
+        self.niveis = niveis
+
+        minimo = posicoes.min(axis=0)
+        tamanho = float((posicoes.max(axis=0) - minimo).max()) * 1.0001 + 1e-12
+        celulas = 1 << niveis
+        q = np.clip(((posicoes - minimo) * (celulas / tamanho)).astype(np.int64), 0, celulas - 1)
+        codigos = _espalhar_bits(q[:, 0]) | (_espalhar_bits(q[:, 1]) << np.uint64(1)) \
+            | (_espalhar_bits(q[:, 2]) << np.uint64(2))
+        ordem = np.argsort(codigos, kind='stable')
+        codigos = codigos[ordem]
+        posicoes = posicoes[ordem]
+        mu = mu[ordem]
+        momento = posicoes * mu[:, None]
+        # Fontes na ordem de Morton: as do último nível são somadas uma a uma
+        self.posicoes = np.ascontiguousarray(posicoes.T)
+        self.mu_fontes = mu
+
+        # Por nível: chave, massa (μ), centro de massa, quantidade de fontes e filhos
+        self.tamanhos = [tamanho / (1 << nivel) for nivel in range(niveis + 1)]
+        self.mu, self.centros, self.contagens = [], [], []
+        self.filhos_inicio, self.filhos_fim = [], []
+        chaves_anteriores = None
+        for nivel in range(niveis + 1):
+            chaves = codigos >> np.uint64(3 * (niveis - nivel))
+            inicios = np.concatenate(([0], np.flatnonzero(chaves[1:] != chaves[:-1]) + 1))
+            massa = np.add.reduceat(mu, inicios)
+            contagens = np.diff(np.append(inicios, len(codigos)))
+            self.mu.append(massa)
+            # Centros em (3, células): gathers e contas por eixo são contíguos
+            centros = np.ascontiguousarray((np.add.reduceat(momento, inicios) / massa[:, None]).T)
+            # Célula com uma fonte: a posição exata (Σμx/Σμ pode diferir no último bit,
+            # e a própria fonte deixaria de ter distância zero)
+            unicas = contagens == 1
+            centros[:, unicas] = self.posicoes[:, inicios[unicas]]
+            self.centros.append(centros)
+            self.contagens.append(contagens)
+            if nivel == niveis:
+                self.fontes_inicio = inicios
+            chaves = chaves[inicios]
+            if chaves_anteriores is not None:
+                # Filhos de cada célula do nível anterior: faixa contígua neste nível
+                pais = chaves >> np.uint64(3)
+                self.filhos_inicio.append(np.searchsorted(pais, chaves_anteriores, 'left'))
+                self.filhos_fim.append(np.searchsorted(pais, chaves_anteriores, 'right'))
+            chaves_anteriores = chaves
+
+    def campo(self, alvos, theta=THETA, suavizacao2=0.0, potencial=False):
+        alvos = np.ascontiguousarray(np.asarray(alvos, dtype=np.float64).T)
+        aceleracao = np.zeros_like(alvos)
+        pot = np.zeros(alvos.shape[1]) if potencial else None
+        for inicio in range(0, alvos.shape[1], ALVOS_POR_BLOCO):
+            fim = min(inicio + ALVOS_POR_BLOCO, alvos.shape[1])
+            self._percorrer(alvos[:, inicio:fim], theta * theta, suavizacao2,
+                            aceleracao[:, inicio:fim], None if pot is None else pot[inicio:fim])
+        return aceleracao.T, pot
+
+    def _percorrer(self, alvos, theta2, suavizacao2, aceleracao, pot):
+        """Percorre a árvore nível a nível para um bloco de alvos (3, T) (acumula nas saídas)."""
+        n = alvos.shape[1]
+        t = np.arange(n)
+        c = np.zeros(n, dtype=np.int64)    # todos começam na raiz
+        for nivel in range(self.niveis + 1):
+            d = self.centros[nivel][:, c]
+            d -= alvos[:, t]
+            r2 = d[0] * d[0]
+            r2 += d[1] * d[1]
+            r2 += d[2] * d[2]
+            # Aceita a célula como um ponto se está longe o bastante ou se tem uma
+            # só fonte (exato)
+            aceita = (self.contagens[nivel][c] == 1) | (self.tamanhos[nivel] ** 2 < theta2 * r2)
+            if aceita.any():
+                self._acumular(t[aceita], d[:, aceita], r2[aceita], self.mu[nivel][c[aceita]],
+                               suavizacao2, aceleracao, pot)
+
+            abre = ~aceita
+            if not abre.any():
+                break
+            t, c = t[abre], c[abre]
+            if nivel == self.niveis:
+                # Folhas com várias fontes (mais próximas que a resolução da árvore): soma direta
+                quantidades = self.contagens[nivel][c]
+                t = np.repeat(t, quantidades)
+                f = np.repeat(self.fontes_inicio[c] - np.cumsum(quantidades) + quantidades, quantidades) \
+                    + np.arange(len(t))
+                d = self.posicoes[:, f] - alvos[:, t]
+                r2 = d[0] * d[0] + d[1] * d[1] + d[2] * d[2]
+                self._acumular(t, d, r2, self.mu_fontes[f], suavizacao2, aceleracao, pot)
+                break
+            # Substitui cada par (alvo, célula) aberto pelos pares com os filhos
+            inicios = self.filhos_inicio[nivel][c]
+            quantidades = self.filhos_fim[nivel][c] - inicios
+            t = np.repeat(t, quantidades)
+            deslocamento = np.repeat(inicios - np.cumsum(quantidades) + quantidades, quantidades)
+            c = deslocamento + np.arange(len(t))
+
+    @staticmethod
+    def _acumular(t, d, r2, mu, suavizacao2, aceleracao, pot):
+        """Soma nas saídas a contribuição dos pares (alvo `t`, ponto a `d` de distância e massa `mu`)."""
+        n = aceleracao.shape[1]
+        r2s = r2 + suavizacao2
+        # A própria fonte (distância zero) não contribui
+        inv = np.divide(mu, np.sqrt(r2s), out=np.zeros_like(r2s), where=r2s > 0.0)
+        if pot is not None:
+            pot -= np.bincount(t, weights=inv, minlength=n)
+        np.divide(inv, r2s, out=inv, where=r2s > 0.0)
+        for k in range(3):
+            aceleracao[k] += np.bincount(t, weights=d[k] * inv, minlength=n)
+
+def campo_direto(alvos, fontes, mu, suavizacao2=0.0, potencial=False):
+    """
+    Aceleração (T, 3) e potencial (T,) por soma direta sobre todas as fontes.
+    Um laço por fonte, vetorizado nos alvos, com as coordenadas separadas
+    (3, T): operações contíguas de um eixo custam bem menos que broadcasts
+    sobre (T, 3), e não há arrays temporários (T, S).
+    """
+    alvos = np.ascontiguousarray(np.asarray(alvos, dtype=np.float64).T)
+    aceleracao = np.zeros_like(alvos)
+    pot = np.zeros(alvos.shape[1]) if potencial else None
+    d = np.empty_like(alvos)
+    r2 = np.empty(alvos.shape[1])
+    inv = np.empty_like(r2)
+    for fonte, m in zip(np.asarray(fontes, dtype=np.float64), mu):
+        np.subtract(fonte[:, None], alvos, out=d)
+        np.multiply(d[0], d[0], out=r2)
+        r2 += d[1] * d[1]
+        r2 += d[2] * d[2]
+        r2 += suavizacao2
+        # A própria fonte (distância zero) não contribui
+        np.sqrt(r2, out=inv)
+        np.divide(m, inv, out=inv, where=r2 > 0.0)
+        inv[r2 <= 0.0] = 0.0
+        if pot is not None:
+            pot -= inv
+        np.divide(inv, r2, out=inv, where=r2 > 0.0)
+        d *= inv
+        aceleracao += d
+    return aceleracao.T, pot
+
+def estado_kepleriano(a, e, i, raan, argp, M, mu):
+    """
+    Posições e velocidades (N, 3) em órbitas Keplerianas ao redor de um corpo
+    central de parâmetro `mu` (elementos em radianos; mesmo referencial dos
+    ângulos, ex.: eclíptica).
+    """
+    a, e, i, raan, argp, M = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=np.float64))
+                                                   for v in (a, e, i, raan, argp, M)))
+    E = M + e * np.sin(M)
+    for _ in range(30):
+        dE = (E - e * np.sin(E) - M) / (1.0 - e * np.cos(E))
+        E = E - dE
+        if np.abs(dE).max(initial=0.0) < 1e-13:
+            break
+    cE, sE = np.cos(E), np.sin(E)
+    b = a * np.sqrt(1.0 - e * e)
+    n = np.sqrt(mu / a ** 3)
+    x, y = a * (cE - e), b * sE
+    E_ponto = n / (1.0 - e * cE)
+    vx, vy = -a * sE * E_ponto, b * cE * E_ponto
+
+    cO, sO, cw, sw, ci, si = np.cos(raan), np.sin(raan), np.cos(argp), np.sin(argp), np.cos(i), np.sin(i)
+    P = np.stack([cO * cw - sO * sw * ci, sO * cw + cO * sw * ci, sw * si], axis=-1)
+    Q = np.stack([-cO * sw - sO * cw * ci, -sO * sw + cO * cw * ci, cw * si], axis=-1)
+    return x[:, None] * P + y[:, None] * Q, vx[:, None] * P + vy[:, None] * Q
+
+class SistemaGravitacional:
+    """
+    Estado (posições, velocidades, μ) de N corpos e o integrador leapfrog.
+
+        sistema = SistemaGravitacional(posicoes, velocidades, mu)
+        sistema.avancar(dt, passos)
+        sistema.deriva_energia()     # |E - E0| / |E0| desde a criação (ou `reiniciar_energia`)
+
+    Leapfrog (KDK) com passo fixo é simplético: o erro de energia oscila sem
+    crescer de forma sistemática, e cai com dt². A aceleração do fim de um
+    passo é reaproveitada no início do próximo (uma avaliação por passo).
+
+    `suavizacao` (mesma unidade das posições) evita forças infinitas em
+    encontros próximos; `theta` e `limite_barnes_hut` trocam precisão por
+    velocidade quando há muitas fontes.
+    """
+    def __init__(self, posicoes, velocidades, mu, suavizacao=0.0, theta=THETA,
+                 limite_barnes_hut=LIMITE_BARNES_HUT):
+        self.posicoes = np.array(posicoes, dtype=np.float64).reshape(-1, 3)
+        self.velocidades = np.array(velocidades, dtype=np.float64).reshape(-1, 3)
+        self.mu = np.array(mu, dtype=np.float64).reshape(-1)
+        self.suavizacao = float(suavizacao)
+        self.theta = float(theta)
+        self.limite_barnes_hut = int(limite_barnes_hut)
+        self.tempo = 0.0
+        self.passos = 0
+
+        self._fontes = np.flatnonzero(self.mu > 0.0)
+        self._aceleracao = None
+        self.energia_inicial = self.energia()
+
+    def __len__(self):
+        return len(self.mu)
+
+    @property
+    def metodo(self):
+        """'direta' ou 'barnes-hut', conforme a quantidade de fontes."""
+        return 'direta' if len(self._fontes) <= self.limite_barnes_hut else 'barnes-hut'
+
+    @property
+    def quantidade_fontes(self):
+        """Corpos com massa (os demais são partículas de teste)."""
+        return len(self._fontes)
+
+    def _campo(self, alvos, potencial=False):
+        """Aceleração (e potencial) produzidos pelas fontes nos pontos `alvos` (T, 3)."""
+        fontes = self.posicoes[self._fontes]
+        mu = self.mu[self._fontes]
+        suavizacao2 = self.suavizacao ** 2
+        if self.metodo == 'direta':
+            return campo_direto(alvos, fontes, mu, suavizacao2, potencial)
+        return ArvoreOctal(fontes, mu).campo(alvos, self.theta, suavizacao2, potencial)
+
+    def aceleracoes(self):
+        """Aceleração gravitacional (N, 3) de cada corpo na configuração atual."""
+        return self._campo(self.posicoes)[0]
+
+    def passo(self, dt):
+        """Um passo kick-drift-kick de duração `dt`."""
+        if self._aceleracao is None:
+            self._aceleracao = self.aceleracoes()
+        self.velocidades += self._aceleracao * (0.5 * dt)
+        self.posicoes += self.velocidades * dt
+        self._aceleracao = self.aceleracoes()
+        self.velocidades += self._aceleracao * (0.5 * dt)
+        self.tempo += dt
+        self.passos += 1
+
+    def avancar(self, dt, passos):
+        for _ in range(int(passos)):
+            self.passo(dt)
+
+    def energia(self):
+        """
+        Energia total vezes G (cinética + potencial, só dos corpos com massa;
+        partículas de teste não contam).
+        """
+        fontes = self._fontes
+        if len(fontes) == 0:
+            return 0.0
+        v2 = np.einsum('ij,ij->i', self.velocidades[fontes], self.velocidades[fontes])
+        cinetica = 0.5 * float(np.dot(self.mu[fontes], v2))
+        # Potencial só nas fontes: cada par aparece duas vezes na soma
+        _, pot = self._campo(self.posicoes[fontes], potencial=True)
+        return cinetica + 0.5 * float(np.dot(self.mu[fontes], pot))
+
+    def reiniciar_energia(self):
+        self.energia_inicial = self.energia()
+
+    def deriva_energia(self):
+        """Erro relativo de energia acumulado: |E - E0| / |E0|."""
+        if self.energia_inicial == 0.0:
+            return 0.0
+        return abs(self.energia() - self.energia_inicial) / abs(self.energia_inicial)
+
+def estado_efemerides(efemerides, jd, nomes):
+    """
+    Estado inicial do Sol e dos corpos `nomes` da tabela de efemérides em `jd`:
+    posições (UA) e velocidades (UA/dia) (N+1, 3) no referencial do
+    baricentro, e μ (N+1,) em UA³/dia². O Sol é o índice 0.
+
+    Um corpo tabelado relativo a outro (a Lua, relativa à Terra) forma um par
+    cujo baricentro é o que a tabela traz para o centro (os elementos de
+    Standish são do baricentro Terra-Lua): os dois são separados pela razão
+    das massas.
+    """
+    h = PASSO_VELOCIDADE
+    amostras = efemerides.posicoes(np.array([jd - h, jd, jd + h]), nomes)      # (3, N, 3)
+    mu = np.array([GM_SOL] + [GM_SOL / RAZAO_MASSA_SOL[nome] for nome in nomes])
+    indices = {nome: k for k, nome in enumerate(nomes)}
+    for k, nome in enumerate(nomes):
+        centro = efemerides.centros[efemerides.indice(nome)]
+        if centro is None:
+            continue
+        c = indices[centro]
+        relativa = amostras[:, k].copy()
+        fracao = mu[k + 1] / (mu[k + 1] + mu[c + 1])
+        amostras[:, k] = amostras[:, c] + (1.0 - fracao) * relativa
+        amostras[:, c] -= fracao * relativa
+
+    posicoes = np.zeros((len(nomes) + 1, 3))
+    velocidades = np.zeros((len(nomes) + 1, 3))
+    posicoes[1:] = amostras[1]
+    velocidades[1:] = (amostras[2] - amostras[0]) / (2.0 * h)
+
+    # Centro de massa parado na origem (senão o sistema inteiro deriva)
+    posicoes -= mu @ posicoes / mu.sum()
+    velocidades -= mu @ velocidades / mu.sum()
+    return posicoes, velocidades, mu
@@ -0,0 +1,95 @@
+# src/app/headless.py
+# Modo sem janela: renderiza o Planetário fora da tela para gerar quadros em lote
+# (CI, servidores de renderização). Não há limite de FPS: cada quadro é
+# desenhado assim que o anterior termina.
+
+import os
+
+import numpy as np
+import pygame
+
+from src.config import PASSO_SIMULACAO
+from src.app.offscreen import criar_contexto, AlvoOffscreen
+from src.app.captura import CapturaQuadros
+from src.app.planetario import Planetario
+
+class RenderizadorHeadless:
+    """
+    Cria o contexto offscreen, o FBO e o Planetário (com todas as texturas já
+    carregadas, para que os quadros sejam determinísticos).
+
+    Uso:
+        r = RenderizadorHeadless(1280, 720)
+        for quadro in r.quadros(120):        # arrays (altura, largura, 3) uint8
+            ...
+        r.salvar("saida/", 120, inicio=0, fim=360)   # ou "voo.y4m"
+        r.encerrar()
+    """
+    def __init__(self, largura, altura):
+        self.largura = int(largura)
+        self.altura = int(altura)
+        # O Planetário precisa de um contexto corrente já no construtor
+        criar_contexto(self.largura, self.altura)
+        self.alvo = AlvoOffscreen(self.largura, self.altura)
+
+        self.planetario = Planetario()
+        self.planetario.texturas.concluir()
+
+    def _desenhar(self):
+        """Desenha o estado atual no FBO."""
+        self.alvo.ativar()
+        self.planetario.config_camera_projecao(self.largura, self.altura)
+        self.planetario.renderizar()
+        self.alvo.desativar()
+
+    def renderizar(self):
+        """Desenha o estado atual no FBO e devolve a imagem."""
+        self._desenhar()
+        return self.alvo.ler()
+
+    def _passos(self, quantidade, dt=PASSO_SIMULACAO, inicio=None, fim=None):
+        """
+        Leva a simulação ao estado de cada um dos `quantidade` quadros.
+        - Com `inicio`/`fim`: tempos de simulação igualmente espaçados no intervalo.
+        - Sem eles: avança o relógio `dt` segundos (tempo simulado de quadro, não
+          o tempo real) a cada quadro, a partir do tempo atual.
+        """
+        if inicio is not None or fim is not None:
+            inicio = self.planetario.angle if inicio is None else inicio
+            fim = inicio if fim is None else fim
+            for tempo in np.linspace(inicio, fim, quantidade):
+                self.planetario.definir_tempo(tempo)
+                yield
+            return
+
+        for _ in range(quantidade):
+            self.planetario.atualizar(dt)
+            yield
+
+    def quadros(self, quantidade, **kwargs):
+        """Gera `quantidade` quadros (argumentos como em `_passos`)."""
+        for _ in self._passos(quantidade, **kwargs):
+            yield self.renderizar()
+
+    def salvar(self, destino, quantidade, prefixo="quadro", **kwargs):
+        """
+        Grava os quadros em `destino`: pasta de PNG ou vídeo `.y4m` (ver `CapturaQuadros`).
+        A leitura do FBO é assíncrona e a codificação roda em threads, em paralelo
+        com os próximos quadros; nenhum quadro é descartado. Retorna os arquivos gravados.
+        """
+        captura = CapturaQuadros(destino, descartar=False, prefixo=prefixo)
+        try:
+            for _ in self._passos(quantidade, **kwargs):
+                self._desenhar()
+                captura.capturar(self.largura, self.altura, self.alvo.fbo)
+        finally:
+            captura.encerrar()
+        if captura.video:
+            return [destino]
+        return [os.path.join(destino, f"{prefixo}_{n:05d}.png") for n in range(captura.capturados)]
+
+    def encerrar(self):
+        """Libera o FBO e as threads de textura."""
+        self.planetario.texturas.encerrar()
+        self.alvo.liberar()
+        pygame.quit()
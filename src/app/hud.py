@@ -0,0 +1,105 @@
+# src/app/hud.py
+# Painel de desempenho (HUD) no canto da tela.
+# O texto é recalculado poucas vezes por segundo (para ficar legível) e
+# desenhado todo quadro pelo atlas de glifos, junto com o fundo, em uma chamada.
+
+import time
+
+from OpenGL.GL import *
+from OpenGL.GLU import *
+
+from src.config import JANELA_HUD
+from src.formas.texto import obter_atlas
+
+# Intervalo (s) entre atualizações do texto
+INTERVALO_HUD = 0.25
+
+class HudDesempenho:
+    """Mostra média/p95/p99 de cada fase do `Perfilador` e os contadores de desenho."""
+    def __init__(self, perfilador, janela=JANELA_HUD, intervalo=INTERVALO_HUD):
+        self.perfilador = perfilador
+        self.janela = janela
+        self.intervalo = intervalo
+        self.visivel = False
+        # Quadros não desenhados pelo modo ocioso (atualizado pelo loop do jogo)
+        self.quadros_pulados = 0
+        # Escala da resolução dinâmica da cena (também atualizada pelo loop)
+        self.escala_resolucao = 1.0
+        # Data simulada (texto) no modo de data real, ou None
+        self.data = None
+        # Sistema da física de N corpos (`SistemaGravitacional`), se ligada
+        self.fisica = None
+        # Captura de quadros (`CapturaQuadros`), se ligada
+        self.captura = None
+
+        self._linhas_atuais = None
+        self._ultima_atualizacao = 0.0
+
+    def alternar(self):
+        self.visivel = not self.visivel
+
+    def desenhar(self, width, height):
+        """Desenha o painel no canto superior esquerdo (atualiza o texto se necessário)."""
+        if not self.visivel:
+            return
+
+        agora = time.perf_counter()
+        if self._linhas_atuais is None or agora - self._ultima_atualizacao >= self.intervalo:
+            self._linhas_atuais = self._linhas()
+            self._ultima_atualizacao = agora
+
+        atlas = obter_atlas("monospace", 14, True)
+        linhas = self._linhas_atuais
+        painel_w = max(atlas.medir(linha)[0] for linha in linhas) + 16
+        painel_h = atlas.altura_linha * len(linhas) + 12
+        x, y = 10, height - painel_h - 10
+
+        # Fundo e texto no mesmo lote
+        atlas.adicionar_retangulo(x, y, painel_w, painel_h, (0.0, 0.0, 0.0, 0.67))
+        primeira = y + painel_h - 6 - atlas.altura_linha
+        atlas.adicionar("\n".join(linhas), x + 8, primeira, (0.7, 1.0, 0.7, 1.0))
+
+        glMatrixMode(GL_PROJECTION)
+        glPushMatrix()
+        glLoadIdentity()
+        gluOrtho2D(0, width, 0, height)
+        glMatrixMode(GL_MODELVIEW)
+        glPushMatrix()
+        glLoadIdentity()
+
+        atlas.desenhar()
+
+        glPopMatrix()
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+
+    def _linhas(self):
+        """Texto do painel a partir da janela recente do perfilador."""
+        fases, contadores = self.perfilador.resumo(self.janela)
+        if not fases:
+            return ["Coletando..."]
+
+        media_total = fases['total'][0]
+        fps = 1000.0 / media_total if media_total > 0 else 0.0
+        linhas = [f"{fps:6.1f} FPS   (últimos {min(self.janela, self.perfilador.quadros)} quadros)",
+                  f"{'fase':<11}{'média':>8}{'p95':>8}{'p99':>8}  ms"]
+        for nome, (media, p95, p99) in fases.items():
+            linhas.append(f"{nome:<11}{media:8.2f}{p95:8.2f}{p99:8.2f}")
+        linhas.append("")
+        linhas.append(f"chamadas {contadores['chamadas_desenho']:.0f}   binds {contadores['binds_textura']:.0f}"
+                      f"   estados evitados {contadores['estados_evitados']:.0f}")
+        linhas.append(f"vértices {contadores['vertices']:,.0f}   triângulos {contadores['triangulos']:,.0f}")
+        linhas.append(f"ocioso: {self.quadros_pulados:,} quadros pulados   resolução {self.escala_resolucao:.2f}x")
+        if self.data:
+            linhas.append(f"data: {self.data}")
+        if self.captura is not None:
+            captura = self.captura
+            linhas.append(f"captura: {captura.capturados:,} quadros   {captura.descartados:,} descartados"
+                          f"   fila {captura.fila}")
+        if self.fisica is not None:
+            sistema = self.fisica
+            linhas.append(f"física: {sistema.metodo}   {sistema.quantidade_fontes} corpos"
+                          f" + {len(sistema) - sistema.quantidade_fontes:,} partículas")
+            linhas.append(f"        {sistema.passos:,} passos   deriva de energia {sistema.deriva_energia():.1e}")
+        return linhas
@@ -0,0 +1,194 @@
+# src/app/kepler.py
+# Motor de órbitas Keplerianas vetorizado.
+# Guarda os elementos orbitais de N corpos em arrays NumPy contíguos e resolve
+# a Equação de Kepler (M = E - e*sen(E)) para todos de uma vez.
+
+import numpy as np
+
+# Limite fixo de iterações de Newton por quadro (evita custo imprevisível)
+ITERACOES_MAX = 6
+
+# Tolerância em radianos para encerrar as iterações antes do limite
+# (próxima da precisão de float32, usada no cálculo por quadro)
+TOLERANCIA = 1e-6
+
+def vetores_orbitais(i, raan, argp):
+    """
+    Vetores unitários P (direção do periastro) e Q (90° adiante no plano da
+    órbita), como arrays (N, 3) em coordenadas da cena.
+    """
+    cO, sO = np.cos(raan), np.sin(raan)
+    cw, sw = np.cos(argp), np.sin(argp)
+    ci, si = np.cos(i), np.sin(i)
+    px = cO * cw - sO * sw * ci
+    py = sO * cw + cO * sw * ci
+    pz = sw * si
+    qx = -cO * sw - sO * cw * ci
+    qy = -sO * sw + cO * cw * ci
+    qz = cw * si
+
+    # Eclíptica (x, y, z) -> cena (x, z, -y): plano orbital vira XZ, Y para cima
+    P = np.stack(np.broadcast_arrays(px, pz, -py), axis=-1).reshape(-1, 3)
+    Q = np.stack(np.broadcast_arrays(qx, qz, -qy), axis=-1).reshape(-1, 3)
+    return P, Q
+
+class MotorOrbital:
+    """
+    Calcula posições (N, 3) a partir de elementos orbitais clássicos:
+      a (semi-eixo maior), e (excentricidade), i (inclinação),
+      Ω (longitude do nodo ascendente), ω (argumento do periastro),
+      M0 (anomalia média em t=0) e período.
+
+    Ângulos em radianos. O período e o tempo de `posicoes` usam a mesma
+    unidade (ex.: unidades de `Planetario.angle`). O plano de referência
+    (eclíptica) é o plano XZ da cena, com Y para cima; órbitas com período
+    positivo giram no mesmo sentido de glRotatef(+θ, 0, 1, 0).
+
+    Os elementos ficam em float64 e a anomalia média é reduzida em float64
+    (tempos grandes não perdem precisão); a solução de Kepler e as posições
+    são float32, prontas para envio ao OpenGL e bem mais rápidas em sen/cos.
+    """
+    def __init__(self, iteracoes_max=ITERACOES_MAX, tolerancia=TOLERANCIA):
+        self.iteracoes_max = int(iteracoes_max)
+        self.tolerancia = float(tolerancia)
+
+        # Elementos orbitais (um elemento por corpo)
+        self.a = np.zeros(0)
+        self.e = np.zeros(0)
+        self.i = np.zeros(0)
+        self.raan = np.zeros(0)
+        self.argp = np.zeros(0)
+        self.m0 = np.zeros(0)
+        self.periodo = np.zeros(0)
+
+        # Quantas iterações o último `posicoes` precisou (diagnóstico)
+        self.iteracoes_usadas = 0
+
+        self._preparar()
+
+    def __len__(self):
+        return len(self.a)
+
+    def adicionar(self, a, e, i, raan, argp, m0, periodo):
+        """
+        Adiciona um ou vários corpos (escalares ou arrays do mesmo tamanho).
+        Retorna o intervalo de índices ocupado pelos novos corpos.
+        """
+        novos = np.broadcast_arrays(*[np.atleast_1d(np.asarray(v, dtype=np.float64))
+                                      for v in (a, e, i, raan, argp, m0, periodo)])
+        if np.any((novos[1] < 0.0) | (novos[1] >= 1.0)):
+            raise ValueError("Excentricidade deve estar em [0, 1) (apenas órbitas elípticas)")
+        if np.any(novos[6] == 0.0):
+            raise ValueError("Período orbital não pode ser zero")
+
+        inicio = len(self.a)
+        self.a, self.e, self.i, self.raan, self.argp, self.m0, self.periodo = [
+            np.ascontiguousarray(np.concatenate([atual, novo]))
+            for atual, novo in zip((self.a, self.e, self.i, self.raan, self.argp, self.m0, self.periodo), novos)
+        ]
+        self._preparar()
+        return range(inicio, len(self.a))
+
+    def _preparar(self):
+        """Pré-calcula tudo o que não depende do tempo e aloca os buffers."""
+        n = len(self.a)
+
+        # Movimento médio (rad por unidade de tempo) e semi-eixo menor
+        self._n = 2.0 * np.pi / self.periodo if n else np.zeros(0)
+        self._b = self.a * np.sqrt(1.0 - self.e * self.e)
+
+        # Vetores P e Q do plano de cada órbita, já em coordenadas da cena
+        P, Q = vetores_orbitais(self.i, self.raan, self.argp)
+        self._P = P.astype(np.float32)
+        self._Q = Q.astype(np.float32)
+
+        # Cópias float32 usadas no cálculo por quadro
+        self._e32 = self.e.astype(np.float32)
+        self._a32 = self.a.astype(np.float32)
+        self._b32 = self._b.astype(np.float32)
+
+        # Buffers reaproveitados a cada quadro (sem alocação no caminho quente)
+        self._M64 = np.empty(n)
+        self._voltas = np.empty(n)
+        f32 = np.float32
+        self._M = np.empty(n, dtype=f32)
+        self._E = np.empty(n, dtype=f32)
+        self._sen = np.empty(n, dtype=f32)
+        self._cos = np.empty(n, dtype=f32)
+        self._f = np.empty(n, dtype=f32)
+        self._df = np.empty(n, dtype=f32)
+        self._x = np.empty(n, dtype=f32)
+        self._y = np.empty(n, dtype=f32)
+        self._tmp = np.empty((n, 3), dtype=f32)
+        self.saida = np.empty((n, 3), dtype=f32)
+
+    def anomalias_excentricas(self, tempo):
+        """Resolve a Equação de Kepler e retorna E (N,) para o instante `tempo`."""
+        M, E, sen, cos, f, df = self._M, self._E, self._sen, self._cos, self._f, self._df
+        e = self._e32
+
+        # Anomalia média reduzida a [-π, π] em float64 (M - 2π * round(M / 2π))
+        M64, voltas = self._M64, self._voltas
+        np.multiply(self._n, tempo, out=M64)
+        M64 += self.m0
+        np.multiply(M64, 1.0 / (2.0 * np.pi), out=voltas)
+        np.rint(voltas, out=voltas)
+        voltas *= 2.0 * np.pi
+        M64 -= voltas
+        M[:] = M64
+
+        # Chute inicial de 3ª ordem: E0 = M + e*sen(M)*(1 + e*cos(M))
+        np.sin(M, out=sen)
+        np.cos(M, out=cos)
+        np.multiply(e, cos, out=f)
+        f += 1.0
+        f *= sen
+        f *= e
+        np.add(M, f, out=E)
+
+        self.iteracoes_usadas = 0
+        for _ in range(self.iteracoes_max):
+            np.sin(E, out=sen)
+            np.cos(E, out=cos)
+
+            # Newton: ΔE = -(E - e*sen(E) - M) / (1 - e*cos(E))
+            np.multiply(e, sen, out=f)
+            np.subtract(E, f, out=f)
+            f -= M
+            np.multiply(e, cos, out=df)
+            np.subtract(1.0, df, out=df)
+            f /= df
+            E -= f
+            self.iteracoes_usadas += 1
+
+            if np.abs(f).max() < self.tolerancia:
+                break
+
+        # Ajusta sen/cos para o último passo (pequeno) sem novas chamadas trigonométricas:
+        # sen(E - Δ) ≈ sen(E) - Δ*cos(E), cos(E - Δ) ≈ cos(E) + Δ*sen(E)
+        np.multiply(f, cos, out=df)
+        np.multiply(f, sen, out=M)
+        sen -= df
+        cos += M
+        return E
+
+    def posicoes(self, tempo):
+        """
+        Posições (N, 3) de todos os corpos no instante `tempo`, relativas ao
+        foco de cada órbita. O array retornado é reutilizado na próxima chamada.
+        """
+        if len(self.a) == 0:
+            return self.saida
+
+        self.anomalias_excentricas(tempo)
+
+        # Coordenadas no plano da órbita: x = a(cos E - e), y = b sen E
+        np.subtract(self._cos, self._e32, out=self._x)
+        self._x *= self._a32
+        np.multiply(self._b32, self._sen, out=self._y)
+
+        # Posição = x*P + y*Q
+        np.multiply(self._x[:, None], self._P, out=self.saida)
+        np.multiply(self._y[:, None], self._Q, out=self._tmp)
+        self.saida += self._tmp
+        return self.saida
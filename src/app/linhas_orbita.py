@@ -0,0 +1,174 @@
+# src/app/linhas_orbita.py
+# Linhas de órbita pré-calculadas.
+# Cada órbita vira uma polilinha fechada gerada uma única vez (circular, excêntrica
+# ou inclinada); todas ficam em um único array de vértices desenhado em uma chamada.
+
+import math
+import numpy as np
+from OpenGL.GL import *
+
+from src.app.kepler import vetores_orbitais
+from src.formas.buffers import BufferStreaming
+from src.formas.estado_gl import estado_gl
+
+# Faixa de segmentos por órbita (potências de 2 evitam reconstruções a cada quadro)
+SEGMENTOS_MIN = 16
+SEGMENTOS_MAX = 512
+
+# Erro máximo tolerado entre a curva e a polilinha, em pixels
+ERRO_PIXELS = 0.5
+
+# Cor das linhas de órbita (RGBA)
+COR_ORBITA = (0.5, 0.5, 0.5, 1.0)
+
+def gerar_orbita(a, e=0.0, i=0.0, raan=0.0, argp=0.0, segmentos=64):
+    """
+    Polilinha fechada (segmentos + 1, 3) de uma órbita elíptica centrada no foco.
+    Amostra a anomalia excêntrica uniformemente (mais pontos onde a curva é mais fechada).
+    """
+    E = np.linspace(0.0, 2.0 * np.pi, segmentos + 1)
+    x = a * (np.cos(E) - e)
+    y = a * math.sqrt(1.0 - e * e) * np.sin(E)
+    P, Q = vetores_orbitais(i, raan, argp)
+    pontos = x[:, None] * P + y[:, None] * Q
+    pontos[-1] = pontos[0]   # fecha o laço exatamente
+    return pontos.astype(np.float32)
+
+def segmentos_para_raio(raio_px):
+    """Quantidade de segmentos para um raio projetado (px), arredondada para potência de 2."""
+    # Flecha de um segmento ≈ R * (π/n)² / 2  ->  n = π * sqrt(R / (2 * erro))
+    n = math.pi * math.sqrt(max(raio_px, 1.0) / (2.0 * ERRO_PIXELS))
+    n = 2 ** math.ceil(math.log2(max(n, 1.0)))
+    return int(min(max(n, SEGMENTOS_MIN), SEGMENTOS_MAX))
+
+class LinhasOrbita:
+    """
+    Cache de geometria das linhas de órbita.
+
+    As polilinhas ficam no referencial do corpo pai. Órbitas ao redor do centro
+    (pai = -1) são copiadas para o array combinado só quando reconstruídas;
+    órbitas de luas são apenas transformadas pela matriz do pai a cada quadro.
+    """
+    def __init__(self):
+        self._nomes = []
+        self._indices = {}
+        self._parametros = []   # (a, e, i, raan, argp)
+        self._pais = []
+        self._segmentos = []
+        self._locais = []       # polilinhas no referencial do pai
+        self.visiveis = np.zeros(0, dtype=bool)
+
+        # Array combinado e trecho ocupado por cada órbita
+        self._vertices = np.zeros((0, 3), dtype=np.float32)
+        self._inicios = np.zeros(0, dtype=np.int32)
+        self._quantidades = np.zeros(0, dtype=np.int32)
+
+        self._reconstruir = True
+        self._enviar = True
+        self._buffer = None
+
+        # Estatística: quantas vezes a geometria foi regerada
+        self.reconstrucoes = 0
+
+    def __len__(self):
+        return len(self._nomes)
+
+    def definir(self, nome, a, e=0.0, i=0.0, raan=0.0, argp=0.0, pai=-1):
+        """Registra ou altera a órbita `nome`. Só invalida a geometria se algo mudou."""
+        parametros = (float(a), float(e), float(i), float(raan), float(argp))
+        k = self._indices.get(nome)
+        if k is None:
+            self._indices[nome] = len(self._nomes)
+            self._nomes.append(nome)
+            self._parametros.append(parametros)
+            self._pais.append(int(pai))
+            self._segmentos.append(0)
+            self._locais.append(None)
+            self.visiveis = np.append(self.visiveis, True)
+            self._reconstruir = True
+        elif self._parametros[k] != parametros or self._pais[k] != int(pai):
+            self._parametros[k] = parametros
+            self._pais[k] = int(pai)
+            self._locais[k] = None
+            self._reconstruir = True
+
+    def parametros(self):
+        """Parâmetros (M, 5) de todas as órbitas (a, e, i, Ω, ω), na ordem de registro."""
+        return np.array(self._parametros, dtype=np.float64).reshape(-1, 5)
+
+    def definir_parametros(self, parametros):
+        """Altera todas as órbitas já registradas de uma vez (mesma ordem de `parametros()`)."""
+        for nome, pai, valores in zip(self._nomes, self._pais, parametros):
+            self.definir(nome, *valores, pai=pai)
+
+    def esferas_limite(self, posicoes_pais):
+        """Centros (N, 3) e raios (N,) das esferas que envolvem cada órbita (raio do apoastro)."""
+        centros = np.array([posicoes_pais[pai] if pai >= 0 else np.zeros(3) for pai in self._pais]).reshape(-1, 3)
+        raios = np.array([a * (1.0 + e) for a, e, *_resto in self._parametros])
+        return centros, raios
+
+    def atualizar(self, matrizes_pais, posicoes_pais, olho, focal_px):
+        """
+        Prepara o array de vértices do quadro.
+          - matrizes_pais: matrizes (N, 4, 4) dos referenciais dos pais (índice = pai)
+          - posicoes_pais: posições (N, 3) dos centros dos pais
+          - olho: posição da câmera; focal_px: distância focal em pixels
+        """
+        olho = np.asarray(olho, dtype=np.float64)
+
+        # 1) Detalhamento conforme o tamanho na tela
+        for k, (a, *_resto) in enumerate(self._parametros):
+            pai = self._pais[k]
+            centro = posicoes_pais[pai] if pai >= 0 else np.zeros(3)
+            distancia = max(float(np.linalg.norm(olho - centro)), a * 0.5, 1.0)
+            segmentos = segmentos_para_raio(a * focal_px / distancia)
+            if segmentos != self._segmentos[k]:
+                self._segmentos[k] = segmentos
+                self._locais[k] = None
+                self._reconstruir = True
+
+        # 2) Regera apenas as polilinhas invalidadas e remonta o array combinado
+        if self._reconstruir:
+            for k, local in enumerate(self._locais):
+                if local is None:
+                    self._locais[k] = gerar_orbita(*self._parametros[k], segmentos=self._segmentos[k])
+                    self.reconstrucoes += 1
+
+            self._quantidades = np.array([len(p) for p in self._locais], dtype=np.int32)
+            self._inicios = np.concatenate([[0], np.cumsum(self._quantidades)[:-1]]).astype(np.int32)
+            self._vertices = np.concatenate(self._locais) if self._locais else np.zeros((0, 3), np.float32)
+            self._reconstruir = False
+            self._enviar = True
+
+        # 3) Órbitas com pai em movimento: transforma os pontos locais (sem regerar)
+        for k, pai in enumerate(self._pais):
+            if pai < 0:
+                continue
+            m = matrizes_pais[pai]
+            ini, qtd = self._inicios[k], self._quantidades[k]
+            self._vertices[ini:ini + qtd] = self._locais[k] @ m[:3, :3].T + m[:3, 3]
+            self._enviar = True
+
+    def desenhar(self):
+        """Desenha todas as órbitas visíveis em uma única chamada."""
+        if len(self._nomes) == 0:
+            return
+        if self._buffer is None:
+            self._buffer = BufferStreaming()
+        if self._enviar:
+            self._buffer.enviar(self._vertices)
+            self._enviar = False
+
+        estado_gl.empilhar()
+        estado_gl.desabilitar(GL_LIGHTING)
+        estado_gl.desabilitar(GL_TEXTURE_2D)
+        estado_gl.cor(*COR_ORBITA)
+        self._buffer.desenhar_multiplos(GL_LINE_STRIP, self._inicios[self.visiveis],
+                                        self._quantidades[self.visiveis])
+        estado_gl.desempilhar()
+
+    def liberar(self):
+        """Libera os recursos OpenGL."""
+        if self._buffer is not None:
+            self._buffer.liberar()
+            self._buffer = None
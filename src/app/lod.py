@@ -0,0 +1,66 @@
+# src/app/lod.py
+# Nível de detalhe (LOD) das esferas conforme o tamanho na tela.
+# Corpos pequenos/distantes usam tesselações mais simples; a troca de nível
+# tem histerese para não "piscar" quando o raio fica perto de um limite.
+
+import numpy as np
+
+from src.formas.malhas import cache_malhas
+from OpenGL.GLU import GLU_OUTSIDE
+
+# Níveis pré-construídos: (slices, stacks, raio máximo em pixels para usar o nível).
+# Silhueta com erro de ~0.5 px: slices ≈ π * sqrt(raio_px).
+NIVEIS_LOD = [
+    (12, 8, 12.0),
+    (24, 16, 50.0),
+    (36, 24, 150.0),
+    (50, 50, float("inf")),
+]
+
+# Margem da histerese: só desce de nível quando o raio fica 20% abaixo do limite
+HISTERESE = 0.2
+
+class SeletorLOD:
+    """
+    Escolhe, para cada corpo, um dos `NIVEIS_LOD` a partir do raio projetado
+    em pixels. Guarda o nível atual de cada corpo para aplicar a histerese.
+    """
+    def __init__(self, niveis=NIVEIS_LOD, histerese=HISTERESE):
+        self.niveis = list(niveis)
+        self.histerese = float(histerese)
+        self._limites = np.array([n[2] for n in self.niveis])
+        self.atuais = np.zeros(0, dtype=np.int64)
+
+    def preconstruir(self, texturizado=True):
+        """Gera antecipadamente as malhas de todos os níveis (evita travadas na primeira troca)."""
+        for slices, stacks, _ in self.niveis:
+            cache_malhas.obter(('esfera', slices, stacks, GLU_OUTSIDE, texturizado))
+
+    def selecionar(self, raios_px):
+        """
+        Retorna o índice do nível de cada corpo (array N) para os raios projetados.
+        Sobe de nível assim que passa do limite; desce apenas abaixo de
+        limite * (1 - histerese).
+        """
+        raios_px = np.asarray(raios_px, dtype=np.float64)
+        if len(self.atuais) != len(raios_px):
+            # Primeira chamada (ou mudança de quantidade): escolha direta, sem histerese
+            self.atuais = np.searchsorted(self._limites, raios_px)
+            return self.atuais
+
+        alvo = np.searchsorted(self._limites, raios_px)
+
+        # Para descer, o raio precisa caber no nível de baixo já com a margem
+        limite_descida = np.where(self.atuais > 0,
+                                  self._limites[np.maximum(self.atuais - 1, 0)] * (1.0 - self.histerese),
+                                  -np.inf)
+        desce = (alvo < self.atuais) & (raios_px < limite_descida)
+        sobe = alvo > self.atuais
+
+        self.atuais = np.where(sobe | desce, alvo, self.atuais)
+        return self.atuais
+
+    def tesselacao(self, nivel):
+        """(slices, stacks) de um nível."""
+        slices, stacks, _ = self.niveis[nivel]
+        return slices, stacks
@@ -0,0 +1,113 @@
+# src/app/offscreen.py
+# Contexto OpenGL sem janela visível e alvo de renderização fora da tela (FBO).
+#
+# - Com PYOPENGL_PLATFORM=egl: usa um pbuffer EGL (funciona sem servidor X,
+#   ex.: EGL_PLATFORM=surfaceless com o llvmpipe do Mesa).
+# - Caso contrário: abre uma janela Pygame oculta (flag HIDDEN).
+# Em ambos os casos o desenho vai para um FBO do tamanho pedido, então a
+# resolução não depende da tela nem do tamanho permitido para a janela.
+
+import os
+import ctypes
+
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+from src.formas.estado_gl import estado_gl
+
+def criar_contexto(largura, altura):
+    """Inicializa o Pygame e deixa um contexto OpenGL corrente."""
+    pygame.init()
+
+    if os.environ.get("PYOPENGL_PLATFORM") == "egl":
+        # `convert()` das texturas exige um modo de vídeo qualquer
+        pygame.display.set_mode((1, 1))
+        _criar_pbuffer_egl(largura, altura)
+    else:
+        pygame.display.set_mode((largura, altura), pygame.OPENGL | pygame.DOUBLEBUF | pygame.HIDDEN)
+    # Contexto novo: o espelho do estado volta aos valores padrão
+    estado_gl.reiniciar()
+
+def _criar_pbuffer_egl(largura, altura):
+    from OpenGL import EGL
+
+    dpy = EGL.eglGetDisplay(EGL.EGL_DEFAULT_DISPLAY)
+    if not EGL.eglInitialize(dpy, None, None):
+        raise RuntimeError("Não foi possível inicializar o EGL")
+
+    atributos = (EGL.EGLint * 13)(
+        EGL.EGL_SURFACE_TYPE, EGL.EGL_PBUFFER_BIT,
+        EGL.EGL_RED_SIZE, 8, EGL.EGL_GREEN_SIZE, 8, EGL.EGL_BLUE_SIZE, 8,
+        EGL.EGL_DEPTH_SIZE, 24,
+        EGL.EGL_RENDERABLE_TYPE, EGL.EGL_OPENGL_BIT,
+        EGL.EGL_NONE,
+    )
+    config = EGL.EGLConfig()
+    total = EGL.EGLint()
+    EGL.eglChooseConfig(dpy, atributos, ctypes.pointer(config), 1, ctypes.pointer(total))
+    if total.value == 0:
+        raise RuntimeError("Nenhuma configuração EGL compatível")
+
+    tamanho = (EGL.EGLint * 5)(EGL.EGL_WIDTH, largura, EGL.EGL_HEIGHT, altura, EGL.EGL_NONE)
+    superficie = EGL.eglCreatePbufferSurface(dpy, config, tamanho)
+
+    # Perfil de compatibilidade: o projeto usa pipeline fixo (glBegin, GLU...)
+    EGL.eglBindAPI(EGL.EGL_OPENGL_API)
+    contexto = EGL.eglCreateContext(dpy, config, EGL.EGL_NO_CONTEXT, None)
+    EGL.eglMakeCurrent(dpy, superficie, superficie, contexto)
+
+class AlvoOffscreen:
+    """
+    Framebuffer Object com cor RGBA8 e profundidade de 24 bits.
+    `ler()` devolve o último quadro como array NumPy (altura, largura, 3) uint8,
+    com a primeira linha no topo da imagem.
+    """
+    def __init__(self, largura, altura):
+        self.largura = int(largura)
+        self.altura = int(altura)
+
+        self.fbo = glGenFramebuffers(1)
+        self._cor, self._profundidade = glGenRenderbuffers(2)
+
+        glBindRenderbuffer(GL_RENDERBUFFER, self._cor)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_RGBA8, self.largura, self.altura)
+        glBindRenderbuffer(GL_RENDERBUFFER, self._profundidade)
+        glRenderbufferStorage(GL_RENDERBUFFER, GL_DEPTH_COMPONENT24, self.largura, self.altura)
+        glBindRenderbuffer(GL_RENDERBUFFER, 0)
+
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_RENDERBUFFER, self._cor)
+        glFramebufferRenderbuffer(GL_FRAMEBUFFER, GL_DEPTH_ATTACHMENT, GL_RENDERBUFFER, self._profundidade)
+        estado = glCheckFramebufferStatus(GL_FRAMEBUFFER)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+        if estado != GL_FRAMEBUFFER_COMPLETE:
+            self.liberar()
+            raise RuntimeError(f"FBO incompleto (status 0x{int(estado):x})")
+
+        # Buffer de leitura reaproveitado entre quadros (linhas de baixo para cima)
+        self._pixels = np.empty((self.altura, self.largura, 3), dtype=np.uint8)
+
+    def ativar(self):
+        """Direciona o desenho para o FBO."""
+        glBindFramebuffer(GL_FRAMEBUFFER, self.fbo)
+
+    def desativar(self):
+        """Volta a desenhar no framebuffer padrão."""
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+
+    def ler(self):
+        """Copia o conteúdo do FBO para um novo array (altura, largura, 3)."""
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, self.fbo)
+        glPixelStorei(GL_PACK_ALIGNMENT, 1)
+        glReadPixels(0, 0, self.largura, self.altura, GL_RGB, GL_UNSIGNED_BYTE, self._pixels)
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, 0)
+        # OpenGL começa pela linha de baixo; inverte para a ordem das imagens
+        return self._pixels[::-1].copy()
+
+    def liberar(self):
+        """Apaga o FBO e os renderbuffers."""
+        if self.fbo:
+            glDeleteFramebuffers(1, [self.fbo])
+            glDeleteRenderbuffers(2, [self._cor, self._profundidade])
+            self.fbo = 0
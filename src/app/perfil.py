@@ -0,0 +1,125 @@
+# src/app/perfil.py
+# Medição do tempo gasto em cada fase do quadro.
+# Os tempos (perf_counter_ns) e os contadores de desenho vão para um buffer
+# circular de tamanho fixo; desligado, cada marcação custa só um `if`.
+
+import csv
+import time
+
+import numpy as np
+
+from src.config import QUADROS_PERFIL
+
+# Fases do loop principal, na ordem em que acontecem
+FASES = ('espera', 'eventos', 'input', 'atualizar', 'camera', 'renderizar', 'ajuda', 'hud', 'captura', 'flip')
+
+# Contadores copiados de `estatisticas` ao fechar cada quadro
+CONTADORES = ('chamadas_desenho', 'vertices', 'triangulos', 'binds_textura', 'estados_evitados')
+
+class Perfilador:
+    """
+    Uso (por quadro):
+        perfil.iniciar_quadro()
+        ...                          # trabalho da fase 'eventos'
+        perfil.marcar('eventos')     # tempo desde a marcação anterior
+        ...
+        perfil.fechar_quadro(estatisticas)
+
+    Guarda os últimos `capacidade` quadros. `resumo()` calcula média/p95/p99
+    de uma janela recente e `salvar_csv()` grava todos os quadros guardados.
+
+    Ligar ou desligar (`ativo`) no meio de um quadro (ex.: tecla F3) só vale a
+    partir do próximo `iniciar_quadro`: o quadro em andamento não é registrado.
+    """
+    def __init__(self, fases=FASES, capacidade=QUADROS_PERFIL):
+        self.fases = tuple(fases)
+        self.capacidade = int(capacidade)
+        self._ativo = False
+        # Se o quadro em andamento foi iniciado com o perfilador ligado
+        self._medindo = False
+
+        self._indices = {fase: i for i, fase in enumerate(self.fases)}
+        self._tempos = np.zeros((self.capacidade, len(self.fases)), dtype=np.int64)
+        self._contagens = np.zeros((self.capacidade, len(CONTADORES)), dtype=np.int64)
+
+        # Quadro em andamento
+        self._atual = [0] * len(self.fases)
+        self._ultimo = 0
+
+        # Total de quadros registrados (a posição no anel é quadros % capacidade)
+        self.quadros = 0
+
+    @property
+    def ativo(self):
+        return self._ativo
+
+    @ativo.setter
+    def ativo(self, valor):
+        self._ativo = bool(valor)
+        self._medindo = False
+
+    def iniciar_quadro(self):
+        self._medindo = self._ativo
+        if not self._medindo:
+            return
+        self._atual = [0] * len(self.fases)
+        self._ultimo = time.perf_counter_ns()
+
+    def marcar(self, fase):
+        """Atribui à `fase` o tempo decorrido desde a última marcação (ou início do quadro)."""
+        if not self._medindo:
+            return
+        agora = time.perf_counter_ns()
+        self._atual[self._indices[fase]] += agora - self._ultimo
+        self._ultimo = agora
+
+    def fechar_quadro(self, estatisticas=None):
+        """Grava o quadro em andamento no buffer circular."""
+        if not self._medindo:
+            return
+        self._medindo = False
+        linha = self.quadros % self.capacidade
+        self._tempos[linha] = self._atual
+        if estatisticas is not None:
+            self._contagens[linha] = [getattr(estatisticas, nome) for nome in CONTADORES]
+        self.quadros += 1
+
+    def registrados(self):
+        """(tempos_ns, contagens) de todos os quadros guardados, do mais antigo ao mais novo."""
+        if self.quadros <= self.capacidade:
+            return self._tempos[:self.quadros], self._contagens[:self.quadros]
+        inicio = self.quadros % self.capacidade
+        ordem = np.r_[inicio:self.capacidade, 0:inicio]
+        return self._tempos[ordem], self._contagens[ordem]
+
+    def resumo(self, janela=None):
+        """
+        Estatísticas (em ms) dos últimos `janela` quadros:
+        {fase ou 'total': (media, p95, p99)} e {contador: media}.
+        """
+        tempos, contagens = self.registrados()
+        if janela is not None:
+            tempos, contagens = tempos[-janela:], contagens[-janela:]
+        if len(tempos) == 0:
+            return {}, {}
+
+        ms = np.column_stack([tempos, tempos.sum(axis=1)]) / 1e6
+        media = ms.mean(axis=0)
+        p95, p99 = np.percentile(ms, [95, 99], axis=0)
+        nomes = self.fases + ('total',)
+        fases = {nome: (media[i], p95[i], p99[i]) for i, nome in enumerate(nomes)}
+        medias = contagens.mean(axis=0)
+        return fases, {nome: medias[i] for i, nome in enumerate(CONTADORES)}
+
+    def salvar_csv(self, caminho):
+        """Grava um quadro por linha: tempo de cada fase (ns) e contadores. Retorna as linhas gravadas."""
+        tempos, contagens = self.registrados()
+        if len(tempos) == 0:
+            return 0
+        primeiro = self.quadros - len(tempos)
+        with open(caminho, "w", newline="") as arquivo:
+            escritor = csv.writer(arquivo)
+            escritor.writerow(('quadro',) + tuple(f"{f}_ns" for f in self.fases) + ('total_ns',) + CONTADORES)
+            for n, (t, c) in enumerate(zip(tempos.tolist(), contagens.tolist())):
+                escritor.writerow([primeiro + n] + t + [sum(t)] + c)
+        return len(tempos)
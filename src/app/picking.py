@@ -0,0 +1,167 @@
+# src/app/picking.py
+# Seleção de objetos com o mouse (picking) por lançamento de raio.
+# O clique é desprojetado com a inversa de projeção * visão da câmera e o
+# raio é testado contra todas as esferas envolventes de uma vez (NumPy),
+# sem modo de seleção do OpenGL e sem glReadPixels.
+#
+# Objetos pequenos na tela ganham uma tolerância angular (alguns pixels):
+# o raio vira um cone estreito, então planetas distantes e partículas do
+# cinturão continuam clicáveis.
+
+import numpy as np
+
+# Tolerância do clique, em pixels
+TOLERANCIA_PX = 6.0
+
+def raio_do_pixel(camera, x, y):
+    """
+    Raio de mundo (origem, direção unitária) que passa pelo pixel (x, y) da
+    janela (origem no canto superior esquerdo, como nos eventos do pygame).
+    """
+    largura, altura = camera.viewport
+    nx = 2.0 * (x + 0.5) / largura - 1.0
+    ny = 1.0 - 2.0 * (y + 0.5) / altura
+
+    # Pontos no plano near e far em coordenadas de clip -> mundo
+    clip = np.array([[nx, ny, -1.0, 1.0], [nx, ny, 1.0, 1.0]])
+    mundo = clip @ camera.inversa.T
+    mundo = mundo[:, :3] / mundo[:, 3:4]
+
+    direcao = mundo[1] - mundo[0]
+    direcao /= np.linalg.norm(direcao)
+    return np.array(camera.posicao, dtype=np.float64), direcao
+
+def tangente_pixels(camera, pixels=TOLERANCIA_PX):
+    """Tangente do ângulo que `pixels` ocupam a partir do centro da tela."""
+    return pixels / camera.distancia_focal_px
+
+def esfera_atingida(origem, direcao, centros, raios, tangente=0.0):
+    """
+    Índice da esfera mais próxima atingida pelo raio (ou -1) e a distância
+    até a entrada. Com `tangente` > 0 o raio vira um cone: a esfera conta
+    como atingida se passar a menos de `raio + t * tangente` do eixo.
+    """
+    centros = np.asarray(centros, dtype=np.float64).reshape(-1, 3)
+    raios = np.asarray(raios, dtype=np.float64).reshape(-1)
+    # Expande |c - o|² e (c - o)·d em produtos matriz-vetor: evita os
+    # temporários (N, 3), que para N grande custam mais do que as contas
+    # t: distância ao longo do raio até o ponto mais próximo do centro
+    t = centros @ direcao
+    t -= origem @ direcao
+    perp2 = np.einsum('ij,ij->i', centros, centros)
+    perp2 -= 2.0 * (centros @ origem)
+    perp2 += origem @ origem
+    perp2 -= t * t
+    alcance = np.maximum(t, 0.0)
+    alcance *= tangente
+    alcance += raios
+    atingidas = np.nonzero((perp2 <= alcance * alcance) & (t + raios >= 0.0))[0]
+    if len(atingidas) == 0:
+        return -1, np.inf
+
+    # Distância até a superfície (ou até o ponto mais próximo, se só o cone tocou),
+    # calculada só para as poucas esferas atingidas
+    r = raios[atingidas]
+    entrada = t[atingidas] - np.sqrt(np.maximum(r * r - perp2[atingidas], 0.0))
+    k = int(np.argmin(entrada))
+    return int(atingidas[k]), max(float(entrada[k]), 0.0)
+
+def ponto_atingido(origem, direcao, pontos, tangente, indices=None):
+    """
+    Índice do ponto (partícula) dentro do cone do clique mais alinhado ao
+    raio (menor ângulo), ou -1. `indices` restringe o teste a um subconjunto
+    (ex.: candidatos de `GradeEspacial.candidatos`).
+    """
+    if indices is not None:
+        if len(indices) == 0:
+            return -1
+        pontos = pontos[indices]
+    op = np.asarray(pontos, dtype=np.float64) - origem
+    t = op @ direcao
+    perp2 = np.einsum('ij,ij->i', op, op) - t * t
+    # Compara ângulos pelas tangentes ao quadrado (perp² / t²) sem dividir
+    dentro = (t > 0.0) & (perp2 <= (t * tangente) ** 2)
+    if not dentro.any():
+        return -1
+    angulo = np.where(dentro, perp2 / np.maximum(t * t, 1e-12), np.inf)
+    i = int(np.argmin(angulo))
+    return int(indices[i]) if indices is not None else i
+
+class GradeEspacial:
+    """
+    Índice espacial uniforme para nuvens de pontos (cinturões).
+
+    `construir` distribui os pontos em `divisoes` células (ordenação por
+    contagem, O(N)); `candidatos` testa o cone do clique contra as esferas
+    envolventes das células, também de forma vetorizada, e devolve só os
+    pontos das células atravessadas.
+    """
+    def __init__(self, divisoes=(32, 4, 32)):
+        self.divisoes = np.array(divisoes, dtype=np.int64)
+        self.versao = None
+        self._ordem = np.zeros(0, dtype=np.int64)
+        self._inicios = np.zeros(1, dtype=np.int64)
+        self._contagens = np.zeros(0, dtype=np.int64)
+        self._centros = np.zeros((0, 3))
+        self._raio_celula = 0.0
+
+    def construir(self, pontos, versao=None):
+        """
+        (Re)constrói o índice para `pontos` (N, 3). `versao` identifica o conteúdo
+        indexado (ver `atualizado`): o array de pontos costuma ser reaproveitado
+        pelo dono, então a identidade do objeto não diz se os pontos mudaram.
+        """
+        pontos = np.asarray(pontos)
+        self.versao = versao
+        n_celulas = int(np.prod(self.divisoes))
+        if len(pontos) == 0:
+            self._ordem = np.zeros(0, dtype=np.int64)
+            self._contagens = np.zeros(n_celulas, dtype=np.int64)
+            self._inicios = np.zeros(n_celulas + 1, dtype=np.int64)
+            return
+
+        # Trabalha por eixo sobre colunas contíguas: reduções no eixo 0 de um
+        # array (N, 3) são bem mais lentas no NumPy
+        colunas = np.ascontiguousarray(pontos.T, dtype=np.float32)
+        minimo = colunas.min(axis=1).astype(np.float64)
+        tamanho = np.maximum(colunas.max(axis=1) - minimo, 1e-6) / self.divisoes
+
+        celula = np.zeros(len(pontos), dtype=np.int32)
+        for eixo, divisoes in enumerate(self.divisoes):
+            indice = ((colunas[eixo] - np.float32(minimo[eixo])) * np.float32(1.0 / tamanho[eixo])).astype(np.int32)
+            np.clip(indice, 0, divisoes - 1, out=indice)
+            celula *= int(divisoes)
+            celula += indice
+        # Até 65536 células o id cabe em 16 bits e a ordenação estável vira radix sort
+        if n_celulas <= 1 << 16:
+            celula = celula.astype(np.uint16)
+        self._ordem = np.argsort(celula, kind='stable')
+        self._contagens = np.bincount(celula, minlength=n_celulas)
+        self._inicios = np.concatenate(([0], np.cumsum(self._contagens)))
+
+        # Esfera envolvente de cada célula
+        i, j, k = np.meshgrid(*(np.arange(d) for d in self.divisoes), indexing='ij')
+        indices = np.stack([i.ravel(), j.ravel(), k.ravel()], axis=1)
+        self._centros = minimo + (indices + 0.5) * tamanho
+        # (folga para pontos na fronteira arredondados para a célula vizinha)
+        self._raio_celula = 0.5 * float(np.linalg.norm(tamanho)) * 1.001
+
+    def atualizado(self, versao):
+        """Se o índice foi construído para a `versao` atual dos pontos."""
+        return versao is not None and self.versao == versao
+
+    def candidatos(self, origem, direcao, tangente):
+        """Índices dos pontos nas células que o cone do clique atravessa."""
+        oc = self._centros - origem
+        t = oc @ direcao
+        perp2 = np.einsum('ij,ij->i', oc, oc) - t * t
+        r = self._raio_celula
+        alcance = r + np.maximum(t + r, 0.0) * tangente
+        celulas = np.nonzero((self._contagens > 0) & (t >= -r) & (perp2 <= alcance * alcance))[0]
+        if len(celulas) == 0:
+            return np.zeros(0, dtype=np.int64)
+
+        # Concatena as faixas [inicio, inicio + contagem) de cada célula sem laço
+        contagens = self._contagens[celulas]
+        deslocamento = np.repeat(self._inicios[celulas] - np.cumsum(contagens) + contagens, contagens)
+        return self._ordem[deslocamento + np.arange(int(contagens.sum()))]
@@ -1,57 +1,167 @@
 # src/app/planetario.py
 import pygame
 import math
+from datetime import datetime, timezone
 from OpenGL.GL import *
-from OpenGL.GLU import *
+import numpy as np
 from src.formas.primitivas import desenhar_esfera, desenhar_anel, desenhar_fundo_quad, desenhar_esfera_interna
+from src.app.corpos import SistemaCorpos, CATALOGO_CORPOS
+from src.app.cinturao import CinturaoAsteroides, RAIO_INTERNO, RAIO_EXTERNO
+from src.app.linhas_orbita import LinhasOrbita
+from src.app.rastros import Rastros
+from src.app.texturas import CarregadorTexturas
+from src.app.lod import SeletorLOD
+from src.app.relogio import RelogioSimulacao
+from src.app.camera import Camera
+from src.app.frustum import esferas_visiveis
+from src.app.picking import raio_do_pixel, tangente_pixels, esfera_atingida
+from src.app.efemerides import Efemerides, JD_J2000, jd_de_data, data_de_jd
+from src.app.processo_simulacao import SimulacaoRemota
+from src.app.gravidade import SistemaGravitacional, GM_SOL, estado_efemerides, estado_kepleriano
+from src.formas.estatisticas import estatisticas
+from src.formas.estado_gl import estado_gl
+from src.config import (ASTEROIDES_CINTURAO, ARQUIVO_EFEMERIDES, PASSO_FISICA_DIAS, PASSOS_FISICA_MAX,
+                        PARTICULAS_FISICA)
+
+# Dias por unidade de `angle` (a Terra completa a órbita em 360 unidades);
+# no modo de data real, angle = 0 corresponde a J2000.0
+DIAS_POR_UNIDADE = 365.25 / 360.0
+
+# Com a data mudando, as linhas de órbita (nodo e periélio precessionam; o nodo
+# da Lua dá uma volta em 18,6 anos) são refeitas quando a data se afasta mais
+# que isto (dias) da última atualização
+DIAS_ATUALIZAR_ORBITAS = 30.0
+
+# Teclas que alteram o estado da simulação (com a simulação em outro processo, vão para ele)
+TECLAS_SIMULACAO = (pygame.K_f, pygame.K_PERIOD, pygame.K_COMMA, pygame.K_BACKSPACE, pygame.K_t,
+                    pygame.K_g, pygame.K_b)
+
+# Semi-eixo maior (UA) das partículas do cinturão no modo de física: a faixa
+# RAIO_INTERNO..RAIO_EXTERNO da cena é mapeada linearmente para este intervalo
+CINTURAO_UA = (2.1, 3.3)
+
+def _agora():
+    return datetime.now(timezone.utc)
 
 class Planetario:
     """
     Controla toda a lógica da simulação do Sistema Solar, incluindo renderização,
     carregamento de assets e cálculo de órbitas.
+
+    Com `grafico=False` só a lógica é criada (sem OpenGL, texturas ou malhas):
+    é o que roda no processo da simulação (ver `usar_processo`).
     """
-    def __init__(self):
-        # Rotação e translação dos planetas
+    def __init__(self, grafico=True):
+        # Relógio da simulação: as órbitas e rotações da tabela de corpos
+        # são proporcionais a este ângulo (ver `src/app/corpos.py`).
+        # `angle` é o tempo interpolado entre os passos fixos do `relogio`.
+        self.relogio = RelogioSimulacao()
         self.angle = 0.0
-        self.rotation = 0.0
         
-        # Câmera Híbrida (Órbita + Pan)
-        self.cam_dist = 60.0
-        self.cam_theta = 1.57   # 90 graus
-        self.cam_phi = 1.0      # Elevação
+        # Corpos celestes (tabela de dados + grafo de cena)
+        self.corpos = SistemaCorpos(CATALOGO_CORPOS)
+        
+        # Linhas de órbita (geometria gerada uma vez e reaproveitada)
+        self.linhas_orbita = LinhasOrbita()
+        for i, nome in enumerate(self.corpos.nomes):
+            if self.corpos.raio_orbita[i] > 0.0:
+                self.linhas_orbita.definir(nome, self.corpos.raio_orbita[i], pai=self.corpos.pai[i])
+        
+        # Rastros (posições recentes) dos corpos que orbitam algo
+        self.rastros = Rastros(np.nonzero(self.corpos.raio_orbita > 0.0)[0], self.corpos.nomes)
+        self.mostrar_rastros = False
+        self._modo_rastros = None
+        
+        # Nível de detalhe das esferas conforme o tamanho na tela
+        self.lod = SeletorLOD()
+        self.niveis_lod = np.zeros(len(self.corpos), dtype=np.int64)
+        self.triangulos_quadro = 0
+        
+        # Culling: quantos objetos (corpos, órbitas, cinturão) foram desenhados/descartados no quadro
+        self.visiveis = np.ones(len(self.corpos), dtype=bool)
+        self.objetos_desenhados = 0
+        self.objetos_descartados = 0
         
-        # Ponto focal da câmera
-        self.target_x = 0.0
-        self.target_y = 0.0
-        self.target_z = 0.0
+        # Cinturão de asteroides entre Marte e Júpiter (partículas)
+        self.cinturao = CinturaoAsteroides(ASTEROIDES_CINTURAO)
+        
+        # Câmera Híbrida (Órbita + Pan); far=1000 evita cortar o fundo
+        self.camera = Camera(dist=60.0, theta=1.57, phi=1.0, fovy=45.0, near=1.0, far=1000.0)
+        
+        # Objeto seguido pela câmera após um clique: ('corpo', i), ('asteroide', i) ou None
+        self.foco = None
         
         self.mostrar_orbitas = True
+        self.mostrar_cinturao = True
         self.paused = False
         
-        # --- Gerenciamento de Texturas ---
-        # Dicionário para armazenar IDs das texturas OpenGL geradas
-        self.texture_ids = {
-            'fundo': None, 'sun': None, 'mercury': None, 'venus': None,
-            'earth': None, 'moon': None, 'mars': None, 'jupiter': None, 'saturn': None,
-            'uranus': None, 'neptune': None, 'satRing': None
-        }
+        # Multiplicador do warp no último quadro (turbo), para o ritmo do tempo (`velocidade_tempo`)
+        self._fator_velocidade = 1.0
+        
+        # Modo de data real: posições das efemérides (carregadas na primeira vez que forem usadas)
+        # em vez das órbitas circulares do catálogo; em tempo real, a data acompanha o relógio do sistema
+        self.efemerides = None
+        self.modo_data = False
+        self.tempo_real = False
+        self._jd_orbitas = None
+        
+        # Relógio do sistema usado pelo tempo real (a gravação/reprodução o substitui pelo instante gravado)
+        self.agora = _agora
+        
+        # Modo de física (N corpos): a partir das posições reais, os corpos passam a ser
+        # movidos pela gravidade mútua em vez das efemérides/órbitas fixas; `_jd_fisica` é a
+        # data juliana em que a integração começou (tempo 0 do sistema)
+        self.fisica = None
+        self._jd_fisica = None
+        
+        # Simulação em outro processo (`SimulacaoRemota`) ou None (lógica aqui mesmo)
+        self.remota = None
+        
+        # Carregador de texturas (só com `grafico`)
+        self.texturas = None
         
         # --- Inicialização ---
-        self._init_opengl()       # Configura luzes, profundidade, etc.
-        self._carregar_texturas() # Carrega imagens do disco para memória de vídeo
+        if grafico:
+            self._init_opengl()       # Configura luzes, profundidade, etc.
+            self._carregar_texturas() # Começa a carregar as imagens (em segundo plano)
+            self.lod.preconstruir()   # Gera as malhas de todos os níveis de detalhe
         
+    def usar_processo(self):
+        """
+        Passa a lógica de atualização para um processo separado (ver
+        `processo_simulacao.py`); daqui em diante este objeto só desenha o
+        último estado publicado por ele.
+        """
+        self.remota = SimulacaoRemota(self)
+
+    def encerrar(self):
+        """Encerra o processo da simulação (se houver) e o carregamento de texturas."""
+        if self.remota is not None:
+            self.remota.encerrar()
+            self.remota = None
+        if self.texturas is not None:
+            self.texturas.encerrar()
+
     def _init_opengl(self):
         """Configurações iniciais do OpenGL."""
         glClearColor(0.0, 0.0, 0.0, 0.0)
         
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glEnable(GL_LIGHT0)
-        glEnable(GL_COLOR_MATERIAL)
-        glEnable(GL_TEXTURE_2D)
+        estado_gl.habilitar(GL_DEPTH_TEST)
+        estado_gl.habilitar(GL_LIGHTING)
+        estado_gl.habilitar(GL_LIGHT0)
+        estado_gl.habilitar(GL_COLOR_MATERIAL)
+        estado_gl.habilitar(GL_TEXTURE_2D)
+
+        # As malhas do cache são unitárias e escaladas com glScalef;
+        # reescala as normais para a iluminação continuar correta.
+        estado_gl.habilitar(GL_RESCALE_NORMAL)
 
     def _carregar_texturas(self):
-        """Carrega imagens jpg e cria texturas OpenGL."""
+        """
+        Inicia o carregamento assíncrono das texturas.
+        `self.texture_ids` já nasce com texturas provisórias válidas; as imagens
+        reais são decodificadas em threads e enviadas aos poucos em `renderizar`.
+        """
         # Mapeia chaves internas para nomes de arquivos
         files = {
             'fundo': "space.jpg",
@@ -68,73 +178,319 @@ class Planetario:
             'satRing': "saturnRing.jpg"
         }
         
-        base_path = "src/assets/textures/"
-        
-        for key, filename in files.items():
-            try:
-                # Carrega imagem usando Pygame
-                surface = pygame.image.load(base_path + filename)
-                
-                # IMPORTANTE: Converte para formato eficiente e garante profundidade de cor correta
-                # Isso ajuda a evitar problemas de cores corrompidas ou Grayscale se a imagem for indexada.
-                surface = surface.convert()
-                
-                width = surface.get_width()
-                height = surface.get_height()
-                
-                # Converte os dados da imagem para string de bytes para o OpenGL ler
-                # "RGB" indica formato de cor. '1' inverte verticalmente (padrão OpenGL onde Y cresce pra cima)
-                data = pygame.image.tostring(surface, "RGB", 1)
-                
-                # Gera um ID de textura no OpenGL
-                tex_id = glGenTextures(1)
-                
-                # Vincula (seleciona) essa textura para operar nela
-                glBindTexture(GL_TEXTURE_2D, tex_id)
-                
-                # Configura parâmetros de repetição e filtro
-                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT) # Repete horizontalmente
-                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT) # Repete verticalmente
-                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR) # Filtro linear ao reduzir (suave)
-                glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR) # Filtro linear ao ampliar (suave)
-                
-                # IMPORTANTE: Corrige alinhamento de bytes para larguras não múltiplas de 4
-                glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
-                
-                # Envia os dados de pixels para a GPU
-                glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, width, height, 0, GL_RGB, GL_UNSIGNED_BYTE, data)
-                
-                # Armazena ID
-                self.texture_ids[key] = tex_id
-                
-            except Exception as e:
-                print(f"Erro crítico ao carregar textura {filename}: {e}")
-
-    def atualizar(self, fator_velocidade=1.0):
-        """Atualização de lógica a cada frame (Animação)."""
+        # Enquanto carrega: fundo escuro e Sol alaranjado; demais em cinza neutro
+        cores = {'fundo': (0, 0, 0), 'sun': (255, 170, 60)}
+        
+        self.texturas = CarregadorTexturas("src/assets/textures/", files, cores_provisorias=cores)
+        
+        # Dicionário chave -> ID de textura OpenGL (sempre válido, atualizado pelo carregador)
+        self.texture_ids = self.texturas.ids
+
+    def atualizar(self, dt, fator_velocidade=1.0):
+        """
+        Atualização de lógica a cada frame (Animação).
+        `dt` é o tempo real do quadro em segundos; o relógio o consome em passos fixos.
+        """
+        self._fator_velocidade = fator_velocidade
+        if self.remota is not None:
+            # A lógica roda no processo da simulação: envia o tempo do quadro e usa o último estado pronto
+            if not self.paused:
+                self.remota.enviar('avancar', dt, fator_velocidade)
+            self.remota.aplicar(self)
+            return
+
         # Se estiver pausado, não atualiza os ângulos
         if self.paused:
             return
 
-        # Incrementa ângulos para criar movimento de rotação e translação
-        self.angle += 0.5 * fator_velocidade   # Velocidade orbital (translação global)
-        self.rotation += 1.0 * fator_velocidade # Velocidade rotacional (giro do planeta)
+        # Avança o relógio; translação e rotação de cada corpo derivam dele.
+        # Como as posições são analíticas, basta interpolar o tempo entre os passos.
+        if self.tempo_real:
+            self.relogio.definir_tempo(self._unidades(jd_de_data(self.agora())))
+        else:
+            self.relogio.avancar(dt, fator_velocidade)
+        self.angle = self.relogio.tempo
+        if self.fisica is not None:
+            # Corpos e partículas do cinturão vêm da integração
+            self._integrar_fisica()
+            return
+        if self.modo_data:
+            self._aplicar_efemerides()
+        
+        # Posições de todas as partículas do cinturão (vetorizado, uma vez por quadro)
+        if self.mostrar_cinturao:
+            self.cinturao.atualizar(self.angle)
+
+    def velocidade_tempo(self):
+        """Unidades de `angle` por segundo real no ritmo atual (0 com a simulação pausada)."""
+        if self.paused:
+            return 0.0
+        if self.tempo_real:
+            return 1.0 / (86400.0 * DIAS_POR_UNIDADE)
+        r = self.relogio
+        return r.velocidade * min(r.warp * self._fator_velocidade, r.warp_max)
+
+    def definir_tempo(self, tempo):
+        """Salta a simulação para um instante (unidades de `angle`)."""
+        self.relogio.definir_tempo(tempo)
+        self.angle = self.relogio.tempo
+        if self.fisica is not None:
+            # Não há como integrar para trás até o instante: recomeça das efemérides
+            self.iniciar_fisica()
+            return
+        if self.modo_data:
+            self._aplicar_efemerides()
+        if self.mostrar_cinturao:
+            self.cinturao.atualizar(self.angle)
+
+    # ---------------- datas reais (efemérides) ----------------
+
+    @staticmethod
+    def _unidades(jd):
+        """Data juliana -> unidades de `angle` (modo de data real)."""
+        return (jd - JD_J2000) / DIAS_POR_UNIDADE
+
+    @property
+    def data_juliana(self):
+        """Data juliana correspondente ao tempo atual (modo de data real)."""
+        return JD_J2000 + self.angle * DIAS_POR_UNIDADE
+
+    def data(self):
+        """Data (UTC) mostrada no modo de data real (ou de física), ou None fora deles."""
+        return data_de_jd(self.data_juliana) if self.modo_data or self.fisica is not None else None
+
+    def definir_data(self, data):
+        """
+        Passa a mostrar as posições reais na data `data` (`datetime`, sem fuso = UTC,
+        ou data juliana). O tempo continua correndo pelo relógio (pausa e warp valem).
+        Datas fora da tabela de efemérides geram ValueError.
+        """
+        jd = data if isinstance(data, (int, float)) else jd_de_data(data)
+        if self.efemerides is None:
+            self._carregar_efemerides()
+        # (com a simulação em outro processo, o erro também sai daqui, na chamada)
+        self.efemerides.verificar(jd)
+        if self.remota is not None:
+            self.remota.enviar('definir_data', data)
+            return
+        self.modo_data = True
+        self.tempo_real = False
+        self._jd_orbitas = None
+        self.definir_tempo(self._unidades(jd))
+
+    def alternar_tempo_real(self):
+        """Liga o tempo real (posições de agora, avançando 1 s por segundo) ou volta ao modo livre."""
+        if self.remota is not None:
+            self.remota.enviar('alternar_tempo_real')
+            return
+        if self.tempo_real:
+            self.sair_modo_data()
+            return
+        self.definir_data(self.agora())
+        self.relogio.definir_warp(1.0)
+        self.tempo_real = True
+
+    def sair_modo_data(self):
+        """Volta às órbitas circulares do catálogo (o tempo continua de onde está)."""
+        if self.fisica is not None:
+            self.parar_fisica()
+        if not self.modo_data:
+            return
+        self.modo_data = False
+        self.tempo_real = False
+        self.corpos.definir_locais(None)
+        self._linhas_catalogo()
+
+    def _linhas_catalogo(self):
+        """Linhas de órbita circulares da tabela de corpos."""
+        for i, nome in enumerate(self.corpos.nomes):
+            if self.corpos.raio_orbita[i] > 0.0:
+                self.linhas_orbita.definir(nome, self.corpos.raio_orbita[i], pai=self.corpos.pai[i])
+
+    def _carregar_efemerides(self):
+        """
+        Abre a tabela (memmap) e relaciona seus corpos aos do catálogo. A cena
+        não está em escala: cada corpo mantém a direção real e a distância
+        real multiplicada por raio_orbita / semi-eixo maior.
+        """
+        ef = self.efemerides = Efemerides(ARQUIVO_EFEMERIDES)
+        corpos, tabela = [], []
+        for i, nome in enumerate(self.corpos.nomes):
+            if nome not in ef.nomes or self.corpos.raio_orbita[i] <= 0.0:
+                continue
+            j = ef.indice(nome)
+            pai = self.corpos.pai[i]
+            # O centro da tabela precisa ser o pai na cena (Sol = origem)
+            if ef.centros[j] != (self.corpos.nomes[pai] if pai >= 0 else None):
+                continue
+            corpos.append(i)
+            tabela.append(j)
+        self._corpos_ef = np.array(corpos, dtype=np.int64)
+        self._nomes_ef = [ef.nomes[j] for j in tabela]
+        self._escala_ef = self.corpos.raio_orbita[self._corpos_ef] / ef.elementos(JD_J2000, self._nomes_ef)[:, 0]
+        # Corpos do catálogo sem efemérides seguem na órbita circular
+        self._corpos_catalogo = np.setdiff1d(np.nonzero(self.corpos.raio_orbita > 0.0)[0], self._corpos_ef)
+
+    def _aplicar_efemerides(self):
+        """Posições da data atual -> posições locais dos corpos (e linhas de órbita, se preciso)."""
+        ef = self.efemerides
+        jd = self.data_juliana
+        if not ef.contem(jd):
+            # Fim da tabela: o tempo para no limite
+            jd = min(max(jd, ef.inicio), ef.fim)
+            self.relogio.definir_tempo(self._unidades(jd))
+            self.angle = self.relogio.tempo
+            self.tempo_real = False
+
+        self._definir_locais(ef.posicoes(jd, self._nomes_ef))
+        self._atualizar_linhas(jd)
+
+    def _definir_locais(self, ecl):
+        """
+        Posições (UA, eclíptica) dos corpos da tabela, relativas ao pai ->
+        posições locais na cena; os corpos sem efemérides seguem no catálogo.
+        """
+        locais = np.zeros((len(self.corpos), 3))
+        ecl = ecl * self._escala_ef[:, None]
+        # Eclíptica (x, y, z) -> cena (x, z, -y), como em `kepler.vetores_orbitais`
+        locais[self._corpos_ef] = np.stack([ecl[:, 0], ecl[:, 2], -ecl[:, 1]], axis=1)
+
+        c = self._corpos_catalogo
+        angulo = np.radians(self.corpos.taxa_orbita[c] * self.angle)
+        locais[c, 0] = self.corpos.raio_orbita[c] * np.cos(angulo)
+        locais[c, 2] = -self.corpos.raio_orbita[c] * np.sin(angulo)
+        self.corpos.definir_locais(locais)
+
+    def _atualizar_linhas(self, jd):
+        """Refaz as linhas de órbita pelos elementos de `jd`, se a data mudou o bastante."""
+        ef = self.efemerides
+        if self._jd_orbitas is None or abs(jd - self._jd_orbitas) > DIAS_ATUALIZAR_ORBITAS:
+            self._jd_orbitas = jd
+            for k, (a, e, i, raan, argp) in zip(self._corpos_ef, ef.elementos(jd, self._nomes_ef)):
+                self.linhas_orbita.definir(self.corpos.nomes[k], self.corpos.raio_orbita[k], e, i, raan, argp,
+                                           pai=self.corpos.pai[k])
+
+    # ---------------- física de N corpos ----------------
+
+    def alternar_fisica(self):
+        """Liga a física de N corpos (a partir da data atual) ou volta ao modo anterior."""
+        if self.fisica is None:
+            self.iniciar_fisica()
+        else:
+            self.parar_fisica()
+
+    def iniciar_fisica(self):
+        """
+        Começa a integrar o Sol, os planetas e a Lua (e parte do cinturão, como
+        partículas de teste) a partir das efemérides da data atual. Daí em diante
+        as posições vêm só da gravidade: o integrador acompanha o relógio em
+        passos fixos de PASSO_FISICA_DIAS.
+        """
+        if self.efemerides is None:
+            self._carregar_efemerides()
+        ef = self.efemerides
+        jd = min(max(self.data_juliana, ef.inicio), ef.fim)
+        posicoes, velocidades, mu = estado_efemerides(ef, jd, self._nomes_ef)
+
+        # Partículas de teste: os primeiros elementos do cinturão, na posição atual da órbita,
+        # com o semi-eixo levado para o cinturão real (em UA)
+        k = min(PARTICULAS_FISICA, self.cinturao.quantidade)
+        if k:
+            m = self.cinturao.motor
+            a = np.interp(m.a[:k], (RAIO_INTERNO, RAIO_EXTERNO), CINTURAO_UA)
+            anomalia = m.m0[:k] + 2.0 * np.pi * self.angle / m.periodo[:k]
+            p, v = estado_kepleriano(a, m.e[:k], m.i[:k], m.raan[:k], m.argp[:k], anomalia, GM_SOL)
+            posicoes = np.concatenate([posicoes, p + posicoes[0]])
+            velocidades = np.concatenate([velocidades, v + velocidades[0]])
+            mu = np.concatenate([mu, np.zeros(k)])
+
+        self.fisica = SistemaGravitacional(posicoes, velocidades, mu)
+        self._jd_fisica = jd
+        self.relogio.definir_tempo(self._unidades(jd))
+        self.angle = self.relogio.tempo
+
+        # Corpos relativos a outro (a Lua) são mostrados em relação a ele, como nas efemérides
+        indices = {nome: j for j, nome in enumerate(self._nomes_ef)}
+        centros = [ef.centros[ef.indice(nome)] for nome in self._nomes_ef]
+        self._centros_fisica = np.array([-1 if c is None else indices[c] for c in centros]) + 1
+
+        # Distância ao Sol (UA) -> distância na cena, interpolada entre as órbitas dos planetas
+        # (para as partículas, que não têm um raio de órbita próprio)
+        planetas = np.array([c is None for c in centros])
+        a = ef.elementos(jd, self._nomes_ef)[planetas, 0]
+        raio = self.corpos.raio_orbita[self._corpos_ef[planetas]]
+        ordem = np.argsort(a)
+        self._ua_fisica = np.concatenate([[0.0], a[ordem], [a[ordem][-1] * 10.0]])
+        self._raio_fisica = np.concatenate([[0.0], raio[ordem], [raio[ordem][-1] * 10.0]])
+
+        self._jd_orbitas = None
+        self._atualizar_linhas(jd)
+        self._posicionar_fisica()
+
+    def parar_fisica(self):
+        """Volta às efemérides (modo de data real) ou às órbitas do catálogo."""
+        self.fisica = None
+        if self.foco is not None and self.foco[0] == 'asteroide':
+            self.soltar_foco()
+        if self.modo_data:
+            self._jd_orbitas = None
+            self._aplicar_efemerides()
+        else:
+            self.corpos.definir_locais(None)
+            self._linhas_catalogo()
+        self.cinturao.atualizar(self.angle)
+
+    def _integrar_fisica(self):
+        """Avança a integração até a data do relógio (no máximo PASSOS_FISICA_MAX passos)."""
+        ef = self.efemerides
+        passos = int((self.data_juliana - self._jd_fisica - self.fisica.tempo) / PASSO_FISICA_DIAS)
+        if passos > PASSOS_FISICA_MAX:
+            # A física não acompanha o warp: o tempo simulado fica com o que foi integrado
+            passos = PASSOS_FISICA_MAX
+            self.fisica.avancar(PASSO_FISICA_DIAS, passos)
+            self.relogio.definir_tempo(self._unidades(self._jd_fisica + self.fisica.tempo))
+            self.angle = self.relogio.tempo
+        elif passos > 0:
+            self.fisica.avancar(PASSO_FISICA_DIAS, passos)
+
+        jd = self._jd_fisica + self.fisica.tempo
+        if ef.contem(jd):
+            self._atualizar_linhas(jd)
+        self._posicionar_fisica()
+
+    def _posicionar_fisica(self):
+        """Estado da integração -> posições locais dos corpos e das partículas na cena."""
+        posicoes = self.fisica.posicoes
+        n = len(self._nomes_ef)
+        # Cada corpo relativo ao seu centro (Sol = índice 0, a Lua relativa à Terra)
+        self._definir_locais(posicoes[1:n + 1] - posicoes[self._centros_fisica])
+
+        if n + 1 < len(posicoes):
+            relativas = posicoes[n + 1:] - posicoes[0]
+            distancia = np.sqrt(np.einsum('ij,ij->i', relativas, relativas))
+            fator = np.interp(distancia, self._ua_fisica, self._raio_fisica) / np.maximum(distancia, 1e-12)
+            relativas *= fator[:, None]
+            self.cinturao.definir_posicoes(np.stack([relativas[:, 0], relativas[:, 2], -relativas[:, 1]], axis=1))
 
     def processar_input(self, pressed_keys):
         """
         Input contínuo (movimento e zoom).
         """
         
+        cam = self.camera
+        
         # --- 1. Zoom (Teclas Z e X) ---
-        # Altera o raio da órbita da câmera (`cam_dist`)
+        # Altera o raio da órbita da câmera (`dist`)
         zoom_speed = 1.0
+        if pressed_keys[pygame.K_z] or pressed_keys[pygame.K_x]:
+            cam.cancelar_zoom()     # O usuário assume o zoom durante a transição de foco
         if pressed_keys[pygame.K_z]:
-            self.cam_dist -= zoom_speed # Aproxima
-            if self.cam_dist < 5.0: self.cam_dist = 5.0 # Limite mínimo
+            cam.dist -= zoom_speed # Aproxima
+            if cam.dist < 5.0: cam.dist = 5.0 # Limite mínimo
             
         if pressed_keys[pygame.K_x]:
-            self.cam_dist += zoom_speed # Afasta
-            if self.cam_dist > 300.0: self.cam_dist = 300.0 # Limite máximo
+            cam.dist += zoom_speed # Afasta
+            if cam.dist > 300.0: cam.dist = 300.0 # Limite máximo
             
         # --- 2. Rotação Orbital (Teclas WASD) ---
         # Gira a câmera em torno do ponto de foco (Target)
@@ -142,17 +498,17 @@ class Planetario:
         
         # A / D: Gira horizontalmente (Theta)
         if pressed_keys[pygame.K_a]:
-            self.cam_theta -= angle_speed 
+            cam.theta -= angle_speed 
         if pressed_keys[pygame.K_d]:
-            self.cam_theta += angle_speed 
+            cam.theta += angle_speed 
             
         # W / S: Gira verticalmente (Phi - Elevação)
         if pressed_keys[pygame.K_w]:
-            self.cam_phi -= angle_speed   # Sobe
-            if self.cam_phi < 0.1: self.cam_phi = 0.1 # Trava para não inverter no polo norte
+            cam.phi -= angle_speed   # Sobe
+            if cam.phi < 0.1: cam.phi = 0.1 # Trava para não inverter no polo norte
         if pressed_keys[pygame.K_s]:
-            self.cam_phi += angle_speed   # Desce
-            if self.cam_phi > 3.1: self.cam_phi = 3.1 # Trava para não inverter no polo sul
+            cam.phi += angle_speed   # Desce
+            if cam.phi > 3.1: cam.phi = 3.1 # Trava para não inverter no polo sul
             
         # --- 3. Panning / Movimento Livre (Setas) ---
         # Move o Ponto de Foco (`target`) pelo espaço, arrastando a câmera junto.
@@ -161,33 +517,49 @@ class Planetario:
         
         # Calcula vetores de direção baseados no ângulo da câmera para mover "para frente/lados" relativo à visão
         # Vetor View (Projetado no chão XZ)
-        dir_x = -math.cos(self.cam_theta)
-        dir_z = -math.sin(self.cam_theta)
+        dir_x = -math.cos(cam.theta)
+        dir_z = -math.sin(cam.theta)
         
         # Vetor Right (Perpendicular à visão) - Strafe
         # Rotacionado 90 graus
-        st_x = math.sin(self.cam_theta)
-        st_z = -math.cos(self.cam_theta)
+        st_x = math.sin(cam.theta)
+        st_z = -math.cos(cam.theta)
+        
+        # Mover o ponto de foco à mão deixa de seguir o objeto selecionado
+        if self.foco is not None and (pressed_keys[pygame.K_UP] or pressed_keys[pygame.K_DOWN] or
+                                      pressed_keys[pygame.K_LEFT] or pressed_keys[pygame.K_RIGHT]):
+            self.soltar_foco()
         
         # Cima/Baixo (Setas): Move na direção da visão
         if pressed_keys[pygame.K_UP]: 
-            self.target_x += dir_x * pan_speed
-            self.target_z += dir_z * pan_speed
+            cam.alvo_x += dir_x * pan_speed
+            cam.alvo_z += dir_z * pan_speed
         if pressed_keys[pygame.K_DOWN]:
-            self.target_x -= dir_x * pan_speed
-            self.target_z -= dir_z * pan_speed
+            cam.alvo_x -= dir_x * pan_speed
+            cam.alvo_z -= dir_z * pan_speed
             
         # Esquerda/Direita (Setas): Move lateralmente (Strafe)
         if pressed_keys[pygame.K_LEFT]:
-            self.target_x -= st_x * pan_speed
-            self.target_z -= st_z * pan_speed
+            cam.alvo_x -= st_x * pan_speed
+            cam.alvo_z -= st_z * pan_speed
         if pressed_keys[pygame.K_RIGHT]:
-             self.target_x += st_x * pan_speed
-             self.target_z += st_z * pan_speed
+             cam.alvo_x += st_x * pan_speed
+             cam.alvo_z += st_z * pan_speed
 
     def processar_evento(self, event):
         """Processa eventos discretos (clique único)."""
-        if event.type == pygame.KEYDOWN:
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            # Botão esquerdo foca o objeto clicado; direito solta o foco
+            if event.button == 1:
+                self.selecionar(*event.pos)
+            elif event.button == 3:
+                self.soltar_foco()
+        
+        elif event.type == pygame.KEYDOWN and self.remota is not None and event.key in TECLAS_SIMULACAO:
+            # O estado muda no processo da simulação e volta no próximo instantâneo
+            self.remota.enviar('tecla', event.key)
+        
+        elif event.type == pygame.KEYDOWN:
             # INSERT alterna a visibilidade das linhas de órbita
             # INSERT alterna a visibilidade das linhas de órbita
             if event.key == pygame.K_INSERT:
@@ -196,224 +568,237 @@ class Planetario:
             # F pausa/despausa a simulação
             elif event.key == pygame.K_f:
                 self.paused = not self.paused
+            
+            # . e , aceleram/desaceleram o tempo (x10); Backspace volta para 1x
+            # (mudar a velocidade sai do tempo real, mas mantém as posições reais)
+            elif event.key == pygame.K_PERIOD:
+                self.tempo_real = False
+                self.relogio.definir_warp(self.relogio.warp * 10.0)
+            elif event.key == pygame.K_COMMA:
+                self.tempo_real = False
+                self.relogio.definir_warp(self.relogio.warp / 10.0)
+            elif event.key == pygame.K_BACKSPACE:
+                self.relogio.definir_warp(1.0)
+            
+            # T liga as posições reais de hoje em tempo real (ou volta às órbitas do catálogo)
+            elif event.key == pygame.K_t:
+                self.alternar_tempo_real()
+            
+            # G liga/desliga a física de N corpos (gravidade mútua a partir das posições reais)
+            elif event.key == pygame.K_g:
+                self.alternar_fisica()
+            
+            # R mostra/oculta os rastros dos corpos (começam vazios)
+            elif event.key == pygame.K_r:
+                self.mostrar_rastros = not self.mostrar_rastros
+                self.rastros.limpar()
+            
+            # B mostra/oculta o cinturão de asteroides
+            elif event.key == pygame.K_b:
+                self.mostrar_cinturao = not self.mostrar_cinturao
+                if self.mostrar_cinturao and self.fisica is None:
+                    self.cinturao.atualizar(self.angle)
+
+    def estado_visual(self):
+        """
+        Tudo o que muda a imagem da cena: tempo, câmera e opções de exibição.
+        Se for igual ao do último quadro desenhado (e não houver texturas
+        chegando), redesenhar produziria a mesma imagem.
+        """
+        # (com a simulação em outro processo, comandos ainda não refletidos também contam como mudança)
+        pendente = self.remota is not None and self.remota.pendente
+        return (self.angle, self.camera.parametros(), self.mostrar_orbitas, self.mostrar_cinturao,
+                self.mostrar_rastros, self.remota.enviados if pendente else None)
+
+    def selecionar(self, x, y):
+        """
+        Picking: lança um raio pelo pixel (x, y) e passa a seguir o corpo (ou,
+        se nenhum for atingido, a partícula do cinturão) mais próximo.
+        Retorna o novo foco (ou None se o clique não atingiu nada).
+        """
+        origem, direcao = raio_do_pixel(self.camera, x, y)
+        tangente = tangente_pixels(self.camera)
+        
+        self.corpos.atualizar(self.angle)
+        i, _ = esfera_atingida(origem, direcao, self.corpos.posicoes(), self.corpos.raio, tangente)
+        if i >= 0:
+            self.foco = ('corpo', i)
+            # Enquadra o corpo: distância proporcional ao raio, dentro dos limites do zoom
+            self.camera.focar(self.posicao_foco(), dist=min(max(self.corpos.raio[i] * 8.0, 5.0), 300.0))
+            return self.foco
+        
+        if self.mostrar_cinturao:
+            j = self.cinturao.selecionar(origem, direcao, tangente)
+            if j >= 0:
+                self.foco = ('asteroide', j)
+                self.camera.focar(self.posicao_foco(), dist=5.0)
+                return self.foco
+        return None
+
+    def posicao_foco(self):
+        """Posição atual do objeto em foco (ou None)."""
+        if self.foco is None:
+            return None
+        tipo, i = self.foco
+        if tipo == 'corpo':
+            self.corpos.atualizar(self.angle)
+            return self.corpos.posicoes()[i]
+        return self.cinturao.posicoes[i]
+
+    def soltar_foco(self):
+        self.foco = None
+        self.camera.soltar()
+
+    def atualizar_camera(self, dt):
+        """Faz a câmera acompanhar o objeto em foco (chamado uma vez por quadro)."""
+        if self.foco is None:
+            return
+        if self.foco[0] == 'asteroide' and not self.mostrar_cinturao:
+            self.soltar_foco()
+            return
+        self.camera.seguir(self.posicao_foco(), dt)
 
     def config_camera_projecao(self, width, height):
-        """Configura a matriz de projeção e a posição da câmera (ModelView)."""
-        if height == 0: height = 1
-        
-        # Define a área de desenho na janela (Viewport)
-        glViewport(0, 0, width, height)
-        
-        # --- Matriz de Projeção (Lente da câmera) ---
-        glMatrixMode(GL_PROJECTION)
-        glLoadIdentity()
-        
-        # Define projeção perspectiva (3D realista)
-        # fovy=45 graus, aspect=tela, near=1.0, far=1000.0 (Aumentado para evitar corte do fundo)
-        gluPerspective(45.0, width / height, 1.0, 1000.0) 
-        
-        # --- Matriz de Modelo/Visão (Posição da câmera) ---
-        glMatrixMode(GL_MODELVIEW)
-        glLoadIdentity()
-        
-        # Converte Coordenadas Esféricas (Distancia, Theta, Phi) -> Cartesianas (x,y,z)
-        # para determinar onde o olho da câmera está.
-        # x = r * sin(phi) * cos(theta)
-        # z = r * sin(phi) * sin(theta)
-        # y = r * cos(phi)
-        
-        ox = self.cam_dist * math.sin(self.cam_phi) * math.cos(self.cam_theta)
-        oz = self.cam_dist * math.sin(self.cam_phi) * math.sin(self.cam_theta)
-        oy = self.cam_dist * math.cos(self.cam_phi)
-        
-        # Posição final da câmera = Posição do Alvo + Offset calculado
-        eyeX = self.target_x + ox
-        eyeY = self.target_y + oy
-        eyeZ = self.target_z + oz
-        
-        # gluLookAt define a posição e para onde a câmera olha
-        gluLookAt(eyeX, eyeY, eyeZ,                    
-                  self.target_x, self.target_y, self.target_z, 
-                  0.0, 1.0, 0.0)                           
-
-    def renderizar(self):
-        """Desenha toda a cena 3D."""
+        """
+        Configura viewport, projeção e câmera (ModelView) para o quadro.
+        As matrizes vêm de `self.camera` e só são reenviadas se algo mudou.
+        """
+        self.camera.definir_viewport(width, height)
+        self.camera.aplicar()
+
+    def renderizar(self, escala=1.0):
+        """
+        Desenha toda a cena 3D. `escala`: resolução do alvo em relação à janela
+        (resolução dinâmica), para o que é medido em pixels.
+        """
         # Limpa o buffer de cor e o buffer de profundidade antes de desenhar novo quadro
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        estatisticas.zerar()
+        
+        # Envia à GPU (dentro do orçamento do quadro) as texturas que terminaram de carregar
+        self.texturas.processar()
+        
+        # Fundo e corpos usam a cor corrente branca (GL_COLOR_MATERIAL modula as texturas);
+        # a interface do quadro anterior pode tê-la deixado com outra cor.
+        estado_gl.cor(1.0, 1.0, 1.0, 1.0)
         
         # --- 1. Desenha Background (Sky Sphere) ---
         # Desenha uma grande esfera ao redor da cena para simular o espaço 3D (não mais "reto")
         
-        glDisable(GL_LIGHTING)      # O fundo deve ter brilho próprio (textura), não ser afetado por luzes
-        glDepthMask(GL_FALSE)       # Não escreve no Z-Buffer (fundo fica sempre atrás)
+        estado_gl.desabilitar(GL_LIGHTING)      # O fundo deve ter brilho próprio (textura), não ser afetado por luzes
+        estado_gl.mascara_profundidade(False)   # Não escreve no Z-Buffer (fundo fica sempre atrás)
         
         glPushMatrix()
         glRotatef(-90, 1, 0, 0)     # Ajusta orientação da textura do espaço
         desenhar_esfera_interna(350.0, self.texture_ids['fundo'])
         glPopMatrix()
         
-        glDepthMask(GL_TRUE)        # Volta a escrever no Z-Buffer
-        glEnable(GL_LIGHTING)       # Re-habilita iluminação para os planetas
+        estado_gl.mascara_profundidade(True)    # Volta a escrever no Z-Buffer
+        estado_gl.habilitar(GL_LIGHTING)        # Re-habilita iluminação para os planetas
+        
+        # --- 2. Transformações de todos os corpos (grafo de cena) ---
+        self.corpos.atualizar(self.angle)
+        
+        # Nível de detalhe: raio projetado (px) de todos os corpos de uma vez
+        distancias = np.linalg.norm(self.corpos.posicoes() - np.array(self.camera.posicao), axis=1)
+        raios_px = self.corpos.raio * self.camera.distancia_focal_px / np.maximum(distancias, 1e-3)
+        self.niveis_lod = self.lod.selecionar(raios_px)
+        
+        # Culling: esferas envolventes de todos os corpos testadas contra o frustum de uma vez
+        planos = self.camera.planos
+        self.visiveis = esferas_visiveis(planos, self.corpos.posicoes(), self.corpos.raio_limite)
+        desenhados = int(self.visiveis.sum())
+        descartados = len(self.visiveis) - desenhados
         
-        # --- 2. Iluminação do SOL ---
+        # --- 3. Iluminação do SOL ---
         # Configura a luz para desenhar o Sol. 
+        # A posição é transformada pela ModelView atual: vai ao driver todo quadro.
         light_pos = [0.0, 0.0, 0.0, 1.0]
         glLightfv(GL_LIGHT0, GL_POSITION, light_pos)
         
         # Sol aceso (Ambiente alto)
-        glLightfv(GL_LIGHT0, GL_AMBIENT, [1.0, 1.0, 1.0, 1.0])
+        estado_gl.luz(GL_LIGHT0, GL_AMBIENT, (1.0, 1.0, 1.0, 1.0))
         # Difusa alta para iluminar planetas
-        glLightfv(GL_LIGHT0, GL_DIFFUSE, [1.5, 1.5, 1.5, 1.0])
+        estado_gl.luz(GL_LIGHT0, GL_DIFFUSE, (1.5, 1.5, 1.5, 1.0))
 
-        # Desenha o SOL
-        glPushMatrix()
         # Material brilhante
-        mat_specular = [1.0, 1.0, 1.0, 1.0]
-        mat_shininess = [50.0]
-        glMaterialfv(GL_FRONT, GL_SPECULAR, mat_specular)
-        glMaterialfv(GL_FRONT, GL_SHININESS, mat_shininess)
-        # Emissão
-        glMaterialfv(GL_FRONT, GL_EMISSION, [0.3, 0.3, 0.3, 1.0]) 
-        
-        glPushMatrix()
-        glRotatef(self.angle * 0.9, 0.0, 1.0, 0.0)
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(5.0, self.texture_ids['sun'])
-        glPopMatrix()
-        
+        mat_specular = (1.0, 1.0, 1.0, 1.0)
+        mat_shininess = (50.0,)
+        estado_gl.material(GL_FRONT, GL_SPECULAR, mat_specular)
+        estado_gl.material(GL_FRONT, GL_SHININESS, mat_shininess)
+        
+        # Desenha os corpos emissivos (o SOL) com emissão ligada
+        estado_gl.material(GL_FRONT, GL_EMISSION, (0.3, 0.3, 0.3, 1.0))
+        for i in range(len(self.corpos)):
+            if self.corpos.emissivos[i] and self.visiveis[i]:
+                self._desenhar_corpo(i)
         # Desliga Emissão
-        glMaterialfv(GL_FRONT, GL_EMISSION, [0.0, 0.0, 0.0, 1.0])
-        glPopMatrix()
+        estado_gl.material(GL_FRONT, GL_EMISSION, (0.0, 0.0, 0.0, 1.0))
         
-        # --- 3. Iluminação dos PLANETAS ---
+        # --- 4. Iluminação dos PLANETAS ---
         # Modo Solar Fixo: Ambiente baixo (sombra nos lados opostos ao sol)
-        glLightfv(GL_LIGHT0, GL_AMBIENT, [0.05, 0.05, 0.05, 1.0])
-        
-        # --- 4. Desenho dos Corpos Celestes ---
-        # O sistema usa transformações hierárquicas (Pilha de Matrizes - Push/Pop)
-        # Ordem: Translação Base -> Rotação Base -> Desenha ou (Nova Push -> Translação lua...)
-        
-        # OBSERVAÇÃO CRÍTICA DO ERRO ANTERIOR: 
-        # O código original tinha um glPushMatrix() ENVOLVENDO TODO O SISTEMA SOLAR (Sol + Planetas).
-        # Ao editar o desenho do Sol, eu removi esse Push inicial "acidentalmente" ou o `replace` comeu ele, 
-        # mas mantive o `glPopMatrix()` no final do arquivo (linha 432).
-        # Vamos reinsirir o Push Mestre aqui para garantir que o Pop final tenha par.
-        glPushMatrix() 
-        
-        # --- MERCÚRIO ---
-        glPushMatrix()
-        glRotatef(self.angle * 4.15, 0.0, 1.0, 0.0) # Órbita rápida
-        glTranslatef(6.0, 0.0, 0.0)                 # Distância do Sol
-        glPushMatrix()
-        glRotatef(self.rotation * 50, 0.0, 1.0, 0.0) # Rotação própria
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(0.38, self.texture_ids['mercury'])
-        glPopMatrix()
-        glPopMatrix()
-        if self.mostrar_orbitas: desenhar_anel(6.0, 6.08, None)
-        
-        # --- VÊNUS ---
-        glPushMatrix()
-        glRotatef(self.angle * 1.62, 0.0, 1.0, 0.0)
-        glTranslatef(8.0, 0.0, 0.0)
-        glPushMatrix()
-        glRotatef(self.rotation * -0.9, 0.0, 1.0, 0.0) # Rotação retrógrada
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(0.85, self.texture_ids['venus'])
-        glPopMatrix()
-        glPopMatrix()
-        if self.mostrar_orbitas: desenhar_anel(8.0, 8.08, None)
-        
-        # --- TERRA ---
-        glPushMatrix()
-        glRotatef(self.angle, 0.0, 1.0, 0.0) # Órbita padrão (referência 1.0)
-        glTranslatef(10.0, 0.0, 0.0)
-        # Desenha Terra
-        glPushMatrix()
-        glRotatef(self.rotation, 0.0, 1.0, 0.0)
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(1.0, self.texture_ids['earth'])
-        glPopMatrix()
-        
-        # --- LUA (Filha da Terra) ---
-        # Continua na matriz da Terra (já transladada para 10.0), então translação é local
-        glPushMatrix()
-        glRotatef(self.rotation, 0.0, 1.0, 0.0) # Rotação da Lua ao redor da Terra
-        glTranslatef(1.5, 0.0, 0.0)             # Distância Lua-Terra
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(0.3, self.texture_ids['moon'])
-        glPopMatrix()
-        if self.mostrar_orbitas: desenhar_anel(1.5, 1.55, None)
-        
-        glPopMatrix() # Fim do escopo da Terra
-        if self.mostrar_orbitas: desenhar_anel(10.0, 10.08, None) # Órbita da Terra
-        
-        # --- MARTE ---
-        glPushMatrix()
-        glRotatef(self.angle * 0.53, 0.0, 1.0, 0.0)
-        glTranslatef(13.0, 0.0, 0.0)
-        glPushMatrix()
-        glRotatef(self.rotation * 3, 0.0, 1.0, 0.0)
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(0.53, self.texture_ids['mars'])
-        glPopMatrix()
-        glPopMatrix()
-        if self.mostrar_orbitas: desenhar_anel(13.0, 13.08, None)
-        
-        # --- JÚPITER ---
-        glPushMatrix()
-        glRotatef(self.angle * 0.3, 0.0, 1.0, 0.0)
-        glTranslatef(17.0, 0.0, 0.0)
-        glPushMatrix()
-        glRotatef(self.angle * 7, 0.0, 1.0, 0.0)
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(1.85, self.texture_ids['jupiter'])
-        glPopMatrix()
-        glPopMatrix()
-        if self.mostrar_orbitas: desenhar_anel(17.0, 17.08, None)
-        
-        # --- SATURNO ---
-        glPushMatrix()
-        glRotatef(self.angle * 0.2, 0.0, 1.0, 0.0)
-        glTranslatef(23.0, 0.0, 0.0)
-        glPushMatrix()
-        glRotatef(self.angle * 7, 0.0, 1.0, 0.0)
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(1.55, self.texture_ids['saturn'])
-        glPopMatrix()
-        
-        # Anéis de Saturno
-        glPushMatrix()
-        # Textura específica para anéis
-        desenhar_anel(2.0, 2.5, self.texture_ids['satRing'])
-        glPopMatrix()
-        
-        glPopMatrix() # Fim Saturno
-        if self.mostrar_orbitas: desenhar_anel(23.0, 23.08, None)
-        
-        # --- URANO ---
-        glPushMatrix()
-        glRotatef(self.angle * 0.16, 0.0, 1.0, 0.0)
-        glTranslatef(27.0, 0.0, 0.0)
-        glPushMatrix()
-        glRotatef(self.angle * 12, 0.0, 1.0, 0.0)
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(1.2, self.texture_ids['uranus'])
-        # Anéis removidos conforme solicitação visual
-        glPopMatrix()
-        glPopMatrix()
-        if self.mostrar_orbitas: desenhar_anel(27.0, 27.08, None)
-        
-        # --- NETUNO ---
-        glPushMatrix()
-        glRotatef(self.angle * 0.1, 0.0, 1.0, 0.0)
-        glTranslatef(33.0, 0.0, 0.0)
+        estado_gl.luz(GL_LIGHT0, GL_AMBIENT, (0.05, 0.05, 0.05, 1.0))
+        
+        # --- 5. Desenho dos Corpos Celestes ---
+        # Cada corpo usa a matriz de mundo já calculada pelo grafo de cena
+        # (órbita do pai -> órbita própria -> giro), sem pilha de Push/Pop aninhada.
+        for i in range(len(self.corpos)):
+            if not self.corpos.emissivos[i] and self.visiveis[i]:
+                self._desenhar_corpo(i)
+        
+        # Linhas de órbita: todas em um único array de vértices e uma única chamada
+        if self.mostrar_orbitas:
+            centros, raios = self.linhas_orbita.esferas_limite(self.corpos.posicoes())
+            self.linhas_orbita.visiveis = esferas_visiveis(planos, centros, raios)
+            desenhados += int(self.linhas_orbita.visiveis.sum())
+            descartados += len(self.linhas_orbita) - int(self.linhas_orbita.visiveis.sum())
+            self.linhas_orbita.atualizar(self.corpos.orbitas, self.corpos.posicoes(),
+                                         self.camera.posicao, self.camera.distancia_focal_px)
+            self.linhas_orbita.desenhar()
+        
+        # Rastros: histórico recente de todos os corpos em uma única chamada
+        if self.mostrar_rastros:
+            self._atualizar_rastros()
+            self.rastros.desenhar()
+            desenhados += 1
+        
+        # --- 6. Cinturão de Asteroides ---
+        # Desenhado por último: partículas translúcidas sobre os corpos opacos
+        if self.mostrar_cinturao:
+            if esferas_visiveis(planos, (0.0, 0.0, 0.0), self.cinturao.raio_limite)[0]:
+                self.cinturao.desenhar(escala)
+                desenhados += 1
+            else:
+                descartados += 1
+        
+        self.objetos_desenhados = desenhados
+        self.objetos_descartados = descartados
+        
+        # Triângulos enviados neste quadro (esferas, anéis e fundo)
+        self.triangulos_quadro = estatisticas.triangulos
+
+    def _atualizar_rastros(self):
+        """Acrescenta o quadro atual aos rastros (recomeçando-os se a origem das posições mudou)."""
+        # Trocar entre órbitas do catálogo, efemérides e física teletransporta os corpos
+        modo = (self.modo_data, self.fisica is not None)
+        if modo != self._modo_rastros:
+            self._modo_rastros = modo
+            self.rastros.limpar()
+        self.rastros.atualizar(self.angle, self.corpos.posicoes(), self.velocidade_tempo())
+
+    def _desenhar_corpo(self, i):
+        """Desenha a esfera do corpo `i` e seus anéis (se houver)."""
         glPushMatrix()
-        glRotatef(self.angle * 6, 0.0, 1.0, 0.0)
-        glRotatef(-90, 1.0, 0.0, 0.0)
-        desenhar_esfera(1.38, self.texture_ids['neptune'])
-        glPopMatrix()
+        glMultMatrixf(self.corpos.corpos_gl[i])
+        slices, stacks = self.lod.tesselacao(self.niveis_lod[i])
+        desenhar_esfera(self.corpos.raio[i], self.texture_ids.get(self.corpos.texturas[i]), slices, stacks)
         glPopMatrix()
-        if self.mostrar_orbitas: desenhar_anel(33.0, 33.08, None)
         
-        glPopMatrix() # Finaliza matrix principal (do Sol)
+        aneis = self.corpos.aneis[i]
+        if aneis:
+            # Anéis ficam no referencial orbital (não giram com o planeta)
+            raio_interno, raio_externo, textura = aneis
+            glPushMatrix()
+            glMultMatrixf(self.corpos.orbitas_gl[i])
+            desenhar_anel(raio_interno, raio_externo, self.texture_ids.get(textura))
+            glPopMatrix()
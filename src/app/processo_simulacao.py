@@ -0,0 +1,323 @@
+# src/app/processo_simulacao.py
+# Simulação em um processo separado (opcional; ver SIMULACAO_EM_PROCESSO).
+# A lógica de `Planetario.atualizar` (relógio, efemérides, física, cinturão)
+# roda em um processo filho com um `Planetario(grafico=False)`; o processo da
+# janela só desenha. Assim, um passo pesado (N corpos, muitas partículas) não
+# atrasa o quadro, e os dois processos usam núcleos diferentes.
+#
+# Comunicação:
+#   - janela -> simulação: fila de comandos (tempo do quadro, teclas, data)
+#   - simulação -> janela: fila de erros (exceção de um comando; o processo continua)
+#   - simulação -> janela: instantâneo em memória compartilhada com dois
+#     slots (double buffer). A simulação escreve no slot que não está
+#     publicado nem em uso e publica trocando um número de sequência; a
+#     janela lê o último publicado direto da memória (vistas NumPy, sem
+#     cópia). Só a troca de índices no cabeçalho passa por uma trava entre
+#     processos (uma vez por quadro de cada lado); a cópia dos dados não.
+#
+# O tempo da simulação continua sendo o dos quadros da janela (cada quadro
+# envia o seu dt): pausa, tela de ajuda e modo ocioso valem como antes.
+
+import multiprocessing
+import queue
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# Valores escalares do instantâneo (float64, nesta ordem)
+CAMPOS = ('tempo', 'warp', 'pausado', 'modo_data', 'tempo_real', 'mostrar_cinturao', 'particulas',
+          'fisica', 'barnes_hut', 'fontes', 'corpos_fisica', 'passos_fisica', 'deriva', 'processados')
+_CAMPO = {nome: k for k, nome in enumerate(CAMPOS)}
+
+# Cabeçalho (int64): sequência publicada (0 = nada ainda; slot = sequência % 2) e slot em uso pela leitura
+_PUBLICADO, _EM_USO = 0, 1
+TAMANHO_CABECALHO = 64
+
+# Espera (s) por comandos com um instantâneo ainda não publicado (a janela segurava o slot livre)
+ESPERA_PUBLICAR = 0.002
+
+# Intervalo (s) entre cálculos da deriva de energia da física (só para o painel)
+INTERVALO_DERIVA = 0.25
+
+# Tempo (s) para o processo encerrar sozinho antes de ser terminado
+ESPERA_ENCERRAR = 2.0
+
+class _Slot:
+    """Vistas NumPy de um slot do instantâneo."""
+    def __init__(self, buffer, deslocamento, formas, somente_leitura):
+        for nome, (forma, tipo) in formas.items():
+            array = np.ndarray(forma, dtype=tipo, buffer=buffer, offset=deslocamento)
+            if somente_leitura:
+                array.flags.writeable = False
+            setattr(self, nome, array)
+            deslocamento += array.nbytes
+
+    def valor(self, nome):
+        return float(self.valores[_CAMPO[nome]])
+
+class InstantaneoCompartilhado:
+    """
+    Dois slots com o estado que o desenho precisa: valores escalares,
+    matrizes de mundo dos corpos (orbital e de desenho), parâmetros das
+    linhas de órbita e posições do cinturão.
+
+    Escrita (processo da simulação):
+        slot = instantaneo.slot_livre()      # None se a leitura ainda segura o único livre
+        ... preenche slot ...
+        instantaneo.publicar()
+
+    Leitura (janela):
+        slot = instantaneo.ler()             # último publicado (ou None); válido até a próxima `ler`
+
+    O cabeçalho (sequência publicada, slot em uso) só é lido e escrito com a
+    `trava` (compartilhada entre os processos: quem cria o instantâneo cria a
+    trava e o filho a recebe junto com o `nome`). Ela também serve de barreira
+    de memória: o que a escrita gravou no slot antes de `publicar` é visto
+    pela leitura depois de `ler`.
+    """
+    def __init__(self, corpos, orbitas, particulas, nome=None, trava=None):
+        self._formas = {
+            'valores': ((len(CAMPOS),), np.float64),
+            'orbitas': ((corpos, 4, 4), np.float64),
+            'corpos': ((corpos, 4, 4), np.float64),
+            'linhas': ((orbitas, 5), np.float64),
+            'cinturao': ((particulas, 3), np.float32),
+        }
+        tamanho_slot = sum(int(np.prod(forma)) * np.dtype(tipo).itemsize for forma, tipo in self._formas.values())
+        tamanho_slot = -(-tamanho_slot // 64) * 64
+        self.dimensoes = (corpos, orbitas, particulas)
+
+        self._dono = nome is None
+        self.trava = trava if trava is not None else multiprocessing.get_context('spawn').Lock()
+        if self._dono:
+            self.memoria = shared_memory.SharedMemory(create=True, size=TAMANHO_CABECALHO + 2 * tamanho_slot)
+        else:
+            # O filho (spawn) usa o mesmo rastreador de recursos da janela: o registro
+            # repetido não muda nada e quem apaga é só quem criou (`liberar`)
+            self.memoria = shared_memory.SharedMemory(name=nome)
+        self.nome = self.memoria.name
+
+        self._cabecalho = np.ndarray((2,), dtype=np.int64, buffer=self.memoria.buf)
+        if self._dono:
+            self._cabecalho[:] = (0, -1)
+        # A escrita vê os slots graváveis; a leitura, só leitura (protege contra escrita acidental)
+        self._slots = [_Slot(self.memoria.buf, TAMANHO_CABECALHO + k * tamanho_slot, self._formas,
+                             somente_leitura=self._dono) for k in range(2)]
+        self.sequencia = 0
+
+    # ---------------- escrita ----------------
+
+    def slot_livre(self):
+        """Slot para o próximo instantâneo, ou None se a leitura está usando o único que não está publicado."""
+        with self.trava:
+            alvo = (int(self._cabecalho[_PUBLICADO]) + 1) % 2
+            if int(self._cabecalho[_EM_USO]) == alvo:
+                return None
+        # A leitura só passa a usar um slot depois de publicado: este fica livre até `publicar`
+        return self._slots[alvo]
+
+    def publicar(self):
+        with self.trava:
+            self._cabecalho[_PUBLICADO] += 1
+
+    # ---------------- leitura ----------------
+
+    def ler(self):
+        """Último instantâneo publicado (ou None, se ainda não houve nenhum)."""
+        with self.trava:
+            sequencia = int(self._cabecalho[_PUBLICADO])
+            if sequencia == 0:
+                return None
+            # Marca o slot como em uso: a escrita não volta a ele enquanto estiver marcado
+            self._cabecalho[_EM_USO] = sequencia % 2
+        self.sequencia = sequencia
+        return self._slots[sequencia % 2]
+
+    def liberar(self):
+        self._slots = []
+        self._cabecalho = None
+        self.memoria.close()
+        if self._dono:
+            self.memoria.unlink()
+
+class ResumoFisica:
+    """Números da física de N corpos vindos do instantâneo (mesma interface usada pelo painel F3)."""
+    def __init__(self, slot):
+        self.metodo = 'barnes-hut' if slot.valor('barnes_hut') else 'direta'
+        self.quantidade_fontes = int(slot.valor('fontes'))
+        self.passos = int(slot.valor('passos_fisica'))
+        self._quantidade = int(slot.valor('corpos_fisica'))
+        self._deriva = slot.valor('deriva')
+
+    def __len__(self):
+        return self._quantidade
+
+    def deriva_energia(self):
+        return self._deriva
+
+def escrever_estado(planetario, slot, processados, deriva):
+    """Copia o estado de um `Planetario` (processo da simulação) para um slot."""
+    corpos = planetario.corpos
+    corpos.atualizar(planetario.angle)
+    slot.orbitas[:] = corpos.orbitas
+    slot.corpos[:] = corpos.corpos
+    slot.linhas[:] = planetario.linhas_orbita.parametros()
+
+    particulas = 0
+    if planetario.mostrar_cinturao:
+        posicoes = planetario.cinturao.posicoes
+        particulas = min(len(posicoes), len(slot.cinturao))
+        slot.cinturao[:particulas] = posicoes[:particulas]
+
+    fisica = planetario.fisica
+    valores = {
+        'tempo': planetario.angle, 'warp': planetario.relogio.warp, 'pausado': planetario.paused, 'modo_data': planetario.modo_data,
+        'tempo_real': planetario.tempo_real, 'mostrar_cinturao': planetario.mostrar_cinturao,
+        'particulas': particulas, 'fisica': fisica is not None, 'processados': processados,
+    }
+    if fisica is not None:
+        valores.update(barnes_hut=fisica.metodo == 'barnes-hut', fontes=fisica.quantidade_fontes,
+                       corpos_fisica=len(fisica), passos_fisica=fisica.passos, deriva=deriva)
+    for nome, valor in valores.items():
+        slot.valores[_CAMPO[nome]] = valor
+
+def _executar(nome_memoria, trava, comandos, erros):
+    """Laço do processo da simulação: aplica os comandos em lote e publica o estado."""
+    import time
+    import pygame
+    from src.app.planetario import Planetario
+
+    planetario = Planetario(grafico=False)
+    corpos, orbitas, particulas = len(planetario.corpos), len(planetario.linhas_orbita), planetario.cinturao.quantidade
+    instantaneo = InstantaneoCompartilhado(corpos, orbitas, particulas, nome=nome_memoria, trava=trava)
+
+    processados = 0
+    pendente = True
+    deriva, ultima_deriva = 0.0, 0.0
+    try:
+        while True:
+            # Sem instantâneo pendente, dorme até o próximo comando
+            try:
+                lote = [comandos.get(timeout=ESPERA_PUBLICAR if pendente else None)]
+            except queue.Empty:
+                lote = []
+            while True:
+                try:
+                    lote.append(comandos.get_nowait())
+                except queue.Empty:
+                    break
+
+            dt, fator = 0.0, 1.0
+            for comando in lote:
+                processados += 1
+                tipo, argumentos = comando[0], comando[1:]
+                if tipo == 'sair':
+                    return
+                elif tipo == 'avancar':
+                    dt += argumentos[0]
+                    fator = argumentos[1]
+                    continue
+                # Um comando que falha não derruba o processo: a exceção volta para a janela
+                try:
+                    if tipo == 'tecla':
+                        planetario.processar_evento(pygame.event.Event(pygame.KEYDOWN, key=argumentos[0]))
+                    else:
+                        getattr(planetario, tipo)(*argumentos)
+                except Exception as erro:
+                    erros.put(erro)
+            if dt > 0.0:
+                planetario.atualizar(dt, fator_velocidade=fator)
+            pendente = pendente or bool(lote)
+
+            if planetario.fisica is not None and time.perf_counter() - ultima_deriva > INTERVALO_DERIVA:
+                deriva, ultima_deriva = planetario.fisica.deriva_energia(), time.perf_counter()
+
+            if pendente:
+                slot = instantaneo.slot_livre()
+                if slot is not None:
+                    escrever_estado(planetario, slot, processados, deriva)
+                    instantaneo.publicar()
+                    pendente = False
+    finally:
+        instantaneo.liberar()
+
+class SimulacaoRemota:
+    """
+    Lado da janela: inicia o processo da simulação, envia comandos e aplica
+    o último instantâneo a um `Planetario` que só desenha.
+    """
+    def __init__(self, planetario):
+        self.instantaneo = InstantaneoCompartilhado(len(planetario.corpos), len(planetario.linhas_orbita),
+                                                    planetario.cinturao.quantidade)
+        # `spawn`: o filho não herda o contexto OpenGL/SDL da janela
+        contexto = multiprocessing.get_context('spawn')
+        self.comandos = contexto.Queue()
+        self.erros = contexto.Queue()
+        self.processo = contexto.Process(target=_executar, args=(self.instantaneo.nome, self.instantaneo.trava,
+                                                                   self.comandos, self.erros),
+                                         name="simulacao", daemon=True)
+        self.processo.start()
+
+        # Comandos enviados e já refletidos no último instantâneo aplicado
+        self.enviados = 0
+        self.processados = 0
+        self._sequencia = 0
+
+    def enviar(self, tipo, *argumentos):
+        self.comandos.put((tipo,) + argumentos)
+        self.enviados += 1
+
+    @property
+    def pendente(self):
+        """Se há comandos que ainda não chegaram à tela (o próximo instantâneo vai mudar algo)."""
+        return self.processados < self.enviados
+
+    def aplicar(self, planetario):
+        """
+        Passa o último instantâneo ao `planetario` (sem copiar as matrizes nem o cinturão).
+        Se um comando falhou na simulação, levanta aqui a mesma exceção (como se
+        ele tivesse rodado neste processo); a simulação continua rodando.
+        """
+        try:
+            erro = self.erros.get_nowait()
+        except queue.Empty:
+            pass
+        else:
+            raise erro
+        slot = self.instantaneo.ler()
+        if slot is None or self.instantaneo.sequencia == self._sequencia:
+            if self.pendente and not self.processo.is_alive():
+                raise RuntimeError(f"O processo da simulação terminou (código {self.processo.exitcode})")
+            return
+        self._sequencia = self.instantaneo.sequencia
+        self.processados = int(slot.valor('processados'))
+
+        planetario.angle = slot.valor('tempo')
+        planetario.relogio.warp = slot.valor('warp')
+        planetario.paused = bool(slot.valor('pausado'))
+        planetario.modo_data = bool(slot.valor('modo_data'))
+        planetario.tempo_real = bool(slot.valor('tempo_real'))
+        planetario.mostrar_cinturao = bool(slot.valor('mostrar_cinturao'))
+        planetario.fisica = ResumoFisica(slot) if slot.valor('fisica') else None
+
+        planetario.corpos.definir_transformacoes(slot.orbitas, slot.corpos, planetario.angle)
+        planetario.linhas_orbita.definir_parametros(slot.linhas)
+
+        particulas = int(slot.valor('particulas'))
+        if planetario.mostrar_cinturao:
+            if (planetario.foco is not None and planetario.foco[0] == 'asteroide'
+                    and planetario.foco[1] >= particulas):
+                planetario.soltar_foco()
+            planetario.cinturao.definir_posicoes(slot.cinturao[:particulas])
+
+    def encerrar(self):
+        """Pede ao processo para sair (termina-o se não sair a tempo) e libera a memória."""
+        if self.processo.is_alive():
+            self.enviar('sair')
+            self.processo.join(ESPERA_ENCERRAR)
+            if self.processo.is_alive():
+                self.processo.terminate()
+                self.processo.join()
+        self.comandos.close()
+        self.erros.close()
+        self.instantaneo.liberar()
@@ -0,0 +1,138 @@
+# src/app/rastros.py
+# Rastros dos corpos: as posições recentes de cada corpo, esmaecendo com a idade.
+# Todo o histórico fica em um único array pré-alocado (corpos x amostras) usado
+# como buffer circular; nada é alocado por quadro e todos os rastros são
+# desenhados em uma chamada (glMultiDrawArrays com alpha por vértice).
+#
+# O anel é "espelhado": cada amostra é escrita em k e em k + amostras, então as
+# últimas `amostras` posições de um corpo são sempre um trecho contíguo do
+# array (sem remontar a ordem quando o anel dá a volta).
+
+import numpy as np
+from OpenGL.GL import *
+
+from src.config import AMOSTRAS_RASTRO, DURACAO_RASTRO
+from src.formas.buffers import BufferStreaming
+from src.formas.estado_gl import estado_gl
+
+# Cor de cada rastro (RGB) pelo nome do corpo; os demais usam COR_RASTRO
+CORES_RASTRO = {
+    'mercury': (0.75, 0.7, 0.65),
+    'venus': (0.95, 0.8, 0.5),
+    'earth': (0.4, 0.7, 1.0),
+    'moon': (0.8, 0.8, 0.8),
+    'mars': (1.0, 0.5, 0.35),
+    'jupiter': (0.95, 0.75, 0.55),
+    'saturn': (0.95, 0.85, 0.6),
+    'uranus': (0.6, 0.9, 0.95),
+    'neptune': (0.45, 0.55, 1.0),
+}
+COR_RASTRO = (0.7, 0.7, 0.7)
+
+# Alpha da amostra mais nova (a mais velha chega a zero)
+ALFA_RASTRO = 0.9
+
+class Rastros:
+    """
+    Histórico de posições de `corpos` (índices no `SistemaCorpos`).
+
+    `atualizar(tempo, posicoes, velocidade)` é chamado a cada quadro desenhado:
+    a posição atual vira a ponta do rastro e uma amostra é guardada a cada
+    `velocidade * duracao / amostras` unidades de tempo simulado. Assim o
+    intervalo entre amostras acompanha o time warp: o rastro cobre sempre os
+    últimos `duracao` segundos reais de movimento com o mesmo número de
+    amostras (no máximo uma por quadro), em qualquer velocidade.
+    """
+    def __init__(self, corpos, nomes, amostras=AMOSTRAS_RASTRO, duracao=DURACAO_RASTRO):
+        self.corpos = np.asarray(corpos, dtype=np.int64)
+        self.amostras = max(2, int(amostras))
+        self.duracao = float(duracao)
+        n, s = len(self.corpos), self.amostras
+
+        # (corpo, 2 * amostras, xyz + rgba): posições espelhadas e cor intercaladas, prontas para o VBO
+        self._dados = np.zeros((n, 2 * s, 7), dtype=np.float32)
+        self._dados[:, :, 3:6] = np.array([CORES_RASTRO.get(nomes[i], COR_RASTRO) for i in self.corpos],
+                                          dtype=np.float32).reshape(n, 1, 3)
+
+        # Alpha por idade: a janela [s - fim, 3s - fim) dá o alpha dos 2s slots com a ponta em `fim`
+        idade = 2 * s - np.arange(3 * s + 1)
+        self._alfas = (ALFA_RASTRO * np.clip(1.0 - idade / s, 0.0, 1.0) * (idade >= 0)).astype(np.float32)
+
+        self._bases = np.arange(n, dtype=np.int32) * 2 * s
+        self._inicios = np.zeros(n, dtype=np.int32)
+        self._quantidades = np.zeros(n, dtype=np.int32)
+
+        self._buffer = None
+        self.limpar()
+
+    def __len__(self):
+        return len(self.corpos)
+
+    def limpar(self):
+        """Esquece o histórico (ex.: a posição dos corpos saltou)."""
+        self._ultima = -1          # slot da amostra mais nova guardada
+        self.guardadas = 0         # amostras guardadas (até `amostras`)
+        self._tempo_amostra = None
+        self.fim = 0               # slot escrito por último (ponta do rastro)
+        self.quantidade = 0        # vértices desenhados por corpo
+
+    def intervalo(self, velocidade):
+        """Tempo simulado entre amostras para `velocidade` (unidades por segundo real)."""
+        return abs(velocidade) * self.duracao / self.amostras
+
+    def atualizar(self, tempo, posicoes, velocidade):
+        """
+        Registra o quadro. `posicoes`: posições (N, 3) de todos os corpos do
+        sistema; `velocidade`: unidades de tempo simulado por segundo real.
+        """
+        s = self.amostras
+        if self._tempo_amostra is not None:
+            decorrido = tempo - self._tempo_amostra
+            # Tempo voltando ou salto maior que o rastro inteiro: o traço ligaria posições sem relação
+            if decorrido < 0.0 or decorrido > s * max(self.intervalo(velocidade), 1e-9):
+                self.limpar()
+
+        # A ponta fica no slot seguinte à última amostra (os dois lados do espelho)
+        ponta = (self._ultima + 1) % s
+        atuais = posicoes[self.corpos]
+        self._dados[:, ponta, :3] = atuais
+        self._dados[:, ponta + s, :3] = atuais
+
+        if self._tempo_amostra is None or (tempo != self._tempo_amostra and
+                                           tempo - self._tempo_amostra >= self.intervalo(velocidade)):
+            # A ponta vira amostra: o próximo quadro escreve no slot seguinte
+            self._ultima = ponta
+            self._tempo_amostra = tempo
+            self.guardadas = min(self.guardadas + 1, s)
+            self.quantidade = self.guardadas
+        else:
+            self.quantidade = min(self.guardadas + 1, s)
+        self.fim = ponta
+
+        np.copyto(self._dados[:, :, 6], self._alfas[s - ponta:3 * s - ponta])
+        np.add(self._bases, ponta + s - self.quantidade + 1, out=self._inicios)
+        self._quantidades.fill(self.quantidade)
+
+    def desenhar(self):
+        """Desenha todos os rastros em uma chamada (linhas com alpha por vértice)."""
+        if len(self.corpos) == 0 or self.quantidade < 2:
+            return
+        if self._buffer is None:
+            self._buffer = BufferStreaming()
+        self._buffer.enviar(self._dados.reshape(-1, 7))
+
+        estado_gl.empilhar()
+        estado_gl.desabilitar(GL_LIGHTING)
+        estado_gl.desabilitar(GL_TEXTURE_2D)
+        estado_gl.mascara_profundidade(False)
+        estado_gl.habilitar(GL_BLEND)
+        estado_gl.funcao_blend(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        self._buffer.desenhar_multiplos(GL_LINE_STRIP, self._inicios, self._quantidades, cores=True)
+        estado_gl.cor_indefinida()
+        estado_gl.desempilhar()
+
+    def liberar(self):
+        """Libera os recursos OpenGL."""
+        if self._buffer is not None:
+            self._buffer.liberar()
+            self._buffer = None
@@ -0,0 +1,81 @@
+# src/app/relogio.py
+# Relógio da simulação com passo fixo (acumulador).
+# O tempo real de cada quadro é acumulado e consumido em passos de tamanho fixo;
+# a renderização usa o tempo interpolado entre os dois últimos passos.
+
+from src.config import PASSO_SIMULACAO, PASSOS_MAX_POR_QUADRO, VELOCIDADE_SIMULACAO, WARP_MAX
+
+class RelogioSimulacao:
+    """
+    Desacopla os passos da simulação da taxa de quadros.
+
+    - `passo`: duração (s, tempo real) de cada passo fixo.
+    - `velocidade`: unidades de tempo simulado por segundo real em 1x.
+    - `warp`: multiplicador do tempo (1x até `WARP_MAX`). Cada passo avança
+      `passo * velocidade * warp` de tempo simulado, então acelerar o tempo
+      não aumenta a quantidade de passos por quadro.
+    - `passos_max`: limite de passos de recuperação por quadro. Se o quadro
+      demorar mais que isso, o atraso é descartado (evita a "espiral da morte").
+    """
+    def __init__(self, passo=PASSO_SIMULACAO, velocidade=VELOCIDADE_SIMULACAO,
+                 passos_max=PASSOS_MAX_POR_QUADRO, warp_max=WARP_MAX):
+        self.passo = float(passo)
+        self.velocidade = float(velocidade)
+        self.passos_max = max(1, int(passos_max))
+        self.warp_max = float(warp_max)
+        self.warp = 1.0
+
+        # Tempo simulado no passo anterior e no atual (a renderização fica entre os dois)
+        self.tempo_anterior = 0.0
+        self.tempo_atual = 0.0
+        self._acumulador = 0.0
+
+        # Estatísticas: passos do último quadro e tempo real descartado no total
+        self.passos_quadro = 0
+        self.descartado = 0.0
+
+    @property
+    def alfa(self):
+        """Fração (0..1) do próximo passo já decorrida, usada na interpolação."""
+        return self._acumulador / self.passo
+
+    @property
+    def tempo(self):
+        """Tempo simulado interpolado para a renderização."""
+        return self.tempo_anterior + (self.tempo_atual - self.tempo_anterior) * self.alfa
+
+    def definir_warp(self, warp):
+        """Ajusta o multiplicador do tempo, limitado a [1, warp_max]."""
+        self.warp = min(max(float(warp), 1.0), self.warp_max)
+
+    def definir_tempo(self, tempo):
+        """Salta para um instante (sem interpolar a partir do anterior)."""
+        self.tempo_anterior = self.tempo_atual = float(tempo)
+        self._acumulador = 0.0
+
+    def avancar(self, dt, fator=1.0, passo_simulacao=None):
+        """
+        Consome `dt` segundos reais em passos fixos. `fator` multiplica o warp
+        só neste quadro (ex.: turbo). `passo_simulacao(t0, dt_sim)`, se dado, é
+        chamado uma vez por passo. Retorna quantos passos foram executados.
+        """
+        self._acumulador += max(float(dt), 0.0)
+
+        limite = self.passos_max * self.passo
+        if self._acumulador > limite:
+            # Quadro lento demais: simula só o que cabe e descarta o resto
+            self.descartado += self._acumulador - limite
+            self._acumulador = limite
+
+        dt_sim = self.passo * self.velocidade * min(self.warp * fator, self.warp_max)
+        passos = 0
+        while self._acumulador >= self.passo:
+            self.tempo_anterior = self.tempo_atual
+            if passo_simulacao is not None:
+                passo_simulacao(self.tempo_atual, dt_sim)
+            self.tempo_atual += dt_sim
+            self._acumulador -= self.passo
+            passos += 1
+
+        self.passos_quadro = passos
+        return passos
@@ -0,0 +1,210 @@
+# src/app/resolucao.py
+# Resolução dinâmica: a cena 3D é desenhada em um FBO com uma fração do
+# tamanho da janela e ampliada para a tela (glBlitFramebuffer, filtro linear).
+# A fração (escala) é ajustada por um controlador que compara o tempo de GPU
+# dos quadros recentes com o orçamento de 1/FPS; a interface (ajuda, HUD) é
+# desenhada depois, direto na janela, em resolução nativa.
+#
+# O custo de preenchimento cai com o número de pixels (escala²), então a
+# escala nova é estimada pela raiz da razão orçamento / tempo medido.
+
+import math
+
+from OpenGL.GL import *
+
+from src.config import FPS, ESCALA_MIN, ESCALA_MAX
+from src.app.offscreen import AlvoOffscreen
+
+# Fração do orçamento do quadro que a cena pode usar (o resto fica para a interface e o flip)
+FRACAO_ORCAMENTO = 0.8
+
+# Só aumenta a escala se o tempo previsto com a escala maior ficar abaixo desta fração do orçamento
+FOLGA_AUMENTO = 0.85
+
+# Granularidade da escala
+PASSO_ESCALA = 0.05
+
+# Peso de cada quadro novo na média móvel exponencial dos tempos
+SUAVIZACAO = 0.1
+
+# Quadros sem novos ajustes após uma mudança (a média precisa refletir a escala nova)
+QUADROS_ESPERA = 20
+
+# Consultas de tempo em voo (o resultado de um quadro é lido alguns quadros depois)
+CONSULTAS = 4
+
+class ControladorEscala:
+    """
+    Decide a escala de resolução a partir dos tempos de quadro.
+
+    `registrar(ms)` recebe o custo do último quadro (em ms), atualiza a média
+    móvel e devolve a escala a usar no próximo. Reduz assim que a média passa
+    do orçamento e só aumenta quando a previsão para a escala maior ainda
+    deixa folga, o que evita oscilar entre dois valores.
+    """
+    def __init__(self, orcamento_ms=1000.0 / FPS * FRACAO_ORCAMENTO,
+                 minima=ESCALA_MIN, maxima=ESCALA_MAX, passo=PASSO_ESCALA):
+        self.orcamento_ms = orcamento_ms
+        self.minima = minima
+        self.maxima = maxima
+        self.passo = passo
+        self.escala = maxima
+        self.media_ms = None
+        self._espera = 0
+
+    def _quantizar(self, escala):
+        """Arredonda para baixo no múltiplo de `passo` e limita ao intervalo."""
+        escala = math.floor(escala / self.passo + 1e-6) * self.passo
+        return min(max(escala, self.minima), self.maxima)
+
+    def registrar(self, ms):
+        if self.media_ms is None:
+            self.media_ms = ms
+        else:
+            self.media_ms += (ms - self.media_ms) * SUAVIZACAO
+
+        if self._espera > 0:
+            self._espera -= 1
+            return self.escala
+
+        atual = self.escala
+        if self.media_ms > self.orcamento_ms:
+            # Pixels ∝ escala²: escala que caberia no orçamento (pelo menos um passo abaixo)
+            nova = self._quantizar(min(atual * math.sqrt(self.orcamento_ms / self.media_ms),
+                                       atual - self.passo))
+        else:
+            nova = self._quantizar(atual + self.passo + 1e-6)
+            if self.media_ms * (nova / atual) ** 2 > self.orcamento_ms * FOLGA_AUMENTO:
+                nova = atual
+
+        if nova != atual:
+            # Estimativa da média na escala nova, até as medições chegarem
+            self.media_ms *= (nova / atual) ** 2
+            self.escala = nova
+            self._espera = QUADROS_ESPERA
+        return self.escala
+
+def _criar_consultas_tempo():
+    """
+    Cria as CONSULTAS de GL_TIME_ELAPSED (OpenGL 3.3 ou ARB/EXT_timer_query) ou,
+    sem suporte, devolve uma lista vazia. Uma consulta de teste confirma o
+    suporte: há drivers que anunciam a extensão e falham no uso.
+    """
+    try:
+        versao = tuple(int(v) for v in glGetString(GL_VERSION).decode().split()[0].split('.')[:2])
+        extensoes = set((glGetString(GL_EXTENSIONS) or b'').decode().split())
+    except Exception:
+        glGetError()   # descarta o erro pendente
+        return []
+    if versao < (3, 3) and not extensoes & {'GL_ARB_timer_query', 'GL_EXT_timer_query'}:
+        return []
+    consultas = []
+    try:
+        consultas = list(glGenQueries(CONSULTAS))
+        glBeginQuery(GL_TIME_ELAPSED, consultas[0])
+        glEndQuery(GL_TIME_ELAPSED)
+        glGetQueryObjectuiv(consultas[0], GL_QUERY_RESULT)
+        if glGetError() == GL_NO_ERROR:
+            return consultas
+    except Exception:
+        glGetError()   # descarta o erro pendente
+    if consultas:
+        glDeleteQueries(len(consultas), consultas)
+    return []
+
+class ResolucaoDinamica:
+    """
+    Uso por quadro (com a câmera já aplicada para o tamanho da janela):
+        resolucao.iniciar(w, h)      # desenho vai para o FBO, viewport reduzido
+        planetario.renderizar()
+        resolucao.finalizar(w, h)    # amplia para a janela e restaura o viewport
+        ... interface em resolução nativa ...
+        resolucao.concluir_quadro(ms)
+
+    O FBO tem o tamanho da janela e a escala só muda o viewport usado dentro
+    dele, então mudar a escala não realoca nada (só redimensionar a janela).
+    Na escala máxima (1.0) o FBO é dispensado e a cena vai direto para a janela.
+
+    O custo da cena é medido com consultas GL_TIME_ELAPSED, lidas alguns
+    quadros depois (sem bloquear a CPU). Sem suporte a elas (verificado uma vez,
+    na criação), usa o tempo de quadro passado em `concluir_quadro`, que não
+    deve incluir o flip (com vsync ele espera pelo retraço, não pelo trabalho).
+    """
+    def __init__(self, controlador=None):
+        self.controlador = controlador or ControladorEscala()
+        self.alvo = None
+        # Tamanho (largura, altura) da cena no último quadro
+        self.tamanho = (0, 0)
+        self._ativo = False
+
+        self._consultas = _criar_consultas_tempo()
+        self._pendentes = []
+        self._livres = list(self._consultas)
+        self._medindo = None
+
+    @property
+    def escala(self):
+        return self.controlador.escala
+
+    def iniciar(self, largura, altura):
+        """Direciona a cena para o FBO na escala atual."""
+        escala = self.controlador.escala
+        self._ativo = escala < 1.0
+        if self._ativo:
+            if self.alvo is None or (self.alvo.largura, self.alvo.altura) != (largura, altura):
+                if self.alvo is not None:
+                    self.alvo.liberar()
+                self.alvo = AlvoOffscreen(largura, altura)
+            self.tamanho = (max(int(largura * escala), 1), max(int(altura * escala), 1))
+            self.alvo.ativar()
+            # A câmera guarda o viewport da janela; `finalizar` o restaura
+            glViewport(0, 0, *self.tamanho)
+        else:
+            self.tamanho = (largura, altura)
+
+        if self._livres:
+            self._medindo = self._livres.pop()
+            glBeginQuery(GL_TIME_ELAPSED, self._medindo)
+
+    def finalizar(self, largura, altura, destino=0):
+        """Amplia a cena para o framebuffer `destino` (0 = janela) e restaura o viewport."""
+        if self._medindo is not None:
+            glEndQuery(GL_TIME_ELAPSED)
+            self._pendentes.append(self._medindo)
+            self._medindo = None
+
+        if self._ativo:
+            glBindFramebuffer(GL_READ_FRAMEBUFFER, self.alvo.fbo)
+            glBindFramebuffer(GL_DRAW_FRAMEBUFFER, destino)
+            glBlitFramebuffer(0, 0, self.tamanho[0], self.tamanho[1], 0, 0, largura, altura,
+                              GL_COLOR_BUFFER_BIT, GL_LINEAR)
+            glBindFramebuffer(GL_FRAMEBUFFER, destino)
+            glViewport(0, 0, largura, altura)
+
+    def _coletar(self):
+        """Tempos (ms) das consultas já respondidas pela GPU, na ordem em que foram feitas."""
+        tempos = []
+        while self._pendentes:
+            consulta = self._pendentes[0]
+            if not glGetQueryObjectiv(consulta, GL_QUERY_RESULT_AVAILABLE):
+                break
+            # (o resultado em 64 bits não é convertido pelo PyOpenGL; 32 bits de ns bastam)
+            tempos.append(glGetQueryObjectuiv(consulta, GL_QUERY_RESULT) / 1e6)
+            self._livres.append(self._pendentes.pop(0))
+        return tempos
+
+    def concluir_quadro(self, ms_quadro):
+        """Alimenta o controlador com o custo do quadro (tempo de GPU, se disponível)."""
+        if not self._consultas:
+            self.controlador.registrar(ms_quadro)
+            return
+        for gpu_ms in self._coletar():
+            self.controlador.registrar(gpu_ms)
+
+    def liberar(self):
+        if self.alvo is not None:
+            self.alvo.liberar()
+            self.alvo = None
+        if self._consultas:
+            glDeleteQueries(len(self._consultas), self._consultas)
+            self._consultas = []
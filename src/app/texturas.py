@@ -0,0 +1,199 @@
+# src/app/texturas.py
+# Carregamento assíncrono de texturas.
+# As imagens são decodificadas em um pool de threads; a thread do OpenGL
+# mostra texturas provisórias na hora e envia a resolução completa aos poucos,
+# respeitando um orçamento de tempo por quadro.
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+from src.formas.estado_gl import estado_gl
+
+# Threads de decodificação
+TRABALHADORES = 4
+
+# Tempo máximo (ms) gasto por quadro enviando texturas para a GPU
+ORCAMENTO_MS = 4.0
+
+# Maior dimensão (px) da miniatura enviada assim que a imagem é decodificada
+TAMANHO_MINIATURA = 64
+
+# Linhas enviadas por fatia de glTexSubImage2D (ajustado pelo tempo medido)
+LINHAS_INICIAIS = 64
+
+# Cor usada enquanto a imagem não chega (ou se o arquivo não existir)
+COR_PROVISORIA = (128, 128, 128)
+
+def _decodificar(caminho):
+    """
+    Executado nas threads do pool: lê a imagem e devolve (largura, altura,
+    pixels RGB, miniatura). Não toca no OpenGL.
+    """
+    imagem = pygame.image.load(caminho)
+
+    # Converte para RGB 24 bits. Substitui o `convert()` (que exige a thread/janela
+    # principal) e evita cores corrompidas em imagens indexadas ou com alpha.
+    rgb = pygame.Surface(imagem.get_size(), 0, 24)
+    rgb.blit(imagem, (0, 0))
+    largura, altura = rgb.get_size()
+
+    escala = TAMANHO_MINIATURA / max(largura, altura)
+    tamanho_mini = (max(1, int(largura * escala)), max(1, int(altura * escala)))
+    mini = pygame.transform.smoothscale(rgb, tamanho_mini)
+
+    # '1' inverte verticalmente (padrão OpenGL onde Y cresce pra cima)
+    pixels = np.frombuffer(pygame.image.tostring(rgb, "RGB", 1), dtype=np.uint8)
+    miniatura = (tamanho_mini, pygame.image.tostring(mini, "RGB", 1))
+    return largura, altura, pixels, miniatura
+
+def _criar_textura(largura, altura, dados):
+    """Cria uma textura RGB com os parâmetros usados pelo Planetário."""
+    tex_id = glGenTextures(1)
+    estado_gl.vincular_textura(tex_id)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+    glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+    # Corrige alinhamento de bytes para larguras não múltiplas de 4
+    glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+    glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, largura, altura, 0, GL_RGB, GL_UNSIGNED_BYTE, dados)
+    return tex_id
+
+class CarregadorTexturas:
+    """
+    Mantém o dicionário `ids` (chave -> ID de textura OpenGL) sempre válido:
+      1. Na criação, toda chave aponta para uma textura provisória 1x1.
+      2. Quando a imagem termina de decodificar, uma miniatura é enviada.
+      3. A resolução completa é enviada em fatias dentro do orçamento por quadro
+         e só então substitui a miniatura.
+    Arquivos ausentes ou inválidos mantêm a textura provisória.
+    """
+    def __init__(self, pasta, arquivos, trabalhadores=TRABALHADORES, orcamento_ms=ORCAMENTO_MS,
+                 cores_provisorias=None):
+        self.orcamento_ms = orcamento_ms
+        self.falhas = []
+
+        # Texturas provisórias (uma por cor) criadas imediatamente
+        self._provisorias = {}
+        cores_provisorias = cores_provisorias or {}
+        self.ids = {}
+        for chave in arquivos:
+            self.ids[chave] = self._provisoria(cores_provisorias.get(chave, COR_PROVISORIA))
+
+        # Decodificação em segundo plano
+        self._pool = ThreadPoolExecutor(max_workers=trabalhadores, thread_name_prefix="texturas")
+        self._pendentes = {
+            chave: self._pool.submit(_decodificar, os.path.join(pasta, nome))
+            for chave, nome in arquivos.items()
+        }
+        self._nomes = dict(arquivos)
+
+        # Envios em andamento: [chave, tex_id, largura, altura, pixels, próxima linha]
+        self._envios = deque()
+        self._linhas_por_fatia = LINHAS_INICIAIS
+
+    @property
+    def concluido(self):
+        """True quando todas as texturas foram decodificadas e enviadas."""
+        return not self._pendentes and not self._envios
+
+    def _provisoria(self, cor):
+        if cor not in self._provisorias:
+            self._provisorias[cor] = _criar_textura(1, 1, bytes(cor))
+        return self._provisorias[cor]
+
+    def processar(self, orcamento_ms=None):
+        """
+        Chamado uma vez por quadro na thread do OpenGL.
+        Retorna True se alguma textura visível mudou neste quadro.
+        """
+        if self.concluido:
+            return False
+
+        orcamento = (self.orcamento_ms if orcamento_ms is None else orcamento_ms) / 1000.0
+        inicio = time.perf_counter()
+        mudou = self._coletar_decodificadas(inicio, orcamento)
+
+        # Envia fatias de linhas enquanto houver tempo (ao menos uma por quadro)
+        while self._envios:
+            envio = self._envios[0]
+            chave, tex_id, largura, altura, pixels, linha = envio
+            linhas = min(self._linhas_por_fatia, altura - linha)
+
+            t0 = time.perf_counter()
+            estado_gl.vincular_textura(tex_id)
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            glTexSubImage2D(GL_TEXTURE_2D, 0, 0, linha, largura, linhas, GL_RGB, GL_UNSIGNED_BYTE,
+                            pixels[linha * largura * 3:(linha + linhas) * largura * 3])
+            self._ajustar_fatia(linhas, time.perf_counter() - t0, orcamento)
+
+            envio[5] = linha + linhas
+            if envio[5] >= altura:
+                # Completa: troca a miniatura pela textura final
+                self._envios.popleft()
+                self._trocar(chave, tex_id)
+                mudou = True
+
+            if time.perf_counter() - inicio >= orcamento:
+                break
+
+        return mudou
+
+    def concluir(self):
+        """Bloqueia até todas as texturas estarem prontas (sem orçamento por quadro)."""
+        for futuro in list(self._pendentes.values()):
+            futuro.exception()   # apenas espera
+        while not self.concluido:
+            self.processar(orcamento_ms=float("inf"))
+
+    def encerrar(self):
+        """Cancela decodificações que ainda não começaram."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _coletar_decodificadas(self, inicio, orcamento):
+        """Miniaturas das imagens recém-decodificadas e início do envio completo."""
+        mudou = False
+        for chave, futuro in list(self._pendentes.items()):
+            if time.perf_counter() - inicio >= orcamento:
+                break   # o restante fica para o próximo quadro
+            if not futuro.done():
+                continue
+            del self._pendentes[chave]
+
+            try:
+                largura, altura, pixels, ((mini_l, mini_a), mini) = futuro.result()
+            except Exception as e:
+                # Arquivo ausente/corrompido: fica com a textura provisória
+                print(f"Erro ao carregar textura {self._nomes[chave]}: {e}")
+                self.falhas.append(chave)
+                continue
+
+            self._trocar(chave, _criar_textura(mini_l, mini_a, mini))
+            mudou = True
+
+            # Reserva a textura final (sem dados); as linhas chegam em fatias
+            tex_id = _criar_textura(largura, altura, None)
+            self._envios.append([chave, tex_id, largura, altura, pixels, 0])
+        return mudou
+
+    def _trocar(self, chave, tex_id):
+        """Aponta a chave para a nova textura e apaga a anterior (se não for provisória)."""
+        antiga = self.ids.get(chave)
+        self.ids[chave] = tex_id
+        if antiga and antiga not in self._provisorias.values():
+            glDeleteTextures([antiga])
+            estado_gl.textura_apagada(antiga)
+
+    def _ajustar_fatia(self, linhas, segundos, orcamento):
+        """Ajusta quantas linhas cabem em ~1/4 do orçamento, pela velocidade medida."""
+        if segundos <= 0.0 or orcamento == float("inf"):
+            return
+        por_linha = segundos / linhas
+        alvo = int((orcamento * 0.25) / por_linha)
+        self._linhas_por_fatia = max(8, min(alvo, 4096))
@@ -12,3 +12,69 @@ FPS = 60
 
 # Título da janela
 TITULO_JANELA = "Sistema Solar - Gilberto"
+
+# Quantidade de partículas do Cinturão de Asteroides (0 desativa)
+ASTEROIDES_CINTURAO = 50_000
+
+# Passo fixo da simulação (segundos de tempo real por passo)
+PASSO_SIMULACAO = 1.0 / 60.0
+
+# Máximo de passos de recuperação por quadro (o atraso além disso é descartado)
+PASSOS_MAX_POR_QUADRO = 5
+
+# Unidades de tempo simulado por segundo real em 1x (a Terra completa a órbita em 360)
+VELOCIDADE_SIMULACAO = 30.0
+
+# Aceleração máxima do tempo (time warp)
+WARP_MAX = 1_000_000
+
+# Modo ocioso: sem mudanças visíveis (pausa, tela de ajuda), o loop dorme esperando eventos
+# em vez de redesenhar a cena a cada quadro
+MODO_OCIOSO = True
+
+# Espera máxima (ms) por um evento no modo ocioso
+ESPERA_OCIOSO_MS = 500
+
+# Quadros guardados pelo perfilador de desempenho (buffer circular)
+QUADROS_PERFIL = 3600
+
+# Quadros usados nas médias/percentis do painel de desempenho (HUD)
+JANELA_HUD = 120
+
+# CSV com o tempo de cada fase por quadro, gravado ao sair (se o perfilador foi usado)
+ARQUIVO_PERFIL = "perfil_quadros.csv"
+
+# Resolução dinâmica: a cena 3D é desenhada com uma fração do tamanho da janela,
+# ajustada para caber no orçamento de 1/FPS (a interface continua em resolução nativa)
+ESCALA_DINAMICA = True
+
+# Limites da escala de resolução da cena
+ESCALA_MIN = 0.5
+ESCALA_MAX = 1.0
+
+# Rastros dos corpos (tecla R): amostras guardadas por corpo (buffer circular) e quantos
+# segundos reais de movimento elas cobrem (o intervalo simulado entre amostras segue o warp)
+AMOSTRAS_RASTRO = 256
+DURACAO_RASTRO = 8.0
+
+# Tabela de efemérides (posições reais dos corpos por data), lida sob demanda via memmap
+ARQUIVO_EFEMERIDES = "src/assets/efemerides.bin"
+
+# Física de N corpos (tecla G): passo fixo do integrador (dias simulados) e máximo de passos
+# por quadro (acima disso o tempo simulado espera pela física)
+PASSO_FISICA_DIAS = 0.1
+PASSOS_FISICA_MAX = 20
+
+# Partículas do cinturão integradas como partículas de teste no modo de física (0 desativa)
+PARTICULAS_FISICA = 10_000
+
+# Fontes de gravidade (corpos com massa) acima das quais a soma direta dá lugar à octree de Barnes-Hut
+LIMITE_BARNES_HUT = 8192
+
+# Roda a lógica da simulação (relógio, efemérides, física, cinturão) em um processo separado,
+# que publica o estado em memória compartilhada; a janela só desenha (main.py --processo)
+SIMULACAO_EM_PROCESSO = False
+
+# Captura de quadros (main.py --saida): buffers de quadro esperando codificação. Com todos em uso,
+# a janela descarta o quadro (e conta) em vez de esperar; o modo headless espera e não perde nenhum
+FILA_CAPTURA = 8
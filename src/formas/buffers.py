@@ -0,0 +1,96 @@
+# src/formas/buffers.py
+# Vertex Buffer Objects (VBO) para dados que mudam a cada quadro.
+
+import ctypes
+
+import numpy as np
+from OpenGL.GL import *
+
+from src.formas.estatisticas import estatisticas
+
+class BufferStreaming:
+    """
+    Anel de VBOs para enviar vértices novos à GPU todo quadro sem travar o pipeline.
+
+    A cada `enviar` o próximo buffer do anel é usado e "órfão" (glBufferData com
+    None), de modo que o driver entrega memória nova em vez de esperar a GPU
+    terminar de ler o conteúdo do quadro anterior.
+    """
+    def __init__(self, quantidade_buffers=3, uso=GL_STREAM_DRAW):
+        self.uso = uso
+        self._ids = [int(b) for b in np.atleast_1d(glGenBuffers(quantidade_buffers))]
+        self._atual = 0
+        self._bytes = [0] * len(self._ids)
+
+        # Quantidade de vértices e componentes do último envio
+        self.vertices = 0
+        self.componentes = 0
+
+        # Estatística: bytes enviados no último `enviar`
+        self.bytes_enviados = 0
+
+    def enviar(self, dados):
+        """Envia um array (N, C) float32 para o próximo buffer do anel."""
+        dados = np.ascontiguousarray(dados, dtype=np.float32)
+        self._atual = (self._atual + 1) % len(self._ids)
+        buffer_id = self._ids[self._atual]
+
+        glBindBuffer(GL_ARRAY_BUFFER, buffer_id)
+        # Orphaning: descarta o armazenamento anterior antes de escrever
+        glBufferData(GL_ARRAY_BUFFER, dados.nbytes, None, self.uso)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, dados.nbytes, dados)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        self._bytes[self._atual] = dados.nbytes
+        self.vertices = dados.shape[0] if dados.ndim > 1 else 0
+        self.componentes = dados.shape[1] if dados.ndim > 1 else 0
+        self.bytes_enviados = dados.nbytes
+
+    def desenhar(self, modo, inicio=0, quantidade=None):
+        """Desenha os vértices do último envio com glDrawArrays (posição apenas)."""
+        if self.vertices == 0:
+            return
+        if quantidade is None:
+            quantidade = self.vertices - inicio
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._ids[self._atual])
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glVertexPointer(self.componentes, GL_FLOAT, 0, None)
+        glDrawArrays(modo, inicio, quantidade)
+        estatisticas.desenho(quantidade)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def desenhar_multiplos(self, modo, inicios, quantidades, cores=False):
+        """
+        Desenha vários trechos do último envio em uma só chamada (glMultiDrawArrays).
+        Útil para muitas linhas independentes (ex.: órbitas) no mesmo buffer.
+        Com `cores`, cada vértice é (x, y, z, r, g, b, a) intercalado e a cor vem
+        do buffer (GL_COLOR_ARRAY); a cor corrente fica indefinida depois.
+        """
+        if self.vertices == 0 or len(inicios) == 0:
+            return
+
+        glBindBuffer(GL_ARRAY_BUFFER, self._ids[self._atual])
+        glEnableClientState(GL_VERTEX_ARRAY)
+        if cores:
+            passo = self.componentes * 4
+            glVertexPointer(3, GL_FLOAT, passo, None)
+            glEnableClientState(GL_COLOR_ARRAY)
+            glColorPointer(4, GL_FLOAT, passo, ctypes.c_void_p(12))
+        else:
+            glVertexPointer(self.componentes, GL_FLOAT, 0, None)
+        glMultiDrawArrays(modo, np.asarray(inicios, dtype=np.int32),
+                          np.asarray(quantidades, dtype=np.int32), len(inicios))
+        estatisticas.desenho(int(np.sum(quantidades)))
+        if cores:
+            glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def liberar(self):
+        """Apaga os VBOs da GPU."""
+        if self._ids:
+            glDeleteBuffers(len(self._ids), self._ids)
+            self._ids = []
+            self.vertices = 0
@@ -0,0 +1,217 @@
+# src/formas/estado_gl.py
+# Cópia (shadow) do estado do OpenGL mantida na CPU.
+# Todo código de desenho liga/desliga capacidades, vincula texturas e envia
+# materiais/luzes por aqui: chamadas que não mudariam nada são puladas e o
+# driver nunca é consultado (sem glIsEnabled/glGet).
+
+from OpenGL.GL import *
+
+from src.formas.estatisticas import estatisticas
+
+# Capacidades que nascem ligadas em um contexto novo (as demais nascem desligadas)
+_HABILITADAS_POR_PADRAO = {GL_DITHER, GL_MULTISAMPLE}
+
+def _padroes():
+    """Valores iniciais do OpenGL para os estados guardados em `definir` (chave -> (função, args))."""
+    return {
+        ('textura', GL_TEXTURE_2D): (glBindTexture, (GL_TEXTURE_2D, 0)),
+        'funcao_blend': (glBlendFunc, (GL_ONE, GL_ZERO)),
+        'mascara_profundidade': (glDepthMask, (GL_TRUE,)),
+        'largura_linha': (glLineWidth, (1.0,)),
+        'tamanho_ponto': (glPointSize, (1.0,)),
+        'modo_textura': (glTexEnvi, (GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)),
+        'coord_ponto': (glTexEnvi, (GL_POINT_SPRITE, GL_COORD_REPLACE, GL_FALSE)),
+        'cor': (glColor4f, (1.0, 1.0, 1.0, 1.0)),
+    }
+
+# Chaves com valor inicial em `_padroes`
+_CHAVES_PADRAO = frozenset(_padroes())
+
+# Valores iniciais de glMaterialfv (por face) e glLightfv (GL_LIGHT0 difere das demais
+# em GL_DIFFUSE/GL_SPECULAR); parâmetros fora destas tabelas não têm padrão conhecido
+_MATERIAL_PADRAO = {
+    GL_AMBIENT: (0.2, 0.2, 0.2, 1.0),
+    GL_DIFFUSE: (0.8, 0.8, 0.8, 1.0),
+    GL_SPECULAR: (0.0, 0.0, 0.0, 1.0),
+    GL_EMISSION: (0.0, 0.0, 0.0, 1.0),
+    GL_SHININESS: (0.0,),
+}
+_LUZ_PADRAO = {
+    GL_AMBIENT: (0.0, 0.0, 0.0, 1.0),
+    GL_DIFFUSE: (0.0, 0.0, 0.0, 1.0),
+    GL_SPECULAR: (0.0, 0.0, 0.0, 1.0),
+}
+_LUZ0_PADRAO = {**_LUZ_PADRAO, GL_DIFFUSE: (1.0, 1.0, 1.0, 1.0), GL_SPECULAR: (1.0, 1.0, 1.0, 1.0)}
+
+def _padrao_fora_da_tabela(chave):
+    """(função, args) do valor inicial de um material/luz, ou None se não for conhecido."""
+    if isinstance(chave, tuple) and chave[0] == 'material':
+        _, face, parametro = chave
+        valores = _MATERIAL_PADRAO.get(parametro)
+        return None if valores is None else (glMaterialfv, (face, parametro, valores))
+    if isinstance(chave, tuple) and chave[0] == 'luz':
+        _, luz, parametro = chave
+        valores = (_LUZ0_PADRAO if luz == GL_LIGHT0 else _LUZ_PADRAO).get(parametro)
+        return None if valores is None else (glLightfv, (luz, parametro, valores))
+    return None
+
+class EstadoGL:
+    """
+    Espelho do estado do OpenGL.
+
+    - `habilitar`/`desabilitar`: glEnable/glDisable só quando o valor muda.
+    - `vincular_textura`, `funcao_blend`, `mascara_profundidade`, `material`,
+      `luz`...: a chamada só é feita se os argumentos diferem dos últimos enviados.
+    - `empilhar`/`desempilhar`: substituem glPushAttrib/glPopAttrib; ao
+      desempilhar, só o que mudou dentro do escopo é restaurado (inclusive o
+      que foi definido pela primeira vez nele).
+
+    Supõe que o contexto começou nos valores padrão e que ninguém altera esses
+    estados por fora. Quem cria um contexto novo chama `reiniciar()`
+    (`Jogo` e `criar_contexto`); redimensionar a janela e trocar de FBO não
+    mexem nos estados espelhados.
+    """
+    def __init__(self):
+        self.reiniciar()
+
+    def reiniciar(self):
+        """Volta ao estado de um contexto recém-criado."""
+        self._habilitadas = {}
+        self._valores = _padroes()
+        self._pilha = []
+
+    # ---------------- capacidades ----------------
+
+    def habilitar(self, capacidade, ligado=True):
+        if self.habilitada(capacidade) == ligado:
+            estatisticas.estados_evitados += 1
+            return
+        if ligado:
+            glEnable(capacidade)
+        else:
+            glDisable(capacidade)
+        self._habilitadas[capacidade] = ligado
+
+    def desabilitar(self, capacidade):
+        self.habilitar(capacidade, False)
+
+    def habilitada(self, capacidade):
+        """Valor conhecido de uma capacidade (sem consultar o driver)."""
+        atual = self._habilitadas.get(capacidade)
+        return capacidade in _HABILITADAS_POR_PADRAO if atual is None else atual
+
+    # ---------------- valores ----------------
+
+    def definir(self, chave, funcao, *args):
+        """Chama `funcao(*args)` só se `chave` ainda não estiver com esses argumentos."""
+        atual = self._valores.get(chave)
+        if atual is not None and atual[1] == args:
+            estatisticas.estados_evitados += 1
+            return False
+        funcao(*args)
+        self._valores[chave] = (funcao, args)
+        return True
+
+    def vincular_textura(self, textura_id, alvo=GL_TEXTURE_2D):
+        if self.definir(('textura', alvo), glBindTexture, alvo, int(textura_id or 0)):
+            estatisticas.binds_textura += 1
+
+    def textura_apagada(self, textura_id, alvo=GL_TEXTURE_2D):
+        """
+        Avisa que uma textura foi apagada (glDeleteTextures desvincula a textura
+        atual, que passa a ser a 0).
+        """
+        atual = self._valores.get(('textura', alvo))
+        if atual is not None and atual[1][1] == textura_id:
+            self._valores[('textura', alvo)] = (glBindTexture, (alvo, 0))
+
+    def funcao_blend(self, origem, destino):
+        self.definir('funcao_blend', glBlendFunc, origem, destino)
+
+    def mascara_profundidade(self, escrever):
+        self.definir('mascara_profundidade', glDepthMask, GL_TRUE if escrever else GL_FALSE)
+
+    def largura_linha(self, largura):
+        self.definir('largura_linha', glLineWidth, float(largura))
+
+    def tamanho_ponto(self, tamanho):
+        self.definir('tamanho_ponto', glPointSize, float(tamanho))
+
+    def modo_textura(self, modo):
+        self.definir('modo_textura', glTexEnvi, GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, modo)
+
+    def coord_ponto(self, substituir):
+        """Coordenadas de textura geradas nos point sprites (GL_COORD_REPLACE)."""
+        self.definir('coord_ponto', glTexEnvi, GL_POINT_SPRITE, GL_COORD_REPLACE,
+                     GL_TRUE if substituir else GL_FALSE)
+
+    def cor(self, r, g, b, a=1.0):
+        """Cor corrente (glColor4f)."""
+        self.definir('cor', glColor4f, float(r), float(g), float(b), float(a))
+
+    def cor_indefinida(self):
+        """
+        Após desenhar com GL_COLOR_ARRAY a cor corrente fica indefinida:
+        o próximo `cor()` sempre vai ao driver.
+        """
+        self._valores.pop('cor', None)
+
+    def material(self, face, parametro, valores):
+        self.definir(('material', face, parametro), glMaterialfv, face, parametro, tuple(valores))
+
+    def luz(self, luz, parametro, valores):
+        """
+        Parâmetro de luz. GL_POSITION/GL_SPOT_DIRECTION não passam por aqui:
+        são transformados pela ModelView do momento e precisam ser reenviados.
+        """
+        self.definir(('luz', luz, parametro), glLightfv, luz, parametro, tuple(valores))
+
+    # ---------------- pilha ----------------
+
+    def empilhar(self):
+        """Guarda o estado atual (equivalente a glPushAttrib dos estados espelhados)."""
+        self._pilha.append((dict(self._habilitadas), dict(self._valores)))
+
+    def desempilhar(self):
+        """
+        Restaura o estado de `empilhar`, emitindo só as chamadas necessárias.
+        A comparação é feita aqui (e não por `habilitar`/`definir`): as chaves
+        que não mudaram no escopo não contam como chamadas evitadas.
+        """
+        habilitadas, valores = self._pilha.pop()
+
+        for capacidade, atual in list(self._habilitadas.items()):
+            ligado = habilitadas.get(capacidade)
+            if ligado is None:
+                ligado = capacidade in _HABILITADAS_POR_PADRAO
+            if atual != ligado:
+                if ligado:
+                    glEnable(capacidade)
+                else:
+                    glDisable(capacidade)
+                self._habilitadas[capacidade] = ligado
+
+        for chave, (funcao, args) in valores.items():
+            atual = self._valores.get(chave)
+            if atual is None or atual[1] != args:
+                funcao(*args)
+                self._valores[chave] = (funcao, args)
+                if funcao is glBindTexture:
+                    estatisticas.binds_textura += 1
+
+        # Chaves definidas pela primeira vez dentro do escopo: antes dele estavam no valor
+        # inicial do contexto (materiais e luzes), que é restaurado; as que estavam
+        # indefinidas (`cor_indefinida`) ou sem padrão conhecido saem do espelho, e o
+        # próximo `definir` vai ao driver
+        for chave in [chave for chave in self._valores if chave not in valores]:
+            padrao = None if chave in _CHAVES_PADRAO else _padrao_fora_da_tabela(chave)
+            if padrao is None:
+                del self._valores[chave]
+                continue
+            funcao, args = padrao
+            if self._valores[chave][1] != args:
+                funcao(*args)
+            self._valores[chave] = padrao
+
+# Instância compartilhada (o projeto usa um único contexto OpenGL)
+estado_gl = EstadoGL()
@@ -0,0 +1,28 @@
+# src/formas/estatisticas.py
+# Contadores de trabalho enviado ao OpenGL em cada quadro.
+# São apenas somas de inteiros nos pontos de desenho: custo desprezível,
+# por isso ficam sempre ligados (o perfilador decide se guarda ou não).
+
+class EstatisticasQuadro:
+    """Chamadas de desenho, vértices, triângulos, binds de textura e mudanças de estado evitadas do quadro atual."""
+    __slots__ = ('chamadas_desenho', 'vertices', 'triangulos', 'binds_textura', 'estados_evitados')
+
+    def __init__(self):
+        self.zerar()
+
+    def zerar(self):
+        """Chamado no início de cada quadro."""
+        self.chamadas_desenho = 0
+        self.vertices = 0
+        self.triangulos = 0
+        self.binds_textura = 0
+        self.estados_evitados = 0
+
+    def desenho(self, vertices, triangulos=0):
+        """Registra uma chamada de desenho (glDrawArrays, glCallList, glBegin/glEnd...)."""
+        self.chamadas_desenho += 1
+        self.vertices += vertices
+        self.triangulos += triangulos
+
+# Instância compartilhada por todo o código de desenho
+estatisticas = EstatisticasQuadro()
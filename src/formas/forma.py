@@ -1,11 +1,15 @@
 from abc import ABC, abstractmethod
-from OpenGL.GL import glColor4f
+
+from src.formas.estado_gl import estado_gl
 
 class Forma2D(ABC):
     """
     Classe Abstrata Base para formas 2D em OpenGL.
     Define a interface padrão que todas as formas devem seguir.
+    Usa __slots__ (sem __dict__ por instância) para milhares de formas custarem pouco.
     """
+    __slots__ = ('x', 'y', 'r', 'g', 'b', 'a')
+
     def __init__(self, coord=(0.0, 0.0), cor=(1.0, 1.0, 1.0, 1.0)):
         # Coordenadas X, Y do centro ou ponto base da forma
         self.x, self.y = coord
@@ -18,7 +22,12 @@ class Forma2D(ABC):
 
     def aplicar_cor(self):
         """Aplica a cor atual ao estado do OpenGL (glColor)."""
-        glColor4f(self.r, self.g, self.b, self.a)
+        estado_gl.cor(self.r, self.g, self.b, self.a)
+
+    @abstractmethod
+    def enfileirar(self, lote):
+        """Método abstrato: acrescenta a forma a um `LoteUI` (desenho em lote)."""
+        raise NotImplementedError
 
     @abstractmethod
     def desenhar(self):
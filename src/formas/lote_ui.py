@@ -0,0 +1,129 @@
+# src/formas/lote_ui.py
+# Desenho em lote da interface 2D (retângulos, bordas e rótulos).
+# Cada forma só acrescenta uma tupla a uma lista; na hora de desenhar, os
+# vértices de todas são montados de uma vez em arrays NumPy e enviados em
+# poucas chamadas (uma para os preenchimentos, uma por espessura de borda e
+# uma por atlas de texto, em cada camada).
+
+import numpy as np
+from OpenGL.GL import *
+
+from src.formas.estatisticas import estatisticas
+from src.formas.estado_gl import estado_gl
+
+class _Camada:
+    """Formas de uma camada do lote, agrupadas por tipo."""
+    def __init__(self):
+        # (x0, y0, x1, y1, r, g, b, a) por forma
+        self.preenchimentos = []
+        # espessura da linha -> lista de (x0, y0, x1, y1, r, g, b, a)
+        self.bordas = {}
+        # (atlas, texto, x, y, cor, escala), na ordem de uso
+        self.textos = []
+
+    def vazia(self):
+        return not self.preenchimentos and not self.bordas and not self.textos
+
+class LoteUI:
+    """
+    Uso por quadro:
+        lote.retangulo(cx, cy, largura, altura, cor)
+        lote.borda(cx, cy, largura, altura, cor, largura_px)
+        lote.texto(atlas, "Rótulo", x, y, cor, escala)
+        lote.camada()       # o que vier depois fica por cima de tudo o que veio antes
+        ...
+        lote.desenhar()     # envia tudo e esvazia o lote
+
+    As coordenadas são as da projeção corrente (ex.: glOrtho -1..1).
+    Ordem de desenho dentro de uma camada: preenchimentos, bordas e, por cima,
+    os textos. Widgets da mesma camada não devem se sobrepor (o texto de um
+    ficaria sob o fundo do outro); widgets sobrepostos vão em camadas
+    diferentes, ao custo de algumas chamadas de desenho a mais por camada.
+    """
+    def __init__(self):
+        self._camadas = [_Camada()]
+
+    def __len__(self):
+        return sum(len(c.preenchimentos) + sum(len(b) for b in c.bordas.values())
+                   for c in self._camadas)
+
+    def camada(self):
+        """Começa uma camada nova, desenhada por cima das anteriores."""
+        if not self._camadas[-1].vazia():
+            self._camadas.append(_Camada())
+
+    def retangulo(self, cx, cy, largura, altura, cor):
+        """Retângulo preenchido centrado em (cx, cy)."""
+        meia_l, meia_a = largura * 0.5, altura * 0.5
+        self._camadas[-1].preenchimentos.append((cx - meia_l, cy - meia_a, cx + meia_l, cy + meia_a) + tuple(cor))
+
+    def borda(self, cx, cy, largura, altura, cor, largura_px=1.0):
+        """Contorno de um retângulo centrado em (cx, cy)."""
+        meia_l, meia_a = largura * 0.5, altura * 0.5
+        bordas = self._camadas[-1].bordas
+        lista = bordas.get(largura_px)
+        if lista is None:
+            lista = bordas[largura_px] = []
+        lista.append((cx - meia_l, cy - meia_a, cx + meia_l, cy + meia_a) + tuple(cor))
+
+    def texto(self, atlas, texto, x, y, cor=(1.0, 1.0, 1.0, 1.0), escala=(1.0, 1.0)):
+        """Texto pelo atlas de glifos (canto inferior esquerdo em (x, y))."""
+        self._camadas[-1].textos.append((atlas, texto, x, y, cor, escala))
+
+    def desenhar(self):
+        """Desenha as camadas em ordem e esvazia o lote."""
+        camadas, self._camadas = self._camadas, [_Camada()]
+        for camada in camadas:
+            if not camada.vazia():
+                self._desenhar_camada(camada)
+
+    def _desenhar_camada(self, camada):
+        if camada.preenchimentos or camada.bordas:
+            estado_gl.empilhar()
+            estado_gl.desabilitar(GL_DEPTH_TEST)
+            estado_gl.desabilitar(GL_LIGHTING)
+            estado_gl.desabilitar(GL_TEXTURE_2D)
+            estado_gl.habilitar(GL_BLEND)
+            estado_gl.funcao_blend(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glEnableClientState(GL_COLOR_ARRAY)
+
+            if camada.preenchimentos:
+                dados = np.array(camada.preenchimentos, dtype=np.float32)
+                # Quads: (x0,y0) (x1,y0) (x1,y1) (x0,y1)
+                self._enviar(GL_QUADS, dados, ((0, 1), (2, 1), (2, 3), (0, 3)))
+
+            for largura_px, lista in camada.bordas.items():
+                dados = np.array(lista, dtype=np.float32)
+                estado_gl.largura_linha(largura_px)
+                # 4 segmentos independentes por retângulo (equivale ao GL_LINE_LOOP)
+                self._enviar(GL_LINES, dados, ((0, 1), (2, 1), (2, 1), (2, 3), (2, 3), (0, 3), (0, 3), (0, 1)))
+
+            glDisableClientState(GL_COLOR_ARRAY)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            estado_gl.cor_indefinida()
+            estado_gl.desempilhar()
+
+        # Uma chamada por atlas usado na camada
+        atlas_usados = []
+        for atlas, texto, x, y, cor, escala in camada.textos:
+            atlas.adicionar(texto, x, y, cor, escala)
+            if atlas not in atlas_usados:
+                atlas_usados.append(atlas)
+        for atlas in atlas_usados:
+            atlas.desenhar()
+
+    @staticmethod
+    def _enviar(modo, dados, cantos):
+        """Expande cada linha (x0, y0, x1, y1, rgba) nos vértices `cantos` e desenha."""
+        n, k = len(dados), len(cantos)
+        posicoes = np.empty((n, k, 2), dtype=np.float32)
+        for i, (cx, cy) in enumerate(cantos):
+            posicoes[:, i, 0] = dados[:, cx]
+            posicoes[:, i, 1] = dados[:, cy]
+        cores = np.repeat(dados[:, 4:8], k, axis=0)
+
+        glVertexPointer(2, GL_FLOAT, 0, posicoes)
+        glColorPointer(4, GL_FLOAT, 0, cores)
+        glDrawArrays(modo, 0, n * k)
+        estatisticas.desenho(n * k, 2 * n if modo == GL_QUADS else 0)
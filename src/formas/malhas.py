@@ -0,0 +1,121 @@
+# src/formas/malhas.py
+# Cache de malhas (esferas e discos) compiladas em Display Lists do OpenGL.
+# Cada tesselação GLU é gerada uma única vez em tamanho unitário e depois
+# "reproduzida" com glCallList + glScalef, sem refazer a geometria na CPU.
+
+from collections import OrderedDict
+from OpenGL.GL import *
+from OpenGL.GLU import *
+
+from src.formas.estatisticas import estatisticas
+
+# Quantidade máxima de malhas mantidas na GPU ao mesmo tempo
+CAPACIDADE_PADRAO = 64
+
+def triangulos_da_chave(chave):
+    """Triângulos de uma malha: cada fatia de cada anel/pilha da GLU é um quad (2 triângulos)."""
+    if chave[0] == 'esfera':
+        return 2 * chave[1] * chave[2]
+    return 2 * chave[2] * chave[3]
+
+def vertices_da_chave(chave):
+    """Vértices enviados: a GLU desenha cada pilha/anel como uma faixa de (slices + 1) * 2 vértices."""
+    if chave[0] == 'esfera':
+        return 2 * (chave[1] + 1) * chave[2]
+    return 2 * (chave[2] + 1) * chave[3]
+
+class CacheMalhas:
+    """
+    Armazena malhas unitárias compiladas em Display Lists.
+
+    A chave identifica completamente a tesselação:
+      ('esfera', slices, stacks, orientacao, texcoords)
+      ('disco', raio_interno_unitario, slices, loops, texcoords)
+
+    O raio final é aplicado por quem desenha (glScalef), por isso esferas de
+    raios diferentes compartilham a mesma lista. O cache é limitado (LRU) e
+    pode ser invalidado explicitamente (ex.: após recriar o contexto OpenGL).
+    """
+    def __init__(self, capacidade=CAPACIDADE_PADRAO):
+        self.capacidade = max(1, int(capacidade))
+        self._listas = OrderedDict()   # chave -> id da display list
+
+        # Estatísticas (úteis para benchmarks)
+        self.construidas = 0
+        self.reutilizadas = 0
+
+    def __len__(self):
+        return len(self._listas)
+
+    def __contains__(self, chave):
+        return chave in self._listas
+
+    def obter(self, chave):
+        """Retorna o ID da display list da chave, construindo-a se necessário."""
+        lista = self._listas.get(chave)
+        if lista is not None:
+            # Marca como usada recentemente (ordem LRU)
+            self._listas.move_to_end(chave)
+            self.reutilizadas += 1
+            return lista
+
+        lista = self._construir(chave)
+        self._listas[chave] = lista
+        self.construidas += 1
+
+        # Respeita o limite: descarta a malha usada há mais tempo
+        while len(self._listas) > self.capacidade:
+            _, antiga = self._listas.popitem(last=False)
+            glDeleteLists(antiga, 1)
+
+        return lista
+
+    def desenhar(self, chave):
+        """Executa a display list da chave e contabiliza vértices e triângulos enviados."""
+        glCallList(self.obter(chave))
+        estatisticas.desenho(vertices_da_chave(chave), triangulos_da_chave(chave))
+
+    def invalidar(self, chave=None):
+        """
+        Descarta uma malha específica ou, sem argumentos, todas.
+        Deve ser chamado se o contexto OpenGL for recriado.
+        """
+        if chave is not None:
+            lista = self._listas.pop(chave, None)
+            if lista is not None:
+                glDeleteLists(lista, 1)
+            return
+
+        for lista in self._listas.values():
+            glDeleteLists(lista, 1)
+        self._listas.clear()
+
+    def _construir(self, chave):
+        """Gera a tesselação GLU da chave e a grava em uma display list."""
+        tipo = chave[0]
+
+        quad = gluNewQuadric()
+        lista = glGenLists(1)
+        glNewList(lista, GL_COMPILE)
+
+        if tipo == 'esfera':
+            _, slices, stacks, orientacao, texcoords = chave
+            gluQuadricOrientation(quad, orientacao)
+            gluQuadricTexture(quad, GL_TRUE if texcoords else GL_FALSE)
+            gluSphere(quad, 1.0, slices, stacks)
+        elif tipo == 'disco':
+            _, raio_interno, slices, loops, texcoords = chave
+            gluQuadricTexture(quad, GL_TRUE if texcoords else GL_FALSE)
+            gluDisk(quad, raio_interno, 1.0, slices, loops)
+        else:
+            glEndList()
+            glDeleteLists(lista, 1)
+            gluDeleteQuadric(quad)
+            raise ValueError(f"Tipo de malha desconhecido: {tipo}")
+
+        glEndList()
+        gluDeleteQuadric(quad)
+        return lista
+
+# Instância compartilhada usada pelas funções de `primitivas.py`
+cache_malhas = CacheMalhas()
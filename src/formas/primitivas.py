@@ -8,34 +8,32 @@ try:
 except ImportError:
     pass # GLUT serve aqui apenas para compatibilidade se necessário, mas usamos GLU para esferas.
 
+from src.formas.malhas import cache_malhas
+from src.formas.estatisticas import estatisticas
+from src.formas.estado_gl import estado_gl
+
 def desenhar_esfera(raio, textura_id=None, slices=50, stacks=50):
     """
     Renderiza uma esfera sólida ou texturizada.
+    A malha unitária vem do cache (`malhas.py`) e é escalada para o raio pedido.
+    O estado de textura fica como foi deixado: cada primitiva declara o que
+    precisa e o `estado_gl` pula o que já estiver certo.
     """
-    # Cria um novo objeto quádrico (estrutura para desenhar formas como esferas, cilindros)
-    quad = gluNewQuadric()
-    
     if textura_id:
-        # Habilita aplicação de textura no quádrico
-        gluQuadricTexture(quad, GL_TRUE)
         # Habilita o estado de textura 2D do OpenGL
-        glEnable(GL_TEXTURE_2D)
+        estado_gl.habilitar(GL_TEXTURE_2D)
         # Vincula a textura específica que queremos usar
-        glBindTexture(GL_TEXTURE_2D, textura_id)
+        estado_gl.vincular_textura(textura_id)
     else:
         # Se não houver textura, desabilita para garantir que não aplique uma textura residual
-        glDisable(GL_TEXTURE_2D)
+        estado_gl.desabilitar(GL_TEXTURE_2D)
         
-    # Desenha a esfera com o raio e detalhamento especificados
-    # A esfera é desenhada centrada na origem atual (0,0,0)
-    gluSphere(quad, raio, slices, stacks)
-    
-    # Libera a memória do objeto quádrico
-    gluDeleteQuadric(quad)
-    
-    if textura_id:
-        # Limpa o estado de texturização após o desenho
-        glDisable(GL_TEXTURE_2D)
+    # Desenha a esfera unitária do cache (construída na primeira vez com o detalhamento
+    # pedido), centrada na origem atual (0,0,0) e escalada para o raio
+    glPushMatrix()
+    glScalef(raio, raio, raio)
+    cache_malhas.desenhar(('esfera', slices, stacks, GLU_OUTSIDE, bool(textura_id)))
+    glPopMatrix()
 
 def desenhar_anel(raio_interno, raio_externo, textura_id=None, slices=50, loops=1):
     """
@@ -46,14 +44,15 @@ def desenhar_anel(raio_interno, raio_externo, textura_id=None, slices=50, loops=
     - raio_externo: Raio total do disco.
     - textura_id: ID da textura (opcional).
     """
-    quad = gluNewQuadric()
-    
     if textura_id:
-        gluQuadricTexture(quad, GL_TRUE)
-        glEnable(GL_TEXTURE_2D)
-        glBindTexture(GL_TEXTURE_2D, textura_id)
+        estado_gl.habilitar(GL_TEXTURE_2D)
+        estado_gl.vincular_textura(textura_id)
     else:
-        glDisable(GL_TEXTURE_2D)
+        estado_gl.desabilitar(GL_TEXTURE_2D)
+    
+    # O disco unitário é identificado pela proporção entre os raios;
+    # o raio externo vira escala na hora do desenho.
+    proporcao = round(raio_interno / raio_externo, 4) if raio_externo else 0.0
         
     # Salva a matriz atual para não afetar transformações futuras
     glPushMatrix()
@@ -62,17 +61,13 @@ def desenhar_anel(raio_interno, raio_externo, textura_id=None, slices=50, loops=
     # O gluDisk desenha nativamente no plano XY (vertical).
     # Esta rotação "deita" o anel para que fique alinhado com o plano orbital (XZ).
     glRotatef(90.0, 1.0, 0.0, 0.0)
+    glScalef(raio_externo, raio_externo, raio_externo)
     
     # Desenha o disco/anel
-    gluDisk(quad, raio_interno, raio_externo, slices, loops)
+    cache_malhas.desenhar(('disco', proporcao, slices, loops, bool(textura_id)))
     
     # Restaura a matriz
     glPopMatrix()
-    
-    gluDeleteQuadric(quad)
-
-    if textura_id:
-        glDisable(GL_TEXTURE_2D)
 
 def desenhar_fundo_quad(textura_id):
     """
@@ -99,16 +94,17 @@ def desenhar_fundo_quad(textura_id):
     glLoadIdentity()     # Reseta para origem
     
     # 3. Preparar estados do OpenGL para desenho 2D sem iluminação
-    glDisable(GL_DEPTH_TEST) # Desliga teste de profundidade (fundo fica sempre atrás)
-    glDisable(GL_LIGHTING)   # Desliga luzes (fundo tem emissão própria/é uma imagem)
-    glEnable(GL_TEXTURE_2D)  # Liga textura
-    glBindTexture(GL_TEXTURE_2D, textura_id)
+    estado_gl.empilhar()
+    estado_gl.desabilitar(GL_DEPTH_TEST) # Desliga teste de profundidade (fundo fica sempre atrás)
+    estado_gl.desabilitar(GL_LIGHTING)   # Desliga luzes (fundo tem emissão própria/é uma imagem)
+    estado_gl.habilitar(GL_TEXTURE_2D)   # Liga textura
+    estado_gl.vincular_textura(textura_id)
     
     # Garante que a textura seja desenhada com suas cores originais
     # GL_REPLACE ignora a cor do vértice e usa apenas a cor da textura
-    glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_REPLACE)
+    estado_gl.modo_textura(GL_REPLACE)
     
-    glColor3f(1.0, 1.0, 1.0) # Cor base branca (necessária para alguns modos de env)
+    estado_gl.cor(1.0, 1.0, 1.0)  # Cor base branca (necessária para alguns modos de env)
     
     # 4. Desenhar o Quadrado cobrindo a tela (0,0 a 1,1)
     glBegin(GL_QUADS)
@@ -118,13 +114,10 @@ def desenhar_fundo_quad(textura_id):
     glTexCoord2f(1.0, 1.0); glVertex2f(1.0, 1.0) # Canto superior direito
     glTexCoord2f(0.0, 1.0); glVertex2f(0.0, 1.0) # Canto superior esquerdo
     glEnd()
+    estatisticas.desenho(4, 2)
     
-    # Restaura o modo de textura padrão (modulate) para não afetar outros objetos 3D
-    glTexEnvi(GL_TEXTURE_ENV, GL_TEXTURE_ENV_MODE, GL_MODULATE)
-    
-    # 5. Restaurar estados anteriores
-    glEnable(GL_LIGHTING)    # Religa luz
-    glEnable(GL_DEPTH_TEST)  # Religa profundidade
+    # 5. Restaurar estados anteriores (modo de textura, luz e profundidade)
+    estado_gl.desempilhar()
     
     glPopMatrix()            # Restaura ModelView
     glMatrixMode(GL_PROJECTION)
@@ -135,22 +128,15 @@ def desenhar_esfera_interna(raio, textura_id=None, slices=50, stacks=50):
     """
     Renderiza uma esfera visível por dentro (SkyDome).
     """
-    quad = gluNewQuadric()
-    
-    # Inverte normais para apontar para dentro (iluminação correta se houvesse)
-    # E faz o mapeamento de textura ser visível por dentro
-    gluQuadricOrientation(quad, GLU_INSIDE)
-    
     if textura_id:
-        gluQuadricTexture(quad, GL_TRUE)
-        glEnable(GL_TEXTURE_2D)
-        glBindTexture(GL_TEXTURE_2D, textura_id)
+        estado_gl.habilitar(GL_TEXTURE_2D)
+        estado_gl.vincular_textura(textura_id)
     else:
-        glDisable(GL_TEXTURE_2D)
-        
-    gluSphere(quad, raio, slices, stacks)
-    
-    gluDeleteQuadric(quad)
+        estado_gl.desabilitar(GL_TEXTURE_2D)
     
-    if textura_id:
-        glDisable(GL_TEXTURE_2D)
+    # GLU_INSIDE inverte normais para apontar para dentro (iluminação correta se houvesse)
+    # e faz o mapeamento de textura ser visível por dentro
+    glPushMatrix()
+    glScalef(raio, raio, raio)
+    cache_malhas.desenhar(('esfera', slices, stacks, GLU_INSIDE, bool(textura_id)))
+    glPopMatrix()
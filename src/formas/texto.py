@@ -0,0 +1,287 @@
+# src/formas/texto.py
+# Texto via atlas de glifos.
+# Cada (fonte, tamanho, negrito) tem uma textura onde cada caractere é
+# rasterizado uma única vez; qualquer string vira uma lista de quads
+# texturizados e todas as strings acumuladas saem em uma só chamada de desenho.
+
+import numpy as np
+import pygame
+from OpenGL.GL import *
+
+from src.formas.estatisticas import estatisticas
+from src.formas.estado_gl import estado_gl
+
+# Dimensões iniciais do atlas (a altura dobra se faltar espaço)
+LARGURA_ATLAS = 512
+ALTURA_ATLAS = 256
+
+# Caracteres rasterizados na criação (ASCII + Latin-1 cobre o português);
+# os demais entram no atlas na primeira vez em que aparecem
+CARACTERES_INICIAIS = "".join(chr(c) for c in range(32, 127)) + "".join(chr(c) for c in range(160, 256))
+
+# Espaço entre glifos no atlas (evita vazamento com filtro linear)
+MARGEM = 1
+
+_fontes = {}
+_atlas = {}
+
+def obter_fonte(nome=None, tamanho=16, negrito=False):
+    """Fonte do Pygame em cache (`nome=None` usa a fonte padrão do Pygame)."""
+    chave = (nome, int(tamanho), bool(negrito))
+    fonte = _fontes.get(chave)
+    if fonte is None:
+        if not pygame.font.get_init():
+            pygame.font.init()
+        if nome is None:
+            fonte = pygame.font.Font(None, int(tamanho))
+            fonte.set_bold(bool(negrito))
+        else:
+            fonte = pygame.font.SysFont(nome, int(tamanho), bold=bool(negrito))
+        _fontes[chave] = fonte
+    return fonte
+
+def obter_atlas(nome=None, tamanho=16, negrito=False):
+    """Atlas compartilhado de uma fonte (criado na primeira chamada; exige contexto OpenGL)."""
+    chave = (nome, int(tamanho), bool(negrito))
+    atlas = _atlas.get(chave)
+    if atlas is None:
+        atlas = AtlasGlifos(nome, tamanho, negrito)
+        _atlas[chave] = atlas
+    return atlas
+
+class AtlasGlifos:
+    """
+    Textura GL_ALPHA com os glifos de uma fonte, empacotados em prateleiras.
+
+    `adicionar` enfileira strings (e retângulos sólidos) em coordenadas de
+    tela; `desenhar` envia tudo com um único glDrawArrays. A cor vem dos
+    vértices (GL_MODULATE), então cada string pode ter a sua.
+    """
+    def __init__(self, nome=None, tamanho=16, negrito=False):
+        self.fonte = obter_fonte(nome, tamanho, negrito)
+        self.altura_linha = self.fonte.get_linesize()
+        self._altura_glifo = self.fonte.get_height()
+
+        # Pixels do atlas na CPU (linha 0 = topo), reenviados só se o atlas crescer
+        self._pixels = np.zeros((ALTURA_ATLAS, LARGURA_ATLAS), dtype=np.uint8)
+        self._textura = None
+
+        # Empacotamento em prateleiras: posição livre na prateleira atual
+        self._x = MARGEM
+        self._y = MARGEM
+
+        # Glifos: código -> índice (tabela direta para o plano básico do Unicode)
+        self._indices = np.full(0x10000, -1, dtype=np.int32)
+        self._retangulos = []             # (x, y, largura) em pixels de cada glifo
+        self._larguras = np.zeros(0, dtype=np.float32)
+        self._uvs = np.zeros((0, 4), dtype=np.float32)   # u0, linha do topo, u1, linha da base
+
+        # Texel branco para retângulos sólidos (fundo de painéis, bordas)
+        self._pixels[0, 0] = 255
+
+        # Quads pendentes até o próximo `desenhar`
+        self._lote_posicoes = []
+        self._lote_uvs = []
+        self._lote_cores = []
+
+        self._criar_textura()
+        self._incluir(CARACTERES_INICIAIS)
+
+    # ---------------- uso ----------------
+
+    def medir(self, texto):
+        """(largura, altura) em pixels de uma linha de texto."""
+        indices = self._indices_de(texto)
+        return float(self._larguras[indices].sum()), float(self._altura_glifo)
+
+    def adicionar(self, texto, x, y, cor=(1.0, 1.0, 1.0, 1.0), escala=(1.0, 1.0)):
+        """
+        Enfileira texto com o canto inferior esquerdo da primeira linha em (x, y);
+        cada '\n' desce uma linha. `escala` converte pixels do glifo para as
+        unidades da projeção atual (1 com gluOrtho2D em pixels; 2/largura_tela
+        com glOrtho -1..1).
+        """
+        if not texto:
+            return
+        codigos = self._codigos(texto)
+        quebras = codigos == 10
+        indices = self._indices_de_codigos(np.where(quebras, 32, codigos))
+        sx, sy = escala
+
+        # Posição x de cada glifo: soma das larguras anteriores, reiniciada a cada linha
+        larguras = np.where(quebras, 0.0, self._larguras[indices]) * sx
+        acumulado = np.cumsum(larguras)
+        linha = np.cumsum(quebras) - quebras
+        inicio_linha = np.concatenate(([0.0], acumulado[quebras]))[linha]
+
+        visiveis = ~quebras
+        x0 = (x + acumulado - larguras - inicio_linha)[visiveis]
+        x1 = x0 + larguras[visiveis]
+        y0 = (y - linha * self.altura_linha * sy)[visiveis]
+        y1 = y0 + self._altura_glifo * sy
+
+        self._enfileirar(x0, y0, x1, y1, self._uvs[indices[visiveis]], cor)
+
+    def adicionar_retangulo(self, x, y, largura, altura, cor):
+        """Enfileira um retângulo sólido (usa o texel branco do atlas)."""
+        uv = np.array([[0.5 / LARGURA_ATLAS, 0.5, 0.5 / LARGURA_ATLAS, 0.5]], dtype=np.float32)
+        self._enfileirar(np.array([x]), np.array([y]), np.array([x + largura]), np.array([y + altura]), uv, cor)
+
+    def desenhar(self):
+        """Desenha tudo o que foi enfileirado em uma única chamada e esvazia o lote."""
+        if not self._lote_posicoes:
+            return
+        posicoes = np.concatenate(self._lote_posicoes)
+        uvs = np.concatenate(self._lote_uvs)
+        # v fica em linhas do atlas até aqui (o atlas pode ter crescido após `adicionar`)
+        uvs[:, 1] /= self._pixels.shape[0]
+        cores = np.concatenate(self._lote_cores)
+        self._lote_posicoes.clear()
+        self._lote_uvs.clear()
+        self._lote_cores.clear()
+
+        estado_gl.empilhar()
+        estado_gl.desabilitar(GL_LIGHTING)
+        estado_gl.desabilitar(GL_DEPTH_TEST)
+        estado_gl.habilitar(GL_TEXTURE_2D)
+        estado_gl.habilitar(GL_BLEND)
+        estado_gl.funcao_blend(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        estado_gl.modo_textura(GL_MODULATE)
+        estado_gl.vincular_textura(self._textura)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, 0, posicoes)
+        glTexCoordPointer(2, GL_FLOAT, 0, uvs)
+        glColorPointer(4, GL_FLOAT, 0, cores)
+        glDrawArrays(GL_QUADS, 0, len(posicoes))
+        estatisticas.desenho(len(posicoes), len(posicoes) // 2)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+
+        estado_gl.cor_indefinida()
+        estado_gl.desempilhar()
+
+    def liberar(self):
+        if self._textura is not None:
+            glDeleteTextures([self._textura])
+            estado_gl.textura_apagada(self._textura)
+            self._textura = None
+
+    # ---------------- privados ----------------
+
+    def _enfileirar(self, x0, y0, x1, y1, uv, cor):
+        """Monta os 4 vértices (anti-horário, a partir do inferior esquerdo) de cada quad."""
+        n = len(x0)
+        posicoes = np.empty((n, 4, 2), dtype=np.float32)
+        posicoes[:, 0] = np.column_stack([x0, y0])
+        posicoes[:, 1] = np.column_stack([x1, y0])
+        posicoes[:, 2] = np.column_stack([x1, y1])
+        posicoes[:, 3] = np.column_stack([x0, y1])
+
+        uvs = np.empty((n, 4, 2), dtype=np.float32)
+        uvs[:, 0] = uv[:, [0, 3]]
+        uvs[:, 1] = uv[:, [2, 3]]
+        uvs[:, 2] = uv[:, [2, 1]]
+        uvs[:, 3] = uv[:, [0, 1]]
+
+        self._lote_posicoes.append(posicoes.reshape(-1, 2))
+        self._lote_uvs.append(uvs.reshape(-1, 2))
+        self._lote_cores.append(np.broadcast_to(np.asarray(cor, dtype=np.float32), (n * 4, 4)))
+
+    @staticmethod
+    def _codigos(texto):
+        """Códigos Unicode do texto; fora do plano básico viram '?'."""
+        codigos = np.frombuffer(texto.encode("utf-32-le"), dtype=np.uint32)
+        return np.where(codigos < 0x10000, codigos, ord("?"))
+
+    def _indices_de(self, texto):
+        return self._indices_de_codigos(self._codigos(texto))
+
+    def _indices_de_codigos(self, codigos):
+        """Índices dos glifos de cada código (rasteriza os que ainda não existem)."""
+        indices = self._indices[codigos]
+        if (indices < 0).any():
+            self._incluir({chr(c) for c in codigos[indices < 0]})
+            indices = self._indices[codigos]
+        return indices
+
+    def _incluir(self, caracteres):
+        """Rasteriza caracteres novos e os copia para o atlas."""
+        novos = []
+        for caractere in caracteres:
+            if self._indices[ord(caractere)] >= 0:
+                continue
+            try:
+                superficie = self.fonte.render(caractere, True, (255, 255, 255))
+                largura, altura = superficie.get_size()
+                alpha = np.frombuffer(pygame.image.tostring(superficie, "RGBA"), dtype=np.uint8)
+                alpha = alpha.reshape(altura, largura, 4)[:, :, 3]
+            except pygame.error:
+                # Caracteres sem largura (ex.: hífen condicional) viram glifos vazios
+                largura, altura = 0, self._altura_glifo
+                alpha = np.zeros((altura, 0), dtype=np.uint8)
+
+            # Todos os glifos ocupam a altura da fonte (alguns acentos passam 1 linha)
+            altura = self._altura_glifo
+            alpha = alpha[:altura]
+
+            x, y = self._reservar(largura)
+            self._pixels[y:y + alpha.shape[0], x:x + largura] = alpha
+            self._indices[ord(caractere)] = len(self._retangulos)
+            self._retangulos.append((x, y, largura))
+            novos.append((x, y, largura, altura))
+
+        if not novos:
+            return
+        if self._pixels.shape[0] != self._altura_textura:
+            # O atlas cresceu: recria a textura inteira
+            self._criar_textura()
+        else:
+            estado_gl.vincular_textura(self._textura)
+            glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+            for x, y, largura, altura in novos:
+                glTexSubImage2D(GL_TEXTURE_2D, 0, x, y, largura, altura, GL_ALPHA, GL_UNSIGNED_BYTE,
+                                np.ascontiguousarray(self._pixels[y:y + altura, x:x + largura]))
+        self._atualizar_tabelas()
+
+    def _reservar(self, largura):
+        """Posição livre para um glifo (nova prateleira ou atlas maior se necessário)."""
+        if self._x + largura + MARGEM > LARGURA_ATLAS:
+            self._x = MARGEM
+            self._y += self._altura_glifo + MARGEM
+        if self._y + self._altura_glifo + MARGEM > self._pixels.shape[0]:
+            maior = np.zeros((self._pixels.shape[0] * 2, LARGURA_ATLAS), dtype=np.uint8)
+            maior[:self._pixels.shape[0]] = self._pixels
+            self._pixels = maior
+        x, y = self._x, self._y
+        self._x += largura + MARGEM
+        return x, y
+
+    def _atualizar_tabelas(self):
+        """Larguras e coordenadas de textura de todos os glifos (u normalizado, v em linhas)."""
+        retangulos = np.array(self._retangulos, dtype=np.float32).reshape(-1, 3)
+        x, y, largura = retangulos[:, 0], retangulos[:, 1], retangulos[:, 2]
+        self._larguras = largura
+        self._uvs = np.column_stack([
+            x / LARGURA_ATLAS,
+            y,
+            (x + largura) / LARGURA_ATLAS,
+            y + self._altura_glifo,
+        ]).astype(np.float32)
+
+    def _criar_textura(self):
+        """(Re)cria a textura com o conteúdo atual de `_pixels`."""
+        if self._textura is None:
+            self._textura = glGenTextures(1)
+        altura, largura = self._pixels.shape
+        estado_gl.vincular_textura(self._textura)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
+        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_ALPHA, largura, altura, 0, GL_ALPHA, GL_UNSIGNED_BYTE, self._pixels)
+        self._altura_textura = altura
@@ -1,14 +1,15 @@
 # src/widget/botao.py
 import pygame
-from OpenGL.GL import *
 from src.formas.retangulo import Retangulo
+from src.formas.lote_ui import LoteUI
+from src.formas.texto import obter_atlas
 
 class BotaoRetangulo:
     """
     Botão em coordenadas de mundo (glOrtho -1..1).
     - Fundo (fill) com Retangulo (RGBA)
     - Borda (RGBA)
-    - Rótulo = texto do botão (pygame.font → textura OpenGL)
+    - Rótulo = texto do botão (atlas de glifos compartilhado por fonte/tamanho)
       pos_rotulo: "centro" (dentro) ou "acima"
     """
 
@@ -35,8 +36,7 @@ class BotaoRetangulo:
         self.tamanho_rotulo  = int(tamanho_rotulo)
         self.pos_rotulo      = pos_rotulo
         self.margem_rotulo   = float(margem_rotulo)
-        # pygame usa 0..255 → convertemos de 0..1
-        self._rotulo_rgba8   = tuple(int(max(0, min(1, c)) * 255) for c in cor_rotulo_rgba)
+        self.cor_rotulo_rgba = tuple(max(0.0, min(1.0, c)) for c in cor_rotulo_rgba)
 
         # cores
         self.cor_normal_rgba = tuple(cor_normal_rgba)
@@ -55,9 +55,8 @@ class BotaoRetangulo:
         # forma de fundo
         self._retangulo = Retangulo(self.cx, self.cy, self.largura, self.altura, *self.cor_normal_rgba)
 
-        # cache do rótulo (textura OpenGL)
-        self._chave_rotulo   = None              # (texto, tamanho, rgba8)
-        self._tex_rotulo_id  = None
+        # tamanho do rótulo em pixels (medido no atlas quando o texto muda)
+        self._chave_rotulo   = None              # (texto, tamanho)
         self._rotulo_w_px    = 0
         self._rotulo_h_px    = 0
 
@@ -88,19 +87,32 @@ class BotaoRetangulo:
         return clicou
 
     def desenhar(self, largura_px: int, altura_px: int):
-        """Desenha fundo, borda e rótulo."""
+        """
+        Desenha fundo, borda e rótulo.
+        Para vários botões, prefira `enfileirar` todos em um `LoteUI` e desenhar uma vez.
+        """
+        lote = LoteUI()
+        self.enfileirar(lote, largura_px, altura_px)
+        lote.desenhar()
+
+    def enfileirar(self, lote: LoteUI, largura_px: int, altura_px: int):
+        """Acrescenta fundo, borda e rótulo ao lote (sem chamadas OpenGL)."""
         # 1) fundo (muda cor com hover)
         cor = self.cor_sobre_rgba if self._sobre else self.cor_normal_rgba
         self._retangulo.r, self._retangulo.g, self._retangulo.b, self._retangulo.a = cor
-        self._retangulo.desenhar()
+        self._retangulo.enfileirar(lote)
 
         # 2) borda
-        self._desenhar_borda()
+        lote.borda(self.cx, self.cy, self.largura, self.altura, self.cor_borda_rgba, self.largura_borda_px)
 
         # 3) rótulo (se existir)
         if self.rotulo:
-            self._garantir_textura_rotulo()
-            self._desenhar_rotulo(largura_px, altura_px)
+            self._medir_rotulo()
+            if self._rotulo_w_px and self._rotulo_h_px:
+                cx, cy, w, h = self._centro_do_rotulo(largura_px, altura_px)
+                escala = (2.0 / max(1, largura_px), 2.0 / max(1, altura_px))   # px → mundo
+                lote.texto(obter_atlas(None, self.tamanho_rotulo), self.rotulo,
+                           cx - w * 0.5, cy - h * 0.5, self.cor_rotulo_rgba, escala)
 
     # ---------------- privados ----------------
 
@@ -116,56 +128,13 @@ class BotaoRetangulo:
         meia_l, meia_a = self.largura * 0.5, self.altura * 0.5
         return (self.cx - meia_l <= xw <= self.cx + meia_l) and (self.cy - meia_a <= yw <= self.cy + meia_a)
 
-    def _desenhar_borda(self):
-        """Desenha a linha da borda do botão."""
-        meia_l, meia_a = self.largura * 0.5, self.altura * 0.5
-        x0, y0 = self.cx - meia_l, self.cy - meia_a
-        x1, y1 = self.cx + meia_l, self.cy + meia_a
-
-        precisa_blend = self.cor_borda_rgba[3] < 0.999
-        blend_antes   = glIsEnabled(GL_BLEND)
-        if precisa_blend and not blend_antes:
-            glEnable(GL_BLEND)
-            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-
-        glLineWidth(self.largura_borda_px)
-        glColor4f(*self.cor_borda_rgba)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(x0, y0); glVertex2f(x1, y0); glVertex2f(x1, y1); glVertex2f(x0, y1)
-        glEnd()
-
-        if precisa_blend and not blend_antes:
-            glDisable(GL_BLEND)
-
-    def _garantir_textura_rotulo(self):
-        """(Re)gera a textura do rótulo se algo mudou."""
-        chave = (self.rotulo, self.tamanho_rotulo, self._rotulo_rgba8)
-        if chave == self._chave_rotulo and self._tex_rotulo_id:
+    def _medir_rotulo(self):
+        """Mede o rótulo no atlas se o texto ou o tamanho mudou."""
+        chave = (self.rotulo, self.tamanho_rotulo)
+        if chave == self._chave_rotulo:
             return
-
-        pygame.font.init()
-        fonte = pygame.font.Font(None, self.tamanho_rotulo)
-        surf  = fonte.render(self.rotulo or "", True, self._rotulo_rgba8).convert_alpha()
-        w_px, h_px = surf.get_size()
-
-        # flip=True para casar com texcoords padrão (v=0 em baixo, v=1 em cima)
-        dados = pygame.image.tostring(surf, "RGBA", True)
-
-        if not self._tex_rotulo_id:
-            self._tex_rotulo_id = glGenTextures(1)
-
-        glBindTexture(GL_TEXTURE_2D, self._tex_rotulo_id)
-        glPixelStorei(GL_UNPACK_ALIGNMENT, 1)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_CLAMP_TO_EDGE)
-        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_CLAMP_TO_EDGE)
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, w_px, h_px, 0, GL_RGBA, GL_UNSIGNED_BYTE, dados)
-        glBindTexture(GL_TEXTURE_2D, 0)
-
-        self._chave_rotulo  = chave
-        self._rotulo_w_px   = w_px
-        self._rotulo_h_px   = h_px
+        self._rotulo_w_px, self._rotulo_h_px = obter_atlas(None, self.tamanho_rotulo).medir(self.rotulo or "")
+        self._chave_rotulo = chave
 
     def _centro_do_rotulo(self, largura_px: int, altura_px: int):
         """Calcula centro do rótulo e tamanho em 'mundo'."""
@@ -182,35 +151,3 @@ class BotaoRetangulo:
             cy = self.cy
 
         return cx, cy, w, h
-
-    def _desenhar_rotulo(self, largura_px: int, altura_px: int):
-        """Desenha a textura do rótulo (texto)."""
-        if not self._tex_rotulo_id or self._rotulo_w_px == 0 or self._rotulo_h_px == 0:
-            return
-
-        cx, cy, w, h = self._centro_do_rotulo(largura_px, altura_px)
-        x0, x1 = cx - w * 0.5, cx + w * 0.5
-        y0, y1 = cy - h * 0.5, cy + h * 0.5
-
-        depth_antes = glIsEnabled(GL_DEPTH_TEST)
-        if depth_antes:
-            glDisable(GL_DEPTH_TEST)  # evita briga com o fill
-
-        glEnable(GL_TEXTURE_2D)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glBindTexture(GL_TEXTURE_2D, self._tex_rotulo_id)
-        glColor4f(1, 1, 1, 1)
-
-        glBegin(GL_QUADS)
-        glTexCoord2f(0, 0); glVertex2f(x0, y0)
-        glTexCoord2f(1, 0); glVertex2f(x1, y0)
-        glTexCoord2f(1, 1); glVertex2f(x1, y1)
-        glTexCoord2f(0, 1); glVertex2f(x0, y1)
-        glEnd()
-
-        glBindTexture(GL_TEXTURE_2D, 0)
-        glDisable(GL_TEXTURE_2D)
-
-        if depth_antes:
-            glEnable(GL_DEPTH_TEST)